@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Count Value allocations made by a few call-heavy Comp workloads.
+
+Every Value created goes through ``Value.__new__``, so replacing it with a
+counting version shows how many objects each workload allocates.  The cases
+take their data as piped input so nothing is folded at build time.  Shared
+constants (nil, true, false, the empty struct and small integers) are
+created once at import and are not counted again.
+
+Usage:
+    python bench/allocations.py [repeat]
+"""
+
+import sys
+import time
+import comp
+
+
+SOURCE = """
+!import loop comp "loop"
+
+!pure count-up ~struct [$ | loop.reduce initial=0 :($ + 1)]
+
+!pure noop ~nil (nil)
+!pure call-nil ~nil {[nil | noop] [nil | noop] [nil | noop] [nil | noop]}
+
+!func map-case ~struct [$ | loop.map :($ * 2 + 1)]
+!func sum-case ~struct [$ | count-up]
+!func nil-case ~nil [$ | call-nil]
+"""
+
+# Case name and the Python value piped into it
+CASES = [
+    ("map", list(range(50))),
+    ("sum", list(range(50))),
+    ("nil", None),
+]
+
+
+_count = 0
+
+
+def _counting_new(cls, *args, **kwargs):
+    """Stand-in for Value.__new__ that counts every allocation."""
+    global _count
+    _count += 1
+    return object.__new__(cls)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    interp = comp.Interp()
+    module = interp.module_from_text(SOURCE)
+    errors = interp.build_instructions()
+    for mod, exc in errors:
+        raise exc
+
+    global _count
+    comp.Value.__new__ = _counting_new
+    print(f"{'case':8} {'values/call':>12} {'ms/call':>9}")
+    for case, data in CASES:
+        name = f"{case}-case"
+        piped = comp.Value.from_python(data)
+        interp.invoke(module, name, piped=piped)
+        _count = 0
+        start = time.perf_counter()
+        for _ in range(repeat):
+            interp.invoke(module, name, piped=piped)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{case:8} {_count // repeat:>12} {elapsed / repeat:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
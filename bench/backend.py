@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Compare the instruction loop with generated Python block bodies.
+
+Runs the same Comp workloads on an Interp using each block body backend
+and reports the best time per call.  The "python" backend translates each
+block body into a Python function the first time it runs, so the first
+call of each case is made before timing starts; it also checks that both
+backends return the same value.
+
+Usage:
+    python bench/backend.py [repeat]
+"""
+
+import sys
+import time
+import comp
+
+
+SOURCE = """
+!import loop comp "loop"
+
+!pure poly ~num (
+    !my x $
+    [x * x * 3 + x * 2 - 7]
+)
+!pure horner ~num (
+    !my x $
+    !my a [x * 3 + 1]
+    !my b [a * x - 7]
+    !my c [b * x + a]
+    !my d [c * x - b]
+    [d * x + c - a]
+)
+!pure norm ~struct [$.x * $.x + $.y * $.y]
+!pure between ~num ([$ > 10] !and [$ < 40])
+
+!func arith-case ~struct [$ | loop.map :[$ | poly]]
+!func long-case ~struct [$ | loop.map :[$ | horner]]
+!func field-case ~struct [$ | loop.map :[$ | norm]]
+!func where-case ~struct [$ | loop.where :[$ | between]]
+!func reduce-case ~struct [$ | loop.reduce initial=0 :($ + 1)]
+"""
+
+# Case name and the Python value piped into it
+CASES = [
+    ("arith", list(range(200))),
+    ("long", list(range(200))),
+    ("field", [{"x": i, "y": i + 1} for i in range(200)]),
+    ("where", list(range(200))),
+    ("reduce", list(range(200))),
+]
+
+BACKENDS = ["interp", "python"]
+
+
+def _load(backend):
+    interp = comp.Interp()
+    interp.backend = backend
+    module = interp.module_from_text(SOURCE)
+    errors = interp.build_instructions()
+    for mod, exc in errors:
+        raise exc
+    return interp, module
+
+
+def _call_ms(interp, module, name, piped):
+    start = time.perf_counter()
+    interp.invoke(module, name, piped=piped)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    loaded = {backend: _load(backend) for backend in BACKENDS}
+
+    print(f"{'case':8}" + "".join(f"{backend:>10}" for backend in BACKENDS) + f"{'speedup':>10}   (ms/call)")
+    for case, data in CASES:
+        name = f"{case}-case"
+        piped = comp.Value.from_python(data)
+        results = [interp.invoke(module, name, piped=piped) for interp, module in loaded.values()]
+        if results[0] != results[-1]:
+            raise SystemExit(f"{case}: backends disagree: {results[0].format()} != {results[-1].format()}")
+        # Alternate backends so machine noise affects both columns alike
+        best = {}
+        for _ in range(repeat):
+            for backend, (interp, module) in loaded.items():
+                elapsed = _call_ms(interp, module, name, piped)
+                best[backend] = min(best.get(backend, elapsed), elapsed)
+        row = "".join(f"{best[backend]:>10.2f}" for backend in BACKENDS)
+        print(f"{case:8}{row}{best[BACKENDS[0]] / best[BACKENDS[-1]]:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Time nested calls that carry !ctx bindings down the call stack.
+
+Each case recurses to the requested depth.  The outer function binds a
+few context names first, so every frame along the way inherits a context
+that it only reads.  Frame setup cost shows up directly in the time per
+level.
+
+Usage:
+    python bench/call_depth.py [depth ...]
+"""
+
+import sys
+import time
+import comp
+
+
+SOURCE = """
+!import branch comp "branch"
+
+!pure shrink ~num (
+    !param scale ~num = 1
+    ($ - scale)
+)
+
+!func down ~num [$ | branch.if :($ > 0) :[$ | shrink | down] | branch.else :(0)]
+
+!func plain-case ~num [$ | down]
+
+!func ctx-case ~num (
+    !ctx scale 1
+    !ctx label "depth"
+    !ctx limit 1000
+    [$ | down]
+)
+"""
+
+CASES = ["plain", "ctx"]
+
+
+def main():
+    depths = [int(arg) for arg in sys.argv[1:]] or [10, 50, 200]
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100000))
+    interp = comp.Interp()
+    module = interp.module_from_text(SOURCE)
+    errors = interp.build_instructions()
+    for mod, exc in errors:
+        raise exc
+
+    print(f"{'case':8}{'depth':>8}{'ms/call':>10}{'us/level':>10}")
+    for case in CASES:
+        for depth in depths:
+            piped = comp.Value.from_python(depth)
+            interp.invoke(module, f"{case}-case", piped=piped)
+            best = None
+            for _ in range(10):
+                start = time.perf_counter()
+                interp.invoke(module, f"{case}-case", piped=piped)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            print(f"{case:8}{depth:>8}{best * 1000:>10.2f}{best * 1e6 / depth:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Time many small calls made under a dozen !ctx bindings.
+
+Each call has to work out which of its named parameters the context can
+fill before masking its arguments.  The "none" case makes the same calls
+without any context, so the difference between the rows is the cost of
+context injection.
+
+Usage:
+    python bench/context_calls.py [count]
+"""
+
+import sys
+import time
+import comp
+
+
+SOURCE = """
+!import loop comp "loop"
+
+!pure handler ~num (
+    !param host ~text = "localhost"
+    !param port ~num = 80
+    !param secure ~bool = false
+    !param retries ~num = 3
+    ($ + port + retries)
+)
+
+!func none-case ~struct [$ | loop.map :[$ | handler]]
+
+!func ctx-case ~struct (
+    !ctx host "example.com"
+    !ctx port 8080
+    !ctx secure true
+    !ctx retries 5
+    !ctx user "admin"
+    !ctx locale "en"
+    !ctx timeout 30
+    !ctx region "eu"
+    !ctx trace false
+    !ctx depth 4
+    !ctx limit 100
+    !ctx mode "fast"
+    [$ | loop.map :[$ | handler]]
+)
+"""
+
+CASES = ["none", "ctx"]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    interp = comp.Interp()
+    module = interp.module_from_text(SOURCE)
+    errors = interp.build_instructions()
+    for mod, exc in errors:
+        raise exc
+
+    piped = comp.Value.from_python(list(range(count)))
+    print(f"{'case':8}{'calls':>8}{'ms/run':>10}{'us/call':>10}")
+    for case in CASES:
+        interp.invoke(module, f"{case}-case", piped=piped)
+        best = None
+        for _ in range(10):
+            start = time.perf_counter()
+            interp.invoke(module, f"{case}-case", piped=piped)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{case:8}{count:>8}{best * 1000:>10.2f}{best * 1e6 / count:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
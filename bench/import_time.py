@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Time importing comp with ``python -X importtime``.
+
+Each case runs a fresh interpreter that imports comp and touches part of
+it.  Names in the comp namespace load their submodules on first use, so
+the cases show what each kind of use pays for: "import" only imports the
+package, "value" builds a Value, "interp" creates an Interp, and "cli"
+loads the command line module.
+
+"importtime ms" adds up what ``-X importtime`` reports for modules a
+bare interpreter does not load.  Submodules loaded through
+importlib.import_module() are missing from that report, though what
+they import is not, so "wall ms" also times the case in the child.
+"comp modules" counts the comp submodules it loaded.
+
+Usage:
+    python bench/import_time.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+
+
+CASES = [
+    ("import", "import comp"),
+    ("value", "import comp; comp.Value.from_python({'a': 1})"),
+    ("interp", "import comp; comp.Interp()"),
+    ("cli", "import comp.__main__"),
+]
+
+
+def _importtime(code):
+    """Run code in a fresh interpreter.
+
+    Returns:
+        (dict, float, int) {module: (depth, cumulative us)} from
+        -X importtime, seconds the code took and comp modules loaded
+    """
+    timed = ("import sys, time\n"
+             "start = time.perf_counter()\n"
+             f"{code}\n"
+             "print(time.perf_counter() - start,"
+             " sum(1 for name in sys.modules if name.startswith('comp.')))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", timed],
+                            capture_output=True, text=True, env=dict(os.environ))
+    if result.returncode:
+        raise RuntimeError(result.stderr)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules[name.strip()] = (depth, int(cumulative))
+    elapsed, count = result.stdout.split()
+    return modules, float(elapsed), int(count)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    startup = set(_importtime("pass")[0])
+
+    print(f"{'case':8}{'comp modules':>14}{'importtime ms':>15}{'wall ms':>9}")
+    for case, code in CASES:
+        best = wall = None
+        for _ in range(runs):
+            modules, elapsed, count = _importtime(code)
+            total = sum(cumulative for name, (depth, cumulative) in modules.items()
+                        if depth == 0 and name not in startup)
+            best = total if best is None else min(best, total)
+            wall = elapsed if wall is None else min(wall, elapsed)
+        print(f"{case:8}{count:>14}{best / 1000:>15.1f}{wall * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
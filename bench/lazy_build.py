@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Time a full build against a build of only what !main reaches.
+
+The program imports several stdlib modules but its entry point only
+touches a few of their functions.  The "full" row builds every
+definition in every loaded module; the "lazy" row builds the entry
+point, its startup providers and whatever they reference, and leaves the
+rest to be built on first use.  Each build starts from a fresh Interp
+without the persistent cache, after one untimed warm-up that pays for
+grammar compilation.
+
+Usage:
+    python bench/lazy_build.py [runs]
+"""
+
+import sys
+import time
+import comp
+
+
+SOURCE = """
+!import loop comp "loop"
+!import text comp "text"
+!import struct comp "struct"
+!import time comp "time"
+!import fs comp "fs"
+!import uri comp "uri"
+
+!pure shout ~text [$ | text.uppercase]
+
+!func greet ~struct [$ | loop.map :[$ | shout]]
+
+!main console [{"ada" "bob"} | greet]
+"""
+
+CASES = ["full", "lazy"]
+
+
+def _build(case):
+    interp = comp.Interp()
+    module = interp.module_from_text(SOURCE)
+    main = (module, "console") if case == "lazy" else None
+    start = time.perf_counter()
+    errors = interp.build_instructions(main=main)
+    elapsed = time.perf_counter() - start
+    for mod, exc in errors:
+        raise exc
+    return interp, module, elapsed
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    _build("full")
+
+    print(f"{'case':8}{'built':>8}{'deferred':>10}{'build ms':>10}{'run ms':>10}")
+    for case in CASES:
+        best = None
+        for _ in range(runs):
+            interp, module, elapsed = _build(case)
+            best = elapsed if best is None else min(best, elapsed)
+        total = sum(len(mod.all_definitions()) for mod in interp._all_modules()
+                    if mod._definitions_error is None)
+        deferred = interp.timings.get("build.deferred", 0)
+        defn = module.main_entry("console")
+        frame = comp.ExecutionFrame({}, interp=interp, module=module)
+        start = time.perf_counter()
+        frame.invoke_block(defn.value, comp.value_empty)
+        run = time.perf_counter() - start
+        print(f"{case:8}{total - deferred:>8}{deferred:>10}{best * 1000:>10.1f}{run * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Compare the forever-based loop functions against the native loop module.
+
+The older stdlib implementations of iterate, map and reduce were written in
+Comp on top of the ``forever`` builtin.  They re-merged the accumulated
+struct and looked items up by position on every pass, which made each loop
+quadratic in the size of the input.  Those definitions are reproduced here
+so the two versions can be timed side by side at growing sizes.
+
+Usage:
+    python bench/loop_scaling.py [size ...]
+"""
+
+import sys
+import time
+import comp
+
+
+SOURCE = """
+!import loop comp "loop"
+!import s comp "struct"
+
+!pure old-iterate ~struct (
+    !param op ~any
+    !my items $
+    !my acc {}
+    !my len [items | s.length]
+    [{position=0 accum=nil} | forever :(
+        !my pos $.position
+        !on pos < len
+        ~false stop
+        ~true (
+            !my entry [items | item-at pos]
+            !my result [{position=pos item=entry accum=$.accum} | op]
+            !on result
+            ~flow-control result
+            ~(any|nil) (!my acc [{acc {result}} | merge])
+            {position=(pos + 1) accum=result}
+        )
+    )]
+    acc
+)
+
+!pure old-map ~struct (
+    !param transform ~any
+    [$ | old-iterate :[$.item | field-value | transform]]
+)
+
+!pure old-reduce ~struct (
+    !param initial ~any
+    !param fold ~any
+    !my items $
+    !my idx 0
+    [initial | forever :(
+        !on idx >= [items | length]
+        ~true stop
+        ~false [items.#(idx) | fold]
+        !my idx idx + 1
+    )]
+)
+
+!pure old-map-case ~struct [$ | old-map :($ * 2)]
+!pure new-map-case ~struct [$ | loop.map :($ * 2)]
+!pure old-reduce-case ~struct [$ | old-reduce initial=0 :($ + 1)]
+!pure new-reduce-case ~struct [$ | loop.reduce initial=0 :($ + 1)]
+"""
+
+CASES = ["map", "reduce"]
+
+
+def _time_call(interp, module, name, data, repeat=3):
+    """Best wall time in milliseconds for invoking name with data piped in."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        interp.invoke(module, name, piped=data)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [50, 100, 200, 400]
+    interp = comp.Interp()
+    module = interp.module_from_text(SOURCE)
+    errors = interp.build_instructions()
+    for mod, exc in errors:
+        raise exc
+
+    print(f"{'case':8} {'size':>6} {'forever ms':>12} {'native ms':>12} {'speedup':>9}")
+    for case in CASES:
+        for size in sizes:
+            data = comp.Value.from_python(list(range(size)))
+            old = _time_call(interp, module, f"old-{case}-case", data)
+            new = _time_call(interp, module, f"new-{case}-case", data)
+            print(f"{case:8} {size:>6} {old:>12.1f} {new:>12.1f} {old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
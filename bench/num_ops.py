@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Microbenchmarks for the (n, d, dp) number operations.
+
+Times the _num tuple functions and the Value level operators built on
+them, for whole numbers, fractions and decimals, so a slowdown in any of
+the number paths shows up as a change in nanoseconds per operation.
+
+Usage:
+    python bench/num_ops.py [loops]
+"""
+
+import sys
+import timeit
+import comp
+import comp._ops
+
+
+# Operand pairs as (label, left, right) Python values
+OPERANDS = [
+    ("whole", 1234, 56),
+    ("fraction", comp.num_div((1, 1, 0), (3, 1, 0)), comp.num_div((2, 1, 0), (7, 1, 0))),
+    ("decimal", comp.num_from_decimal_str("12.75"), comp.num_from_decimal_str("0.5")),
+]
+
+
+def _cases(left, right):
+    """Build (name, callable) pairs for one pair of number tuples."""
+    lval = comp.Value(left)
+    rval = comp.Value(right)
+    return [
+        ("num_add", lambda: comp.num_add(left, right)),
+        ("num_sub", lambda: comp.num_sub(left, right)),
+        ("num_mul", lambda: comp.num_mul(left, right)),
+        ("num_div", lambda: comp.num_div(left, right)),
+        ("num_floor_int", lambda: comp.num_floor_int(left)),
+        ("num_format", lambda: comp.num_format(left)),
+        ("math +", lambda: comp.math_binary("+", lval, rval)),
+        ("math *", lambda: comp.math_binary("*", lval, rval)),
+        ("compare <", lambda: comp.compare("<", lval, rval)),
+    ]
+
+
+def _as_num(value):
+    return value if isinstance(value, tuple) else comp.num_from_int(value)
+
+
+def main():
+    loops = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    labels = [label for label, _, _ in OPERANDS]
+    rows = {}
+    for label, left, right in OPERANDS:
+        for name, fn in _cases(_as_num(left), _as_num(right)):
+            best = min(timeit.repeat(fn, number=loops, repeat=3))
+            rows.setdefault(name, {})[label] = best / loops * 1e9
+
+    print(f"{'operation':14}" + "".join(f"{label:>11}" for label in labels) + "   (ns/op)")
+    for name, times in rows.items():
+        print(f"{name:14}" + "".join(f"{times[label]:>11.0f}" for label in labels))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Report how often each opcode appears, before and after the peephole pass.
+
+Static counts cover every definition in the stdlib modules imported below,
+including nested block, fallback and branch bodies.  Dynamic counts come
+from running the same workloads as bench/backend.py with a counting
+``on_step``.  The "raw" columns are built with the peephole pass turned
+off, so the most common adjacent pairs there show which sequences are
+worth fusing, and the "peephole" columns show what they became.
+
+Usage:
+    python bench/opcodes.py [top]
+"""
+
+import collections
+import sys
+import comp
+
+
+SOURCE = """
+!import loop comp "loop"
+!import struct comp "struct"
+!import text comp "text"
+!import num comp "num"
+!import branch comp "branch"
+!import limit comp "limit"
+
+!pure poly ~num (
+    !my x $
+    [x * x * 3 + x * 2 - 7]
+)
+!pure norm ~struct [$.x * $.x + $.y * $.y]
+!pure between ~num ([$ > 10] !and [$ < 40])
+
+!func arith-case ~struct [$ | loop.map :[$ | poly]]
+!func field-case ~struct [$ | loop.map :[$ | norm]]
+!func where-case ~struct [$ | loop.where :[$ | between]]
+!func reduce-case ~struct [$ | loop.reduce initial=0 :($ + 1)]
+"""
+
+# Case name and the Python value piped into it
+CASES = [
+    ("arith", list(range(200))),
+    ("field", [{"x": i, "y": i + 1} for i in range(200)]),
+    ("where", list(range(200))),
+    ("reduce", list(range(200))),
+]
+
+
+def _nested(instr):
+    """Instruction lists held inside an instruction."""
+    for attr in ("body_instructions", "handler_instructions", "callable_instructions", "args_instructions"):
+        instructions = getattr(instr, attr, None)
+        if instructions:
+            yield instructions
+    for pattern, result in getattr(instr, "branches", ()):
+        yield pattern
+        yield result
+
+
+def _walk(instructions, ops, pairs):
+    """Count opcodes and adjacent opcode pairs in a list and its children."""
+    prev = None
+    for instr in instructions:
+        name = type(instr).__name__
+        ops[name] += 1
+        if prev is not None:
+            pairs[f"{prev} {name}"] += 1
+        prev = name
+        for child in _nested(instr):
+            _walk(child, ops, pairs)
+
+
+def _static(interp):
+    ops = collections.Counter()
+    pairs = collections.Counter()
+    for mod in interp._all_modules():
+        for defn in mod.definitions().values():
+            if defn.instructions:
+                _walk(defn.instructions, ops, pairs)
+    return ops, pairs
+
+
+def _dynamic(interp, module):
+    ops = collections.Counter()
+    pairs = collections.Counter()
+
+    def on_step(frame, idx, instr, result):
+        name = type(instr).__name__
+        ops[name] += 1
+        if idx:
+            pairs[f"{frame._last_opcode} {name}"] += 1
+        frame._last_opcode = name
+
+    original = comp.ExecutionFrame.on_step
+    comp.ExecutionFrame.on_step = on_step
+    try:
+        for case, data in CASES:
+            interp.invoke(module, f"{case}-case", piped=comp.Value.from_python(data))
+    finally:
+        comp.ExecutionFrame.on_step = original
+    return ops, pairs
+
+
+def _load(peephole):
+    comp._codegen.CodeGenContext.peephole = peephole
+    try:
+        interp = comp.Interp()
+        module = interp.module_from_text(SOURCE)
+        errors = interp.build_instructions()
+        for mod, exc in errors:
+            raise exc
+    finally:
+        comp._codegen.CodeGenContext.peephole = True
+    return interp, module
+
+
+def _report(title, raw, optimized, top):
+    raw_ops, raw_pairs = raw
+    opt_ops, _ = optimized
+    print(f"\n{title}: {sum(raw_ops.values())} raw, {sum(opt_ops.values())} after peephole")
+    print(f"  {'opcode':24}{'raw':>10}{'peephole':>10}")
+    for name, count in (raw_ops + opt_ops).most_common(top):
+        print(f"  {name:24}{raw_ops[name]:>10}{opt_ops[name]:>10}")
+    print(f"  {'raw adjacent pair':34}{'count':>10}")
+    for pair, count in raw_pairs.most_common(top):
+        print(f"  {pair:34}{count:>10}")
+
+
+def main():
+    top = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    # Blocks compiled lazily at runtime read the flag too, so run each
+    # configuration completely before building the next
+    raw_interp, raw_module = _load(False)
+    comp._codegen.CodeGenContext.peephole = False
+    try:
+        raw_dynamic = _dynamic(raw_interp, raw_module)
+    finally:
+        comp._codegen.CodeGenContext.peephole = True
+    interp, module = _load(True)
+    _report("static (stdlib definitions)", _static(raw_interp), _static(interp), top)
+    _report("dynamic (executed instructions)", raw_dynamic, _dynamic(interp, module), top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Time a cold build_namespaces with statement parsing in worker processes.
+
+Generates a project of small modules in a temporary directory, each
+importing the stdlib loop module and defining a batch of functions and
+shapes, plus a main module that imports them all.  Every row builds the
+project from a fresh Interp without the persistent cache: "serial" parses
+in this process, the other rows use a ParsePool with that many workers,
+started from scratch so their startup cost is included.  Lark grammars
+are compiled once up front so every row starts from the same state.
+
+Usage:
+    python bench/parallel_parse.py [modules] [workers ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import comp
+
+
+FUNCS = 40
+
+
+def _module_source(index):
+    lines = ['!import loop comp "loop"', ""]
+    for i in range(FUNCS):
+        lines.append(f"/// Scale and offset values, variant {i}")
+        lines.append(f"!pure f{i} ~struct [$ | loop.map :($ * {i} + {index})]")
+        lines.append(f"!shape s{i} ~{{x ~num = {i} y ~num = {index} label ~text = \"s{i}\"}}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _write_project(directory, count):
+    names = [f"m{i:02d}" for i in range(count)]
+    for index, name in enumerate(names):
+        with open(os.path.join(directory, f"{name}.comp"), "w") as f:
+            f.write(_module_source(index))
+    main = [f'!import {name} comp "{name}"' for name in names]
+    main.append("")
+    main.append(f"!main console [{{1 2 3}} | {names[0]}.f1]")
+    with open(os.path.join(directory, "main.comp"), "w") as f:
+        f.write("\n".join(main))
+
+
+def _build(workers):
+    interp = comp.Interp()
+    pool = None
+    if workers is not None:
+        pool = interp.parse_pool = comp._parallel.ParsePool(workers)
+    start = time.perf_counter()
+    interp.module("main", anchor=os.getcwd())
+    errors = interp.build_namespaces()
+    elapsed = time.perf_counter() - start
+    if pool is not None:
+        pool.close()
+    for mod, exc in errors:
+        raise exc
+    statements = sum(len(mod.statements()) for mod in interp._all_modules()
+                     if mod.source.content)
+    return elapsed, statements
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    workers = [int(arg) for arg in sys.argv[2:]]
+    if not workers:
+        cpus = os.cpu_count() or 1
+        workers = sorted({1, 2, 4, cpus} | ({cpus // 2} if cpus > 4 else set()))
+
+    for rule in set(comp._compiler.START_RULES.values()):
+        comp._parse._parser("comp", rule)
+
+    with tempfile.TemporaryDirectory() as directory:
+        _write_project(directory, count)
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            baseline, statements = _build(None)
+            print(f"{count + 1} modules, {statements} statements, {os.cpu_count()} cpus")
+            print(f"{'workers':10}{'ms':>10}{'speedup':>10}")
+            print(f"{'serial':10}{baseline * 1000:>10.1f}{1.0:>10.2f}")
+            for n in workers:
+                elapsed, _ = _build(n)
+                print(f"{n:<10}{elapsed * 1000:>10.1f}{baseline / elapsed:>10.2f}")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Time pipelines whose stages hold plain values instead of callables.
+
+Most pipelines start with a value (``[$ | f]``, ``[{x=$} | f]``,
+``[5 | f]``), and that first stage just passes the value through.  Each
+case maps a one-stage function over a struct, so the time per item is
+mostly pipeline overhead.
+
+Usage:
+    python bench/pass_through.py [count]
+"""
+
+import sys
+import time
+import comp
+
+
+SOURCE = """
+!import loop comp "loop"
+
+!pure inc ~num ($ + 1)
+!pure get-x ~struct ($.x)
+
+!func local-case ~struct [$ | loop.map :[$ | inc]]
+!func struct-case ~struct [$ | loop.map :[{x=$} | get-x]]
+!func const-case ~struct [$ | loop.map :[5 | inc]]
+!func chain-case ~struct [$ | loop.map :[$ | inc | inc | inc]]
+"""
+
+CASES = ["local", "struct", "const", "chain"]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    interp = comp.Interp()
+    module = interp.module_from_text(SOURCE)
+    errors = interp.build_instructions()
+    for mod, exc in errors:
+        raise exc
+
+    piped = comp.Value.from_python(list(range(count)))
+    print(f"{'case':8}{'items':>8}{'ms/run':>10}{'us/item':>10}")
+    for case in CASES:
+        interp.invoke(module, f"{case}-case", piped=piped)
+        best = None
+        for _ in range(10):
+            start = time.perf_counter()
+            interp.invoke(module, f"{case}-case", piped=piped)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{case:8}{count:>8}{best * 1000:>10.2f}{best * 1e6 / count:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Time Interp.reload() after small edits against a full rebuild.
+
+Generates a chain of modules in a temporary directory.  Each one imports
+the stdlib loop module and the module before it, and defines shapes,
+pure helpers and functions that use the previous module's definitions.
+Every case makes one edit on disk, then times ``reload()`` on the
+long-lived Interp against a fresh Interp building the edited project
+from scratch, which is what a long-lived process had to do before.
+Neither side uses the persistent cache, and both must give the same
+result for the last module.
+
+"insert" adds a line at the top of a module.  Statements are matched by
+position as well as content, so everything below it is parsed again.
+
+Usage:
+    python bench/reload.py [modules]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import comp
+
+
+DEFS = 20
+
+
+def _module_source(index):
+    lines = ['!import loop comp "loop"']
+    if index:
+        lines.append(f'!import prev comp "./m{index - 1:02d}"')
+    lines.append("")
+    for i in range(DEFS):
+        lines.append(f"!shape s{i} ~{{x ~num = {i} y ~num = {index}}}")
+        lines.append(f"!pure f{i} ~struct [$ | loop.map :($ * {i} + {index})]")
+        if index:
+            lines.append(f"!func g{i} ~struct [$ | prev.f{i} | f{i}]")
+            lines.append(f"!func h{i} ~struct [{{}} | prev.s{i}]")
+        else:
+            lines.append(f"!func g{i} ~struct [$ | f{i}]")
+            lines.append(f"!func h{i} ~struct [{{}} | s{i}]")
+        lines.append("")
+    return "\n".join(lines)
+
+
+CASES = [
+    ("body", 0, "($ * 1 + 0)", "($ * 1 + 100)"),
+    ("shape", 0, "~{x ~num = 1 y ~num = 0}", "~{x ~num = 1 y ~num = 0 z ~num = 2}"),
+    ("append", -1, None, "!func extra ~struct [$ | g1]\n"),
+    ("insert", 1, None, "/// Inserted line\n"),
+]
+
+
+def _edit(directory, count, index, old, new):
+    path = os.path.join(directory, f"m{index % count:02d}.comp")
+    with open(path) as f:
+        text = f.read()
+    if old is None:
+        text = text + new if index < 0 else new + text
+    else:
+        text = text.replace(old, new)
+    before = os.stat(path).st_mtime_ns
+    with open(path, "w") as f:
+        f.write(text)
+    # Make sure the etag changes even on coarse filesystem clocks
+    os.utime(path, ns=(before + 1000, before + 1000))
+
+
+def _result(interp, directory, count):
+    module = interp.module(f"./m{count - 1:02d}", anchor=directory)
+    piped = comp.Value.from_python([1, 2, 3])
+    return (interp.invoke(module, "g1", piped=piped).format(),
+            interp.invoke(module, "h1", piped=comp.value_empty).format())
+
+
+def _full_build(directory, count):
+    interp = comp.Interp()
+    interp.module(f"./m{count - 1:02d}", anchor=directory)
+    start = time.perf_counter()
+    errors = interp.build_instructions()
+    elapsed = time.perf_counter() - start
+    for mod, exc in errors:
+        raise exc
+    return interp, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(count):
+            with open(os.path.join(directory, f"m{index:02d}.comp"), "w") as f:
+                f.write(_module_source(index))
+        live, _ = _full_build(directory, count)
+        _full_build(directory, count)
+
+        print(f"{'case':8}{'modules':>9}{'rebuilt':>9}{'reload ms':>11}{'full ms':>10}")
+        for case, index, old, new in CASES:
+            _edit(directory, count, index, old, new)
+            start = time.perf_counter()
+            errors = live.reload()
+            elapsed = time.perf_counter() - start
+            for mod, exc in errors:
+                raise exc
+            fresh, full = _full_build(directory, count)
+            if _result(live, directory, count) != _result(fresh, directory, count):
+                raise AssertionError(f"{case}: reload and full build disagree")
+            print(f"{case:8}{live.timings['reload.modules']:>9}"
+                  f"{live.timings['reload.definitions']:>9}"
+                  f"{elapsed * 1000:>11.1f}{full * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
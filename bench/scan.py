@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Time scanning a large module and reading its statements back.
+
+The source is generated: a doc comment and a small function per entry,
+about three lines each.  "scan" times the scanner alone, "statements"
+times repeated ``Module.statements()`` calls on the scanned module, and
+"definitions" times the full parse of every statement into definitions.
+
+Usage:
+    python bench/scan.py [functions]
+"""
+
+import sys
+import time
+import comp
+
+
+def _source(count):
+    lines = ['!import loop comp "loop"', ""]
+    for i in range(count):
+        lines.append(f"/// Add {i} to each value")
+        lines.append(f"!pure add-{i} ~struct [$ | loop.map :($ + {i})]  // generated")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _best(func, runs=5):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    source = _source(count)
+    comp._scan.scan(source)
+
+    scan_time = _best(lambda: comp._scan.scan(source))
+
+    interp = comp.Interp()
+    module = interp.module_from_text(source)
+    module.scan()
+
+    def statements():
+        for _ in range(10):
+            module.statements()
+    statements_time = _best(statements) / 10
+
+    def definitions():
+        mod = comp.Interp().module_from_text(source)
+        mod.definitions()
+    definitions_time = _best(definitions, runs=1)
+
+    lines = source.count("\n") + 1
+    print(f"{'step':12}{'lines':>8}{'ms':>10}")
+    print(f"{'scan':12}{lines:>8}{scan_time * 1000:>10.2f}")
+    print(f"{'statements':12}{lines:>8}{statements_time * 1000:>10.2f}")
+    print(f"{'definitions':12}{lines:>8}{definitions_time * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Time command line runs through ``comp serve`` against cold starts.
+
+Writes a small program to a temporary directory and runs it as a
+subprocess, the way a user or an editor would.  The "cold" row runs
+``python -m comp --eval`` and builds the stdlib modules it imports from
+scratch.  The "server" row runs ``python -m comp --via-server`` against a
+server started once up front (its startup is reported separately), so
+each run only builds the program itself in a forked child.  Both use the
+persistent cache in a fresh temporary directory, warmed by one untimed
+run each, and both must print the same result.
+
+The client still imports the comp package before it connects, so the
+server row includes that.
+
+Usage:
+    python bench/serve.py [runs]
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+
+SOURCE = """
+!import loop comp "loop"
+!import text comp "text"
+!import struct comp "struct"
+!import time comp "time"
+!import fs comp "fs"
+!import uri comp "uri"
+
+!pure shout ~text [$ | text.uppercase]
+
+!func greet ~struct [$ | loop.map :[$ | shout]]
+
+!main console [{"ada" "bob"} | greet]
+"""
+
+CASES = [
+    ("cold", ["--eval"]),
+    ("server", ["--via-server"]),
+]
+
+
+def _wait_for(path, server):
+    while True:
+        if server.poll() is not None:
+            raise RuntimeError("comp serve exited")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+            return
+        except OSError:
+            time.sleep(0.05)
+        finally:
+            probe.close()
+
+
+def _run(args, source, env):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-m", "comp", *args, source],
+                            env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode:
+        raise RuntimeError(result.stderr)
+    return result.stdout, elapsed
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "app.comp")
+        with open(source, "w") as f:
+            f.write(SOURCE)
+        env = dict(os.environ)
+        env["COMP_CACHE_DIR"] = os.path.join(directory, "cache")
+        env["COMP_SOCKET"] = os.path.join(directory, "comp.sock")
+
+        start = time.perf_counter()
+        server = subprocess.Popen([sys.executable, "-m", "comp", "serve"], env=env,
+                                  stderr=subprocess.DEVNULL)
+        try:
+            _wait_for(env["COMP_SOCKET"], server)
+            print(f"server ready in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+            outputs = set()
+            print(f"{'case':8}{'best ms':>10}{'mean ms':>10}")
+            for case, args in CASES:
+                output, _elapsed = _run(args, source, env)
+                times = []
+                for _ in range(runs):
+                    output, elapsed = _run(args, source, env)
+                    times.append(elapsed)
+                outputs.add(output)
+                print(f"{case:8}{min(times) * 1000:>10.1f}{sum(times) / len(times) * 1000:>10.1f}")
+            if len(outputs) != 1:
+                raise AssertionError(f"cold and server runs disagree: {outputs}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
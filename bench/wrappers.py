@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Time calls to functions that have a runtime wrapper.
+
+Every ``@preserve-unit`` function in num and text runs through its wrapper,
+which receives invoke-data describing the call.  The "plain" and
+"wrapped" cases map the same trivial function without and with a wrapper
+that only invokes it, so their difference is the cost of wrapping.
+
+Usage:
+    python bench/wrappers.py [count]
+"""
+
+import sys
+import time
+import comp
+
+
+SOURCE = """
+!import loop comp "loop"
+!import num comp "num"
+!import text comp "text"
+
+!pure pass ~invoke-data [$ | invoke]
+!pure same ~text ($)
+!pure wrapped-same ~text @pass ($)
+
+!func plain-case ~struct [$ | loop.map :[$ | same]]
+!func wrapped-case ~struct [$ | loop.map :[$ | wrapped-same]]
+!func upper-case ~struct [$ | loop.map :[$ | text.uppercase]]
+!func trim-case ~struct [$ | loop.map :[$ | text.trim]]
+!func floor-case ~struct [$ | loop.map :[$ | num.floor]]
+"""
+
+# Case name and the Python value piped into it
+CASES = [
+    ("plain", lambda count: [f" item{i} " for i in range(count)]),
+    ("wrapped", lambda count: [f" item{i} " for i in range(count)]),
+    ("upper", lambda count: [f" item{i} " for i in range(count)]),
+    ("trim", lambda count: [f" item{i} " for i in range(count)]),
+    ("floor", lambda count: list(range(count))),
+]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    interp = comp.Interp()
+    module = interp.module_from_text(SOURCE)
+    errors = interp.build_instructions()
+    for mod, exc in errors:
+        raise exc
+
+    print(f"{'case':8}{'items':>8}{'ms/run':>10}{'us/item':>10}")
+    for case, make in CASES:
+        piped = comp.Value.from_python(make(count))
+        interp.invoke(module, f"{case}-case", piped=piped)
+        best = None
+        for _ in range(10):
+            start = time.perf_counter()
+            interp.invoke(module, f"{case}-case", piped=piped)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{case:8}{count:>8}{best * 1000:>10.2f}{best * 1e6 / count:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
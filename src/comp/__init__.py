@@ -6,37 +6,158 @@ Interpreted programming language designed to interoperate with Python.
 
 __version__ = "0.8.0"
 
+import _thread
+import importlib
 
-from ._error import *
-from ._num import *
-from ._value import *
-from ._module import *
-from ._internal import *
-from ._tag import *
-from ._shape import *
-from ._block import *
-from ._interp import *
-from ._parse import *
-from ._cop import *
-from ._fold import *
-from ._pure import *
-from ._resolve import *
-from ._codegen import *
-from ._ops import *
-from ._import import *
-from ._scan import *
-from ._morph import *
-from ._describe import *
-from ._instructions import *
-from ._callout import *
-
-from . import _compiler
-from ._cob import *
-from ._py import *
-from . import _unit_conv
-
-# Deferred initialization: shape_failure fields reference Value objects and
-# comp.Shape/Block/etc., which aren't available during _shape.py import.
-_shape._init_shape_failure()
-
-from . import runtime
\ No newline at end of file
+
+# Submodules whose public names make up the comp namespace, in the order
+# they import in, with the names each exports (its __all__).  Nothing is
+# imported with the package; the first lookup of one of these names
+# imports the submodules one at a time, each adding its names, until the
+# name turns up.  Module level code in each only uses names from the ones
+# before it.  _parse is last so lark only loads once something parses.
+_SUBMODULES = {
+    "_error": (
+        "EvalError", "ModuleError", "ParseError", "CodeError",
+        "ModuleNotFoundError",
+    ),
+    "_num": (
+        "num_from_int", "num_from_decimal_str", "num_add", "num_sub", "num_mul",
+        "num_div", "num_neg", "num_format", "num_to_float", "num_is_integer",
+        "num_floor_int", "_make",
+    ),
+    "_value": (
+        "Value", "LazyValue", "Unnamed", "Struct", "struct_item", "text_key",
+        "materialize_handles", "value_empty", "int_value",
+    ),
+    "_pmap": (
+        "PersistentStruct", "struct_assoc", "struct_update",
+        "PERSISTENT_THRESHOLD",
+    ),
+    "_module": ("Module", "Definition", "Ambiguous"),
+    "_internal": (
+        "InternalModule", "InternalCallable", "SystemModule",
+        "get_internal_module",
+    ),
+    "_tag": (
+        "Tag", "RawTag", "TagHierarchy", "tag_nil", "tag_bool", "tag_true",
+        "tag_false", "tag_fail", "tag_fail_value", "tag_fail_field",
+        "tag_fail_math", "tag_fail_grab", "tag_fail_module",
+        "tag_fail_module_missing", "tag_fail_module_syntax",
+        "tag_fail_reference", "tag_fail_reference_undefined",
+        "tag_fail_reference_ambiguous", "tag_fail_invoke", "tag_flow",
+        "tag_flow_skip", "tag_flow_stop", "tag_less", "tag_equal",
+        "tag_greater", "value_nil", "value_true", "value_false",
+        "create_tagdef", "HandleInstance", "grab_handle", "drop_handle",
+        "pull_handle", "push_handle",
+    ),
+    "_shape": (
+        "Shape", "ShapeField", "ShapeUnion", "ShapeCollection", "shape_num",
+        "shape_text", "shape_struct", "shape_any", "shape_block",
+        "shape_handle", "shape_tag", "shape_invokable", "shape_shape",
+        "shape_union", "shape_failure",
+    ),
+    "_block": ("Block", "Callable", "Pipeline", "create_blockdef"),
+    "_interp": ("Interp", "ExecutionFrame", "CompFail"),
+    "_cop": (
+        "create_cop", "cop_tag", "cop_kids", "cop_fields", "cop_rebuild",
+        "cop_unparse", "cop_resolve", "cop_check_structure",
+    ),
+    "_fold": ("coptimize",),
+    "_pure": ("evaluate_pure_definitions", "fold_pure_cop"),
+    "_resolve": ("cop_resolve_names",),
+    "_codegen": ("generate_code_for_definition", "compile_python", "peephole"),
+    "_ops": ("math_binary", "math_unary", "compare", "logic_binary", "logic_unary"),
+    "_import": ("ModuleSource", "anchor_resource"),
+    "_morph": ("MorphResult", "morph", "mask"),
+    "_describe": (
+        "describe_name", "gather_statement_comments", "extract_input_shape",
+        "extract_params", "extract_shape_info", "collect_type_refs",
+        "format_describe_markdown",
+    ),
+    "_instructions": (
+        "Instruction", "Const", "LoadVar", "LoadLocal", "LoadOverload",
+        "StoreLocal", "DeliverDependency", "SelectResult", "SetContext",
+        "DeepSetLocal", "Invoke", "PipeInvoke", "Forward", "BinOp", "UnOp",
+        "CmpOp", "NumBinOp", "AddNum", "SubNum", "MulNum", "DivNum",
+        "BoolBinOp", "AndBool", "OrBool", "NegNum", "NotBool", "CmpNum",
+        "EqNum", "NeNum", "LtNum", "LeNum", "GtNum", "GeNum", "EqTag", "NeTag",
+        "ConstOp", "LoadLocalFields", "GetField", "GetIndex", "GetDynamicIndex",
+        "GetStash", "SetStash", "BuildStruct", "BuildInvokeData",
+        "SetBlockWrapper", "BuildBlock", "BuildShapeWithLimits", "BuildShape",
+        "BuildShapeUnion", "BuildShapeCollection", "CastUnit", "StripUnit",
+        "GrabHandle", "DropHandle", "PullHandle", "PushHandle", "RaiseFail",
+        "MergeWithPiped", "FlattenFields", "Fallback", "PipeFallback",
+        "DispatchOn", "DispatchOnTags",
+    ),
+    "_callout": (
+        "Span", "Location", "Note", "Callout", "Collector", "ERROR", "WARNING",
+        "INFO", "HINT", "PHASE_PARSE", "PHASE_COP", "PHASE_CODEGEN",
+    ),
+    "_parse": ("lark_parse", "lark_to_cop"),
+}
+
+__all__ = [name for names in _SUBMODULES.values() for name in names
+           if not name.startswith("_")]
+__all__.append("runtime")
+
+_exported = {name for names in _SUBMODULES.values() for name in names}
+_loaded = 0
+# Held while submodules load, so a thread never sees a submodule counted
+# as loaded before its names are exported.  Reentrant because loading a
+# submodule looks up names from the ones before it.  From _thread, since
+# importing threading would double the cost of importing the package.
+_lock = _thread.RLock()
+
+
+def _export(module, names):
+    """Copy a submodule's names into the package, like ``import *``."""
+    namespace = globals()
+    for name in names:
+        namespace[name] = getattr(module, name)
+
+
+def _load_next():
+    """Import the next submodule and export its names, with _lock held."""
+    global _loaded
+    name = list(_SUBMODULES)[_loaded]
+    module = importlib.import_module(f"{__name__}.{name}")
+    names = _SUBMODULES[name]
+    if name == "_shape":
+        # shape_failure fields are Values, and building the first Value
+        # looks up names from _shape and later submodules.  It's exported
+        # once its fields are set, so other threads never see it without.
+        _export(module, [n for n in names if n != "shape_failure"])
+        _loaded += 1
+        module._init_shape_failure()
+        _export(module, ["shape_failure"])
+    else:
+        _export(module, names)
+        _loaded += 1
+
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(name)
+    if name in _exported:
+        namespace = globals()
+        with _lock:
+            while name not in namespace and _loaded < len(_SUBMODULES):
+                _load_next()
+        if name in namespace:
+            return namespace[name]
+    # Private submodules (comp._cache) and subpackages (comp.runtime).
+    # ImportError, since comp.ModuleNotFoundError shadows the builtin here.
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ImportError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    with _lock:
+        while _loaded < len(_SUBMODULES):
+            _load_next()
+    return sorted(globals())
@@ -7,7 +7,6 @@ import sys
 import io
 import comp
 import time as _time
-from lark import Token, Tree
 
 # Ensure UTF-8 output on Windows
 if sys.platform == "win32":
@@ -20,6 +19,8 @@ def prettylark(node, indent=0, show_positions=False):
     More readable than Lark's built-in pretty() for the Comp language.
     Shows tree structure with clear indentation and token values.
     """
+    from lark import Token, Tree
+
     prefix = "  " * indent
 
     if isinstance(node, Token):
@@ -103,11 +104,11 @@ def prettymodule(module):
     if statements:
         print("Module Statements:")
         for stmt in statements:
-            operator = stmt.get('operator', '?')
-            name = stmt.get('name', '?')
-            body = stmt.get('body', '')
-            pos = stmt.get('pos', ())
-            content_hash = stmt.get('hash', '')
+            operator = stmt.operator
+            name = stmt.name
+            body = stmt.body
+            pos = stmt.pos
+            content_hash = stmt.hash
 
             # Format position - show full range (start and end)
             pos_str = ""
@@ -139,32 +140,18 @@ def prettymodule(module):
         print()
 
     # Display comment summary
-    scan = module.scan()
-    try:
-        docs_val = scan.field('docs')
-        if docs_val.data:
-            print("Comments:")
-            for item in docs_val.data.values():
-                content = item.field('content').data
-                try:
-                    comment_type = item.field('type').data
-                except (KeyError, AttributeError):
-                    comment_type = "unknown"
-                try:
-                    pos = item.field('pos')
-                    pos_vals = list(pos.data.values())
-                    pos_str = f" @ {pos_vals[0].data}:{pos_vals[1].data}"
-                except (KeyError, AttributeError, IndexError):
-                    pos_str = ""
-                lines = content.split('\n')
-                preview = lines[0][:60]
-                if len(lines) > 1 or len(lines[0]) > 60:
-                    preview += "..."
-                print(f"  [{comment_type}] {preview!r}{pos_str}")
-            print()
-    except (KeyError, AttributeError) as e:
-        print(f"Error reading docs: {e}")
-        pass
+    docs = module.scan().docs
+    if docs:
+        print("Comments:")
+        for doc in docs:
+            comment_type = doc.type or "unknown"
+            pos_str = f" @ {doc.pos[0]}:{doc.pos[1]}" if doc.pos else ""
+            lines = doc.content.split('\n')
+            preview = lines[0][:60]
+            if len(lines) > 1 or len(lines[0]) > 60:
+                preview += "..."
+            print(f"  [{comment_type}] {preview!r}{pos_str}")
+        print()
 
 
 def prettyimports(module, visited=None, prefix=""):
@@ -246,10 +233,10 @@ def prettylark_statements(module, show_positions=False):
     }
 
     for stmt in statements:
-        operator = stmt.get("operator", "?")
-        name = stmt.get("name", "?")
-        body = stmt.get("body", "")
-        pos = stmt.get("pos", ())
+        operator = stmt.operator
+        name = stmt.name
+        body = stmt.body
+        pos = stmt.pos
 
         # Format position
         pos_str = ""
@@ -276,7 +263,13 @@ def prettylark_statements(module, show_positions=False):
 
 
 def format_instruction(idx, instr, indent=0):
-    """Format a single instruction for display using SSA style."""
+    """Format a single instruction for display using SSA style.
+
+    Args:
+        idx: (int) First register the instruction fills
+        instr: (Instruction) Instruction to format
+        indent: (int) Nesting depth
+    """
     ind = "    " * indent
 
     # Use the instruction's format method
@@ -284,8 +277,7 @@ def format_instruction(idx, instr, indent=0):
 
     # If this is a BuildBlock, show nested body instructions
     if hasattr(instr, 'body_instructions') and instr.body_instructions:
-        for i, body_instr in enumerate(instr.body_instructions):
-            result += "\n" + format_instruction(i, body_instr, indent + 1)
+        result += "\n" + format_instructions(instr.body_instructions, indent + 1)
 
     # If this is a DispatchOn, show each branch's pattern and result instructions
     if hasattr(instr, 'branches') and instr.branches:
@@ -294,15 +286,29 @@ def format_instruction(idx, instr, indent=0):
             result += "\n" + branch_ind + f"branch {b}:"
             pat_ind = "    " * (indent + 2)
             result += "\n" + pat_ind + "pattern:"
-            for i, pi in enumerate(pattern_instrs):
-                result += "\n" + format_instruction(i, pi, indent + 3)
+            if pattern_instrs:
+                result += "\n" + format_instructions(pattern_instrs, indent + 3)
             result += "\n" + pat_ind + "result:"
-            for i, ri in enumerate(result_instrs):
-                result += "\n" + format_instruction(i, ri, indent + 3)
+            if result_instrs:
+                result += "\n" + format_instructions(result_instrs, indent + 3)
 
     return result
 
 
+def format_instructions(instructions, indent=0):
+    """Format an instruction list, one instruction per line.
+
+    Superinstructions fill several registers, so the register shown for
+    each instruction is counted from the widths before it.
+    """
+    lines = []
+    reg = 0
+    for instr in instructions:
+        lines.append(format_instruction(reg, instr, indent))
+        reg += instr.width
+    return "\n".join(lines)
+
+
 def _format_code_error(e, label="Build failure"):
     """Format a CodeError with source location context.
 
@@ -406,7 +412,7 @@ def _format_failure_cli(fail_val, source_file=None, source_lines=None, depth=0):
     indent = "  " * depth
 
     # Extract fields
-    nil = comp.Value.from_python(comp.tag_nil)
+    nil = comp.value_nil
     fail_key = comp.Value.from_python("fail")
     msg_key = comp.Value.from_python("message")
     cause_key = comp.Value.from_python("cause")
@@ -494,6 +500,9 @@ def _print_timings(interp, _t_start, _t_load, _t_build, _t_eval):
     print(f"build {(_t_build - _t_load)  * 1000:7.1f} ms  ({n_mods} modules)", file=sys.stderr)
     print(f"  ns.total               {t.get('build.build_namespaces',0)*1000:7.1f} ms", file=sys.stderr)
     print(f"    ns.definitions       {t.get('ns.definitions',0)*1000:7.1f} ms  (parse all stmts → COP)", file=sys.stderr)
+    pool = interp.parse_pool
+    if pool is not None:
+        print(f"      ns.parse_pool      {t.get('ns.parse_pool',0)*1000:7.1f} ms  ({pool.parsed} stmts in {pool.workers} workers)", file=sys.stderr)
     print(f"      lark.grammar_init  {comp._parse._time_grammar_init*1000:7.1f} ms  (lark table compile, once per grammar)", file=sys.stderr)
     print(f"      lark.parse         {comp._parse._time_parse*1000:7.1f} ms  (parser.parse() calls)", file=sys.stderr)
     print(f"    ns.namespace         {t.get('ns.namespace',0)*1000:7.1f} ms  (collate namespaces)", file=sys.stderr)
@@ -503,7 +512,16 @@ def _print_timings(interp, _t_start, _t_load, _t_build, _t_eval):
     print(f"  build.pure_eval        {t.get('build.pure_eval',0)*1000:7.1f} ms", file=sys.stderr)
     print(f"  build.codegen          {t.get('build.codegen',0)*1000:7.1f} ms", file=sys.stderr)
     print(f"  build.execute          {t.get('build.execute',0)*1000:7.1f} ms", file=sys.stderr)
+    if interp.lazy_build:
+        print(f"  build.deferred         {t.get('build.deferred',0):7d} definitions", file=sys.stderr)
+    cache = interp.build_cache
+    if cache is not None:
+        print(f"  cache  {cache.hits} hits  {cache.misses} misses  ({cache.directory})", file=sys.stderr)
     print(f"eval  {(_t_eval  - _t_build) * 1000:7.1f} ms", file=sys.stderr)
+    dispatch = interp.dispatch_cache
+    print(f"  dispatch  {dispatch.hits} hits  {dispatch.misses} misses", file=sys.stderr)
+    if interp.lazy_build:
+        print(f"  build.lazy             {t.get('build.lazy',0)*1000:7.1f} ms  ({t.get('build.lazy_definitions',0)} definitions built on first use)", file=sys.stderr)
     print(f"total {(_t_eval  - _t_start) * 1000:7.1f} ms", file=sys.stderr)
 
 
@@ -534,7 +552,60 @@ def _context_value_to_dict(context_val):
     return result
 
 
-def main():
+def _default_cache_dir():
+    """Location of the persistent build cache for command line runs."""
+    path = os.environ.get("COMP_CACHE_DIR")
+    if path is not None:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "comp")
+
+
+def _default_socket_path():
+    """Location of the socket ``comp serve`` listens on."""
+    path = os.environ.get("COMP_SOCKET")
+    if path is not None:
+        return path
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "comp.sock")
+    return os.path.join(_default_cache_dir(), "server.sock")
+
+
+def _serve_main(argv):
+    """Entry point for ``comp serve``."""
+    parser = argparse.ArgumentParser(
+        prog="comp serve",
+        description="Keep the stdlib built and run programs sent with --via-server")
+    parser.add_argument("--socket", metavar="PATH", default=_default_socket_path(),
+                        help="Unix socket to listen on (default: $COMP_SOCKET or $XDG_RUNTIME_DIR/comp.sock)")
+    parser.add_argument("--cache-dir", metavar="DIR", default=_default_cache_dir(),
+                        help="Directory for cached build artifacts (default: $COMP_CACHE_DIR or ~/.cache/comp)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Build the stdlib from source without reading or writing the cache")
+    args = parser.parse_args(argv)
+
+    cache = None
+    if not args.no_cache and args.cache_dir:
+        cache = comp._cache.BuildCache(args.cache_dir)
+    _t_start = _time.perf_counter()
+    interp, errors = comp._serve.warm_interp(cache)
+    for err_mod, err_exc in errors:
+        msg = err_exc.message if hasattr(err_exc, "message") else str(err_exc)
+        print(f"{err_mod.source.resource}: {msg}", file=sys.stderr)
+    n_mods = len(interp._all_modules())
+    print(f"Built {n_mods} modules in {_time.perf_counter() - _t_start:.2f}s, "
+          f"listening on {args.socket}", file=sys.stderr)
+    try:
+        comp._serve.serve(interp, args.socket, main)
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+
+def main(argv=None, interp=None):
     parser = argparse.ArgumentParser(
         prog="comp",
         description="Comp language command-line interface")
@@ -545,7 +616,7 @@ def main():
     parser.add_argument("--pure", action="store_true", help="Evaluate pure function invokes at compile time")
     parser.add_argument("--raw", action="store_true", help="Show unresolved/unfolded cop (skip resolve and fold passes)")
 
-    modes = parser.add_mutually_exclusive_group(required=True)
+    modes = parser.add_mutually_exclusive_group()
     modes.add_argument("--scan", action="store_true", help="Show scan Lark parse tree")
     modes.add_argument("--lark", action="store_true", help="Show Lark parse tree for each parseable statement")
     modes.add_argument("--cop", action="store_true", help="Report parsed cop structure")
@@ -570,17 +641,43 @@ def main():
                         help="Print phase timings to stderr (load/build/eval)")
     parser.add_argument("--trace-imports", action="store_true",
                         help="Print each module load/cache-hit to stderr as it happens")
-
-    argv = None
-    try:
-        import debugpy
-        if debugpy.is_client_connected():
-            print("Debugger attached.")
-            argv = ['minimal.comp', '--eval', '--main', 'console']
-    except ImportError:
-        pass
+    parser.add_argument("--cache-dir", metavar="DIR", default=_default_cache_dir(),
+                        help="Directory for cached build artifacts (default: $COMP_CACHE_DIR or ~/.cache/comp)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Build everything from source without reading or writing the cache")
+    parser.add_argument("--jobs", metavar="N", type=int,
+                        help="Parse module statements in N worker processes (0 = one per CPU); "
+                             "a single worker parses serially instead")
+    parser.add_argument("--lazy", action="store_true",
+                        help="Build only what the --main entry point reaches; build the rest on first use")
+    parser.add_argument("--via-server", action="store_true",
+                        help="Run on the 'comp serve' process instead (default mode: --eval)")
+    parser.add_argument("--socket", metavar="PATH", default=_default_socket_path(),
+                        help="Socket of the server for --via-server (default: $COMP_SOCKET or $XDG_RUNTIME_DIR/comp.sock)")
+
+    if argv is None:
+        argv = sys.argv[1:]
+        try:
+            import debugpy
+            if debugpy.is_client_connected():
+                print("Debugger attached.")
+                argv = ['minimal.comp', '--eval', '--main', 'console']
+        except ImportError:
+            pass
+    if argv[:1] == ["serve"]:
+        return _serve_main(argv[1:])
 
     args = parser.parse_args(argv)
+    has_mode = any(getattr(args, action.dest) for action in modes._group_actions)
+    if args.via_server:
+        argv = [arg for arg in argv if arg != "--via-server"]
+        if not has_mode:
+            argv.append("--eval")
+        return comp._serve.run_client(args.socket, argv)
+    if not has_mode:
+        parser.error("one of the arguments "
+                     + " ".join(action.option_strings[0] for action in modes._group_actions)
+                     + " is required")
 
     # Map user-friendly entry point names to grammar start rules
     entry_point_map = {
@@ -593,9 +690,17 @@ def main():
         "module": None,  # Use module parsing (default)
     }
 
-    interp = comp.Interp()
+    if interp is None:
+        interp = comp.Interp()
     if getattr(args, "trace_imports", False):
         interp.trace_imports = True
+    if not args.no_cache and args.cache_dir:
+        interp.build_cache = comp._cache.BuildCache(args.cache_dir)
+    if args.jobs is not None:
+        pool = comp._parallel.ParsePool(args.jobs or None)
+        # One worker only adds IPC and decoding to the serial parse
+        if pool.workers > 1:
+            interp.parse_pool = pool
 
     # --text mode: parse source argument as direct text
     if args.text:
@@ -653,8 +758,7 @@ def main():
                 instructions = comp.generate_code_for_definition(cop, namespace=sys_ns)
                 print(f"Source: {comp.cop_unparse(cop)}")
                 print("-" * 40)
-                for i, instr in enumerate(instructions):
-                    print(format_instruction(i, instr))
+                print(format_instructions(instructions))
                 return
             except (comp.ParseError, comp.CodeError) as e:
                 if isinstance(e, comp.CodeError):
@@ -684,7 +788,7 @@ def main():
                         def on_step(self, idx, instr, result):
                             indent = "  " * self.depth
                             result_str = result.format() if result else "(none)"
-                            print(f"{indent}{instr.format(idx)}  ->  {result_str}")
+                            print(f"{indent}{instr.format(len(self.registers) - instr.width)}  ->  {result_str}")
                         def _make_child_frame(self, env, module=None):
                             return TracingFrame(env=env, interp=self.interp,
                                                module=module or self.module, depth=self.depth + 1,
@@ -876,7 +980,10 @@ def main():
     if args.code or args.eval or args.trace or args.list_mains or args.context:
         # Full build pipeline
         try:
-            errors = interp.build_instructions()
+            main = None
+            if args.lazy and (args.eval or args.trace) and mod is not None:
+                main = (mod, args.main)
+            errors = interp.build_instructions(main=main)
             _t_build = _time.perf_counter()
             if errors:
                 err_mod, err_exc = errors[0]
@@ -926,8 +1033,7 @@ def main():
                 print("-" * 40)
 
                 if definition.instructions:
-                    for i, instr in enumerate(definition.instructions):
-                        print(format_instruction(i, instr))
+                    print(format_instructions(definition.instructions))
                 else:
                     print("  (no instructions)")
             return
@@ -1007,7 +1113,7 @@ def main():
                     def on_step(self, idx, instr, result):
                         indent = "  " * self.depth
                         result_str = result.format() if result else "(none)"
-                        print(f"{indent}{instr.format(idx)}  ->  {result_str}")
+                        print(f"{indent}{instr.format(len(self.registers) - instr.width)}  ->  {result_str}")
 
                     def _make_child_frame(self, env, module=None):
                         return TracingFrame(env=env, interp=self.interp, module=module or self.module, depth=self.depth + 1, context=dict(self.context))
@@ -1074,4 +1180,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -30,6 +30,10 @@ class Block:
         dependency_names: (list) Names from signature.depend nodes for env binding
         dependency_shape: (Shape | None) Shape used to validate incoming dependency values
         deliver_specs: (list) Outgoing dependency declarations for the next pipeline stage
+        python_body: (tuple | None) Body compiled by the "python" backend, with
+            the instruction list it was generated from
+        unwrapped: (tuple | None) This block and a Callable Value holding a
+            wrapper-free copy of it, made on the first wrapped call
     """
 
     __slots__ = (
@@ -51,6 +55,8 @@ class Block:
         "dependency_shape",
         "deliver_specs",
         "wrapper",
+        "python_body",
+        "unwrapped",
     )
 
     def __init__(self, qualified):
@@ -72,6 +78,8 @@ class Block:
         self.dependency_shape = None
         self.deliver_specs = []
         self.wrapper = None
+        self.python_body = None
+        self.unwrapped = None
 
     def __repr__(self):
         return f"Block<{self.qualified}>"
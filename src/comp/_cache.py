@@ -0,0 +1,577 @@
+"""Persistent on-disk cache of compiled definition artifacts.
+
+Every run of the interpreter re-parses and re-validates the same stdlib
+statements.  The BuildCache keeps the expensive per-definition results in
+a directory so a warm start can skip them:
+
+- **Parsed COP** — the output of lark_parse + lark_to_cop for a statement.
+  Keyed only by the statement (operator, name, blake2s body hash and
+  position), so it survives edits elsewhere in the same file.
+- **Resolved COP** — the tree after cop_resolve_names + coptimize.
+- **Callouts** — the validator results from cop_callouts.
+
+Resolved trees and callouts depend on the namespaces a module can see, so
+they are only reused when the module's ``ModuleSource.etag``, the etags of
+everything it imports (plus the default and callout modules) and the
+compiler itself are all unchanged.
+
+Each module gets one cbor2 file named by a digest of its location.  COP
+trees are encoded as nested lists; tags and shapes are stored as
+references to the definition that holds them (module location and name)
+and looked up again when decoded.  Anything that cannot be round-tripped that way (callables,
+handles, anonymous shapes) makes the definition uncacheable, and it is
+simply rebuilt every run.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import cbor2
+
+import comp
+
+
+# Bump when the encoded layout changes.
+_FORMAT = 1
+
+# Encoded value kinds.  Text values are stored as bare strings.
+_STRUCT = 0
+_NUM = 1
+_TAG = 2
+_SHAPE = 3
+_RAWTAG = 4
+_UNIT = 5
+
+
+class _Uncacheable(Exception):
+    """Raised while encoding a value that has no stable serialized form."""
+
+
+class _Stale(Exception):
+    """Raised while decoding a reference that no longer resolves."""
+
+
+class CopCodec:
+    """Converts COP Value trees to and from cbor-friendly lists.
+
+    Tags and shapes are written as references to the definition that
+    holds them and looked up again when decoded, so a decoded tree shares
+    the live objects of the reading process.  Trees parsed straight from
+    source only refer to system and internal definitions and round-trip
+    without an interpreter.
+    """
+
+    def __init__(self):
+        self._refs = {}      # id(obj) -> (obj, encoded reference)
+        self._objs = {}      # (module id, name, ordinal) -> Tag | Shape
+
+    def encode(self, cop, interp=None):
+        """Encode a COP tree.
+
+        Args:
+            cop: (Value) COP tree
+            interp: (Interp | None) Interpreter used to find user definitions
+
+        Returns:
+            (list | str | None) Encoded tree, or None if it holds values
+            with no stable serialized form
+        """
+        try:
+            return self._encode_value(cop, interp)
+        except _Uncacheable:
+            return None
+
+    def decode(self, encoded, interp=None):
+        """Rebuild a COP tree from encode().
+
+        Args:
+            encoded: (list | str) Encoded tree
+            interp: (Interp | None) Interpreter used to find user definitions
+
+        Returns:
+            (Value | None) COP tree, or None if a reference no longer resolves
+        """
+        try:
+            return self._decode_value(encoded, interp)
+        except _Stale:
+            return None
+
+    def _encode_value(self, val, interp):
+        """Encode a COP Value tree to cbor-friendly lists and strings."""
+        if val.cop is not None or val.stash is not None or val.handles:
+            raise _Uncacheable(val)
+        data = val.data
+        if type(data) is str:
+            encoded = data
+        elif type(data) is tuple:
+            encoded = [_NUM, data[0], data[1], data[2]]
+        elif isinstance(data, dict):
+            encoded = [_STRUCT]
+            for key, item in data.items():
+                encoded.append(None if isinstance(key, comp.Unnamed) else self._encode_value(key, interp))
+                encoded.append(self._encode_value(item, interp))
+        elif isinstance(data, comp.Tag):
+            encoded = [_TAG, *self._encode_ref(data, interp)]
+        elif isinstance(data, comp.Shape):
+            encoded = [_SHAPE, *self._encode_ref(data, interp)]
+        elif isinstance(data, comp.RawTag):
+            encoded = [_RAWTAG, data.qualified]
+        else:
+            raise _Uncacheable(val)
+        if val.unit is not None:
+            encoded = [_UNIT, *self._encode_ref(val.unit, interp), encoded]
+        return encoded
+
+    def _encode_ref(self, obj, interp):
+        """Encode a tag or shape as (module id, definition name, ordinal).
+
+        The ordinal picks between same-named definitions in one module,
+        such as a tag parent that is also declared by a later statement.
+        Objects that are not the value of any definition are uncacheable.
+        """
+        cached = self._refs.get(id(obj))
+        if cached is not None and cached[0] is obj:
+            if cached[1] is None:
+                raise _Uncacheable(obj)
+            return cached[1]
+        # User shapes carry no module; try the owner first, then everything
+        modules = [obj.module] if obj.module is not None else []
+        modules.append(comp.get_internal_module("system"))
+        if interp is not None:
+            modules.extend(interp._all_modules())
+        ref = None
+        for module in modules:
+            ref = _find_ref(module, obj)
+            if ref is not None:
+                break
+        self._refs[id(obj)] = (obj, ref)
+        if ref is None:
+            raise _Uncacheable(obj)
+        return ref
+
+    def _decode_value(self, encoded, interp):
+        """Rebuild a Value tree produced by _encode_value.
+
+        Decoded trees never hold handles, stash or cop metadata, so Values
+        are assembled directly instead of going through Value.__init__.
+        """
+        if type(encoded) is str:
+            return _value(encoded)
+        kind = encoded[0]
+        if kind == _STRUCT:
+            data = comp.Struct()
+            for i in range(1, len(encoded), 2):
+                key = encoded[i]
+                if key is None:
+                    key = comp.Unnamed()
+                elif type(key) is str:
+                    # Field names repeat endlessly in COP; share one Value each
+                    key = comp.text_key(key)
+                else:
+                    key = self._decode_value(key, interp)
+                data[key] = self._decode_value(encoded[i + 1], interp)
+            return _value(data)
+        if kind == _NUM:
+            return _value((encoded[1], encoded[2], encoded[3]))
+        if kind in (_TAG, _SHAPE):
+            return _value(self._decode_ref(encoded[1], encoded[2], encoded[3], interp))
+        if kind == _RAWTAG:
+            return _value(comp.RawTag(encoded[1]))
+        if kind == _UNIT:
+            unit = self._decode_ref(encoded[1], encoded[2], encoded[3], interp)
+            return self._decode_value(encoded[4], interp).with_unit(unit)
+        raise _Stale(kind)
+
+    def _decode_ref(self, module_id, name, ordinal, interp):
+        """Look up the live tag or shape for an encoded reference."""
+        key = (module_id, name, ordinal)
+        obj = self._objs.get(key)
+        if obj is not None:
+            return obj
+        if module_id == "system":
+            module = comp.get_internal_module("system")
+        elif module_id.startswith("internal:"):
+            module = comp.get_internal_module(module_id[9:])
+        elif interp is not None:
+            module = interp.module_cache.get(module_id)
+        else:
+            module = None
+        # Never trigger a parse from inside decoding
+        if module is None or module._definitions is None:
+            raise _Stale(module_id)
+        for other, defn in _module_pairs(module):
+            if other != name:
+                continue
+            if ordinal:
+                ordinal -= 1
+                continue
+            if defn.value is not None and isinstance(defn.value.data, (comp.Tag, comp.Shape)):
+                obj = defn.value.data
+            break
+        if obj is None:
+            raise _Stale(name)
+        # Live objects of user modules change when a module is reloaded
+        if module_id == "system" or module_id.startswith("internal:"):
+            self._objs[key] = obj
+        return obj
+
+
+class BuildCache(CopCodec):
+    """Directory of cached per-definition build artifacts.
+
+    Assign an instance to ``Interp.build_cache`` before loading modules.
+    Records are read lazily, one file per module, and written back by
+    ``flush()`` which the interpreter calls at the end of each build phase.
+
+    Args:
+        directory: (str) Directory to keep cache files in; created on demand
+
+    Attributes:
+        directory: (str) Cache directory
+        hits: (int) Artifacts served from the cache
+        misses: (int) Artifacts that had to be rebuilt
+    """
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = str(directory)
+        self.hits = 0
+        self.misses = 0
+        self._compiler_key = _compiler_key()
+        self._records = {}   # location -> record dict
+        self._dirty = set()  # locations with unsaved changes
+        self._envs = {}      # id(module) -> environment digest
+
+    def __repr__(self):
+        return f"BuildCache<{self.directory}>"
+
+    # -- parsed statements -------------------------------------------------
+
+    def statement_key(self, stmt):
+        """Build the content key for a scanned statement.
+
+        Args:
+            stmt: (Statement) Statement from Module.statements()
+
+        Returns:
+            (str) Key combining operator, name, body hash and position
+        """
+        return stmt.key
+
+    def parsed_cop(self, module, key):
+        """Get the cached parse of a statement.
+
+        Args:
+            module: (Module) Module that owns the statement
+            key: (str) Key from statement_key()
+
+        Returns:
+            (Value | None) COP tree, or None on a miss
+        """
+        record = self._record(module)
+        entry = record["stmts"].get(key)
+        record["used"].add(key)
+        if entry is not None and entry.get("cop") is not None:
+            try:
+                cop = self._decode_value(entry["cop"], None)
+            except _Stale:
+                pass
+            else:
+                self.hits += 1
+                return cop
+        self.misses += 1
+        return None
+
+    def has_parsed(self, module, key):
+        """Check for a cached parse of a statement without counting a lookup.
+
+        Args:
+            module: (Module) Module that owns the statement
+            key: (str) Key from statement_key()
+
+        Returns:
+            (bool) True if parsed_cop() has an entry to decode
+        """
+        entry = self._record(module)["stmts"].get(key)
+        return entry is not None and entry.get("cop") is not None
+
+    def store_parsed(self, module, key, cop):
+        """Remember the parse of a statement.
+
+        Args:
+            module: (Module) Module that owns the statement
+            key: (str) Key from statement_key()
+            cop: (Value) COP tree produced by the compiler
+        """
+        try:
+            encoded = self._encode_value(cop, None)
+        except _Uncacheable:
+            return
+        record = self._record(module)
+        record["stmts"].setdefault(key, {})["cop"] = encoded
+        record["used"].add(key)
+        self._dirty.add(record["location"])
+
+    # -- resolved definitions ----------------------------------------------
+
+    def resolved(self, interp, module, definition, validated):
+        """Get the cached resolved COP and callouts for a definition.
+
+        Args:
+            interp: (Interp) Interpreter used to look up referenced modules
+            module: (Module) Module that owns the definition
+            definition: (Definition) Definition being built
+            validated: (bool) Whether callouts are also required
+
+        Returns:
+            (tuple | None) (resolved_cop, callouts) where callouts is None
+            when not validated, or None on a miss
+        """
+        entry = self._resolved_entry(interp, module, definition)
+        if entry is None or entry.get("resolved") is None:
+            self.misses += 1
+            return None
+        if validated and entry.get("callouts") is None:
+            self.misses += 1
+            return None
+        try:
+            cop = self._decode_value(entry["resolved"], interp)
+        except _Stale:
+            self.misses += 1
+            return None
+        callouts = None
+        if validated:
+            callouts = [_decode_callout(c) for c in entry["callouts"]]
+        self.hits += 1
+        return cop, callouts
+
+    def store_resolved(self, interp, module, definition, cop, callouts):
+        """Remember the resolved COP and callouts for a definition.
+
+        Args:
+            interp: (Interp) Interpreter that built the definition
+            module: (Module) Module that owns the definition
+            definition: (Definition) Definition that was built
+            cop: (Value) Resolved and folded COP tree
+            callouts: (list | None) Callouts from validation, None if skipped
+        """
+        entry = self._resolved_entry(interp, module, definition, create=True)
+        if entry is None:
+            return
+        try:
+            entry["resolved"] = self._encode_value(cop, interp)
+        except _Uncacheable:
+            entry.pop("resolved", None)
+            entry.pop("callouts", None)
+            return
+        if callouts is not None:
+            entry["callouts"] = [_encode_callout(c) for c in callouts]
+        self._dirty.add(self._record(module)["location"])
+
+    def _resolved_entry(self, interp, module, definition, create=False):
+        """Find the resolved-artifact slot for a definition, if still valid."""
+        key = definition.cache_key
+        if key is None:
+            return None
+        record = self._record(module)
+        entry = record["stmts"].get(key)
+        if entry is None:
+            if not create:
+                return None
+            entry = record["stmts"][key] = {}
+        env = self._environment(interp, module)
+        if record["env"] != env:
+            if not create:
+                return None
+            # Imports or the compiler changed; nothing resolved is trustworthy
+            for stale in record["stmts"].values():
+                stale.pop("resolved", None)
+                stale.pop("callouts", None)
+            record["env"] = env
+        record["used"].add(key)
+        return entry
+
+    def _environment(self, interp, module):
+        """Digest of everything that can change how a module resolves."""
+        env = self._envs.get(id(module))
+        if env is not None:
+            return env
+        etags = set()
+        roots = [module]
+        if not module.no_default:
+            roots.append(interp.module_cache.get("default"))
+        roots.append(interp.module_cache.get("callout"))
+        pending = [m for m in roots if m is not None]
+        seen = set()
+        while pending:
+            mod = pending.pop()
+            if id(mod) in seen:
+                continue
+            seen.add(id(mod))
+            etags.add(str(getattr(mod.source, "etag", mod.token)))
+            for name, (child, err) in (mod._imports or {}).items():
+                if child is None:
+                    etags.add(f"missing:{name}")
+                else:
+                    pending.append(child)
+        digest = hashlib.blake2s(digest_size=16)
+        digest.update(self._compiler_key.encode("utf-8"))
+        digest.update(str(module.source.etag).encode("utf-8"))
+        for etag in sorted(etags):
+            digest.update(b"\0" + etag.encode("utf-8"))
+        env = digest.hexdigest()
+        self._envs[id(module)] = env
+        return env
+
+    # -- files ---------------------------------------------------------------
+
+    def _record(self, module):
+        """Load (or start) the cache record for a module."""
+        location = module.source.location
+        record = self._records.get(location)
+        if record is not None:
+            return record
+        record = None
+        try:
+            with open(self._path(location), "rb") as f:
+                record = cbor2.load(f)
+        except (OSError, ValueError, cbor2.CBORDecodeError):
+            pass
+        if (not isinstance(record, dict) or record.get("format") != _FORMAT
+                or record.get("compiler") != self._compiler_key):
+            record = {"stmts": {}, "env": None}
+        record["location"] = location
+        record["used"] = set()
+        self._records[location] = record
+        return record
+
+    def _path(self, location):
+        name = hashlib.blake2s(location.encode("utf-8"), digest_size=12).hexdigest()
+        return os.path.join(self.directory, name + ".cbor")
+
+    def flush(self):
+        """Write changed module records back to the cache directory.
+
+        Statements that were not seen in this run are dropped from the
+        written record so files do not grow without bound.  Write failures
+        are ignored; the cache is only an accelerator.
+        """
+        self._envs.clear()
+        # Definitions may have gained values since a lookup last failed
+        self._refs = {k: v for k, v in self._refs.items() if v[1] is not None}
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError:
+            return
+        for location in self._dirty:
+            record = self._records[location]
+            stmts = {k: v for k, v in record["stmts"].items() if k in record["used"]}
+            payload = {
+                "format": _FORMAT,
+                "compiler": self._compiler_key,
+                "env": record["env"],
+                "stmts": stmts,
+            }
+            path = self._path(location)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    cbor2.dump(payload, f)
+                os.replace(tmp, path)
+            except OSError:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+        self._dirty.clear()
+
+
+def _module_pairs(module):
+    """All (name, Definition) pairs of a module without triggering a build."""
+    if module._all_definitions_list is not None:
+        return module._all_definitions_list
+    return list((module._definitions or {}).items())
+
+
+def _find_ref(module, obj):
+    """Find (module id, name, ordinal) of the definition whose value is obj."""
+    if module._definitions is None:
+        return None
+    counts = {}
+    for name, defn in _module_pairs(module):
+        ordinal = counts.get(name, 0)
+        counts[name] = ordinal + 1
+        if defn.value is not None and defn.value.data is obj:
+            if isinstance(module, comp._internal.SystemModule):
+                module_id = "system"
+            else:
+                module_id = module.source.location
+            return (module_id, name, ordinal)
+    return None
+
+
+def _value(data):
+    """Create a plain Value with no unit, handles, stash or cop."""
+    val = _new_value(comp.Value)
+    val.data = data
+    val.cop = None
+    val.unit = None
+    val.stash = None
+    val.handles = None
+    val._hash = None
+    return val
+
+
+_new_value = object.__new__
+
+
+def _compiler_key():
+    """Fingerprint of the compiler: version plus source and grammar mtimes."""
+    root = Path(__file__).parent
+    newest = 0
+    for pattern in ("*.py", "lark/*.lark"):
+        for path in root.glob(pattern):
+            try:
+                newest = max(newest, path.stat().st_mtime_ns)
+            except OSError:
+                pass
+    return f"{comp.__version__}:{_FORMAT}:{newest}"
+
+
+def _encode_location(location):
+    if location is None:
+        return None
+    span = location.span
+    return [span.file, span.line, span.col, span.length, location.label]
+
+
+def _decode_location(encoded):
+    if encoded is None:
+        return None
+    file, line, col, length, label = encoded
+    return comp.Location(comp.Span(file, line, col, length), label)
+
+
+def _encode_callout(callout):
+    return [
+        callout.severity,
+        callout.code,
+        callout.message,
+        callout.phase,
+        _encode_location(callout.primary),
+        [_encode_location(loc) for loc in callout.related],
+        [[note.message, _encode_location(note.location)] for note in callout.notes],
+    ]
+
+
+def _decode_callout(encoded):
+    severity, code, message, phase, primary, related, notes = encoded
+    return comp.Callout(
+        severity, code, message, phase=phase,
+        primary=_decode_location(primary),
+        related=[_decode_location(loc) for loc in related],
+        notes=[comp.Note(msg, _decode_location(loc)) for msg, loc in notes],
+    )
@@ -341,7 +341,13 @@ def cop_callouts(definition, min_severity=ERROR, interp=None, namespace=None):
             import time as _time
             _tc0 = _time.perf_counter()
             callout_mod = interp.module("callout")
-            interp.build_instructions()
+            roots = None
+            if getattr(interp, "lazy_build", False):
+                # Only the validator and the severity tags are needed up front
+                callout_defs = callout_mod.definitions()
+                roots = [callout_defs[name] for name in ("validate", *severity_tags.values())
+                         if name in callout_defs]
+            interp.build_instructions(roots=roots)
             _tc1 = _time.perf_counter()
             interp.timings["callout.bootstrap"] = interp.timings.get("callout.bootstrap", 0.0) + (_tc1 - _tc0)
             interp._callout_mod = callout_mod
@@ -366,10 +372,10 @@ def cop_callouts(definition, min_severity=ERROR, interp=None, namespace=None):
 
     # Wrap the namespace as an opaque Value — comp code passes it to is-pure
     # but does not inspect it directly.
-    ns_val = comp.Value.from_python(namespace) if namespace else comp.Value.from_python(comp.tag_nil)
+    ns_val = comp.Value.from_python(namespace) if namespace else comp.value_nil
 
     original_cop = definition.original_cop
-    original_val = comp.Value.from_python(original_cop) if original_cop else comp.Value.from_python(comp.tag_nil)
+    original_val = comp.Value.from_python(original_cop) if original_cop else comp.value_nil
 
     args = comp.Value.from_python({
         "min-severity": severity_val,
@@ -391,7 +397,7 @@ def cop_callouts(definition, min_severity=ERROR, interp=None, namespace=None):
         msg = "(unknown)"
         if isinstance(fail_val.data, dict):
             import comp as _comp
-            msg_key = _comp.Value.from_python("message")
+            msg_key = _comp.text_key("message")
             msg_val = fail_val.data.get(msg_key)
             if msg_val is not None and isinstance(msg_val.data, str):
                 msg = msg_val.data
@@ -478,11 +484,11 @@ def _value_to_callout(val):
     import comp
 
     try:
-        severity_key = comp.Value.from_python("severity")
-        code_key = comp.Value.from_python("code")
-        message_key = comp.Value.from_python("message")
-        phase_key = comp.Value.from_python("phase")
-        pos_key = comp.Value.from_python("pos")
+        severity_key = comp.text_key("severity")
+        code_key = comp.text_key("code")
+        message_key = comp.text_key("message")
+        phase_key = comp.text_key("phase")
+        pos_key = comp.text_key("pos")
 
         severity_val = val.data.get(severity_key)
         code_val = val.data.get(code_key)
@@ -534,7 +540,7 @@ def exception_to_callout(exc, stmt=None, source_file=None):
 
     Args:
         exc: The exception that was raised
-        stmt: (dict | None) Statement dict with pos info
+        stmt: (Statement | None) Statement with pos info
         source_file: (str | None) Source file path for location
 
     Returns:
@@ -551,7 +557,7 @@ def exception_to_callout(exc, stmt=None, source_file=None):
 
     primary = None
     if stmt and source_file:
-        pos = stmt.get("pos")
+        pos = stmt.pos
         if pos and len(pos) >= 2:
             primary = Location(Span(source_file, pos[0], pos[1]))
 
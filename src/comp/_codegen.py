@@ -9,6 +9,8 @@ import comp
 
 __all__ = [
     "generate_code_for_definition",
+    "compile_python",
+    "peephole",
 ]
 
 
@@ -46,7 +48,7 @@ def generate_code_for_definition(cop, dispatch_own_name=None, dispatch_set_name=
     # The result is left in a register, no final store needed
     result_reg = ctx.build_expression(cop)
 
-    return ctx.instructions
+    return ctx.finish()
 
 
 class CodeGenContext:
@@ -54,7 +56,11 @@ class CodeGenContext:
     
     Uses SSA-style implicit register numbering - instruction index IS the register.
     Operand references are integers pointing to previous instruction indices.
+    The numbering holds while emitting; finish() runs the peephole pass,
+    after which fused instructions may fill several registers each.
     """
+
+    peephole = True  # Run peephole() in finish(); cleared to inspect raw output
     
     def __init__(self, dispatch_own_name=None, dispatch_set_name=None, is_pure=False, namespace=None):
         self.instructions = []
@@ -69,6 +75,15 @@ class CodeGenContext:
         self.instructions.append(instr)
         return idx
     
+    def finish(self):
+        """Return the final instruction list for this context.
+
+        Call once, after all instructions are emitted.
+        """
+        if self.peephole:
+            return peephole(self.instructions)
+        return self.instructions
+
     def build_expression(self, cop):
         """Build instructions for an expression COP.
         
@@ -98,7 +113,7 @@ class CodeGenContext:
                         elif block.body is not None:
                             body_ctx = self.__class__(namespace=self.namespace)
                             body_ctx.build_expression(block.body)
-                            body_instructions = body_ctx.instructions
+                            body_instructions = body_ctx.finish()
                         else:
                             body_instructions = []
                         signature_cop = getattr(block, "signature_cop", None)
@@ -114,7 +129,7 @@ class CodeGenContext:
                     elif block.body is not None:
                         body_ctx = self.__class__(namespace=self.namespace)
                         body_ctx.build_expression(block.body)
-                        body_instructions = body_ctx.instructions
+                        body_instructions = body_ctx.finish()
                     else:
                         body_instructions = []
                     signature_cop = getattr(block, "signature_cop", None)
@@ -291,7 +306,7 @@ class CodeGenContext:
                 return self.emit(comp._instructions.BuildBlock(
                     cop=cop,
                     signature_cop=sig_cop,
-                    body_instructions=body_ctx.instructions,
+                    body_instructions=body_ctx.finish(),
                 ))
 
             case "op.my":
@@ -396,7 +411,7 @@ class CodeGenContext:
                     result = self.emit(comp._instructions.Fallback(
                         cop=cop,
                         test_reg=result,
-                        handler_instructions=handler_ctx.instructions,
+                        handler_instructions=handler_ctx.finish(),
                     ))
                 return result
 
@@ -467,7 +482,7 @@ class CodeGenContext:
 
         # First stage: try-invoke with nil as implicit piped input.
         # If kids[0] is not callable, PipeInvoke returns it as-is (try semantics).
-        nil_idx = self.emit(comp._instructions.Const(cop=cop, value=comp.Value.from_python(comp.tag_nil)))
+        nil_idx = self.emit(comp._instructions.Const(cop=cop, value=comp.value_nil))
         callable_idx = self._build_callable_ensure_register(kids[0])
         args_idx = self.emit(comp._instructions.BuildStruct(cop=kids[0], fields=[]))
         result = self.emit(comp._instructions.PipeInvoke(
@@ -508,8 +523,8 @@ class CodeGenContext:
                 result = self.emit(comp._instructions.PipeFallback(
                     cop=stage_cop,
                     piped_reg=result,
-                    callable_instructions=callable_ctx.instructions,
-                    args_instructions=args_ctx.instructions,
+                    callable_instructions=callable_ctx.finish(),
+                    args_instructions=args_ctx.finish(),
                 ))
             elif stage_tag in ("value.invoke", "value.binding"):
                 # Piped invoke/binding: callable(args) with piped input.
@@ -624,16 +639,20 @@ class CodeGenContext:
             # that DispatchOn receives the actual Tag/Shape object for morph.
             pattern_ctx = self.__class__(namespace=self.namespace)
             _compile_on_pattern(pattern_ctx, branch_kids[0])
-            pattern_instructions = pattern_ctx.instructions
+            pattern_instructions = pattern_ctx.finish()
 
             # Compile the result expression in a fresh sub-context
             result_ctx = self.__class__(namespace=self.namespace)
             result_ctx._build_value_ensure_register(branch_kids[1])
-            result_instructions = result_ctx.instructions
+            result_instructions = result_ctx.finish()
 
             branches.append((pattern_instructions, result_instructions))
 
-        return self.emit(comp._instructions.DispatchOn(cop=cop, condition=condition_idx, branches=branches))
+        # Constant patterns (nearly every !on over tags) get a jump table
+        instr_type = comp._instructions.DispatchOn
+        if all(comp._instructions._constant_pattern(pattern) is not None for pattern, _ in branches):
+            instr_type = comp._instructions.DispatchOnTags
+        return self.emit(instr_type(cop=cop, condition=condition_idx, branches=branches))
 
     def _build_handle_op(self, cop):
         """Build handle operator instructions (!grab, !drop, !pull, !push)."""
@@ -768,7 +787,7 @@ class CodeGenContext:
         instr = comp._instructions.BuildBlock(
             cop=cop,
             signature_cop=signature_cop,
-            body_instructions=body_ctx.instructions,
+            body_instructions=body_ctx.finish(),
             pure=self.is_pure,
         )
         return self.emit(instr)
@@ -853,7 +872,7 @@ class CodeGenContext:
         block_reg = self.emit(comp._instructions.BuildBlock(
             cop=cop,
             signature_cop=combined_sig,
-            body_instructions=body_ctx.instructions,
+            body_instructions=body_ctx.finish(),
             dispatch_own_name=self.dispatch_own_name,
             dispatch_set_name=self.dispatch_set_name,
             pure=self.is_pure,
@@ -919,7 +938,7 @@ class CodeGenContext:
 
         # Statement contained only !my bindings with no value expression — return nil.
         if has_trailing_let:
-            nil_val = comp.Value.from_python(comp.tag_nil)
+            nil_val = comp.value_nil
             return self.emit(comp._instructions.Const(cop=cop, value=nil_val))
 
         return result
@@ -1290,7 +1309,7 @@ class CodeGenContext:
         instr = comp._instructions.BuildBlock(
             cop=cop,
             signature_cop=sig_cop,
-            body_instructions=body_ctx.instructions,
+            body_instructions=body_ctx.finish(),
             pure=self.is_pure,
         )
         return self.emit(instr)
@@ -1527,4 +1546,451 @@ def _apply_field_access(ctx, cop, result, field_kids):
             result = ctx.emit(comp._instructions.GetDynamicIndex(cop=cop, struct_reg=result, index_reg=index_reg))
         else:
             raise comp.CodeError(f"Unsupported field access token: {field_tag}", cop)
-    return result
\ No newline at end of file
+    return result
+
+# Operator-specialized replacements, by generic class and operator
+_SPECIALIZED = {
+    "BinOp": {
+        "+": "AddNum", "-": "SubNum", "*": "MulNum", "/": "DivNum",
+        "!and": "AndBool", "!or": "OrBool",
+    },
+    "UnOp": {"-": "NegNum", "!not": "NotBool"},
+    "CmpOp": {
+        "==": "EqNum", "!=": "NeNum", "<": "LtNum",
+        "<=": "LeNum", ">": "GtNum", ">=": "GeNum",
+    },
+}
+
+
+def peephole(instructions):
+    """Specialize operators and fuse common sequences in an instruction list.
+
+    Runs on the list exactly as CodeGenContext emitted it, where the index
+    of each instruction is its register.  Two rewrites are made:
+
+    - BinOp, UnOp and CmpOp become a class for their operator (AddNum,
+      LtNum, NotBool, ...), or EqTag / NeTag when comparing against a
+      constant tag, so the operator is not looked up on every execution.
+      A PipeInvoke of a constant that cannot be invoked becomes a Const of
+      that value, since the stage would only pass it through.
+    - A Const read by the next operation becomes ConstOp, and LoadLocal
+      followed by a chain of GetField becomes LoadLocalFields.
+
+    Fused instructions still fill one register per original instruction,
+    so operand numbering elsewhere in the list does not change.
+
+    Args:
+        instructions: (list) Instructions from CodeGenContext
+
+    Returns:
+        (list) New instruction list; the input is not modified
+    """
+    instr_mod = comp._instructions
+    constants = {
+        idx: instr.value for idx, instr in enumerate(instructions)
+        if type(instr) is instr_mod.Const
+    }
+    specialized = [_specialize(instr, constants) for instr in instructions]
+
+    result = []
+    idx = 0
+    count = len(specialized)
+    while idx < count:
+        instr = specialized[idx]
+        instr_type = type(instr)
+        if instr_type is instr_mod.Const and idx + 1 < count:
+            op = specialized[idx + 1]
+            if isinstance(op, (instr_mod.BinOp, instr_mod.CmpOp)) and idx in (op.left, op.right):
+                result.append(instr_mod.ConstOp(instr, op))
+                idx += 2
+                continue
+        elif instr_type is instr_mod.LoadLocal:
+            fields = []
+            while idx + len(fields) + 1 < count:
+                field = specialized[idx + len(fields) + 1]
+                if type(field) is not instr_mod.GetField or field.struct_reg != idx + len(fields):
+                    break
+                fields.append(field)
+            if fields:
+                result.append(instr_mod.LoadLocalFields(instr, fields))
+                idx += 1 + len(fields)
+                continue
+        result.append(instr)
+        idx += 1
+    return result
+
+
+def _specialize(instr, constants):
+    """Operator-specialized replacement for one instruction, or itself."""
+    instr_mod = comp._instructions
+    instr_type = type(instr)
+    if instr_type is instr_mod.PipeInvoke:
+        value = constants.get(instr.callable)
+        if value is not None and not instr_mod._invokable(value):
+            return instr_mod.Const(instr.cop, value)
+        return instr
+    if instr_type not in (instr_mod.BinOp, instr_mod.UnOp, instr_mod.CmpOp):
+        return instr
+    names = _SPECIALIZED[instr_type.__name__]
+
+    if instr_type is instr_mod.UnOp:
+        name = names.get(instr.op)
+        if name is None:
+            return instr
+        return getattr(instr_mod, name)(instr.cop, instr.operand)
+
+    if instr_type is instr_mod.CmpOp and instr.op in ("==", "!="):
+        # A constant tag on either side decides most comparisons by identity
+        for const, other in ((instr.right, instr.left), (instr.left, instr.right)):
+            value = constants.get(const) if isinstance(const, int) else const
+            if value is not None and isinstance(value.data, comp.Tag):
+                tag_type = instr_mod.EqTag if instr.op == "==" else instr_mod.NeTag
+                return tag_type(instr.cop, instr.left, instr.right, value.data, other)
+
+    name = names.get(instr.op)
+    if name is None:
+        return instr
+    return getattr(instr_mod, name)(instr.cop, instr.left, instr.right)
+
+
+def compile_python(instructions, name="body"):
+    """Translate an instruction list into a generated Python function.
+
+    The function takes an ExecutionFrame and returns the same result as
+    ``frame.run(instructions)``.  Registers become local variables.  The
+    common instructions (constants, locals, field access, struct literals,
+    the operator-specialized opcodes and pipeline stages that pass a plain
+    value through) are written out inline with the fast paths of their
+    ``execute()``, and never touch ``frame.registers``.  Everything else
+    calls ``execute()`` once the locals it may read are copied into the
+    register list.
+
+    An inlined instruction that leaves its fast path runs its own
+    ``execute()`` and hands the remaining instructions to
+    ``ExecutionFrame.resume()``, as does any failure, so failure values and
+    the fast-forward and fallback rules come from the interpreter loop.
+
+    Args:
+        instructions: (list) Instructions from generate_code_for_definition
+        name: (str) Definition name, used in the generated filename
+
+    Returns:
+        (function) Callable taking an ExecutionFrame
+    """
+    body = _PythonBody(instructions)
+    reg = 0
+    for idx, instr in enumerate(instructions):
+        body.instruction(reg, instr, idx + 1)
+        reg += instr.width
+    lines = body.lines
+    if instructions:
+        last = f"r{reg - 1}"
+        lines.append(f"    cleanup(frame, {last})")
+        lines.append(f"    return {last}")
+    else:
+        lines.append("    cleanup(frame, None)")
+    source = "\n".join(lines) + "\n"
+    code = compile(source, f"<comp {name}>", "exec")
+    exec(code, body.namespace)
+    return body.namespace["body"]
+
+
+# Exceptions that BinOp turns into failure values instead of raising
+_BINOP_ERRORS = "(TypeError, ValueError, ZeroDivisionError, ArithmeticError)"
+
+# Whole-number results of the NumBinOp classes, written out inline
+_WHOLE = {"AddNum": "{x}[0] + {y}[0]", "SubNum": "{x}[0] - {y}[0]", "MulNum": "{x}[0] * {y}[0]"}
+
+
+class _PythonBody:
+    """Source and globals of one function being built by compile_python().
+
+    Each register ``%n`` is the local ``rn``.  ``frame.registers`` is only
+    filled where an ``execute()`` call may read it.
+
+    Attributes:
+        lines: (list) Indented source lines of the function
+        namespace: (dict) Globals for the generated code
+        synced: (int) Registers known to be in ``frame.registers`` at this
+            point of the function; a branch taken at run time may have
+            copied more
+    """
+
+    def __init__(self, instructions):
+        self.namespace = {
+            "comp": comp,
+            "instructions": instructions,
+            "math_binary": comp._ops.math_binary,
+            "compare": comp._ops.compare,
+            "compare_num": comp._ops._compare_num,
+            "div_whole": comp._instructions._div_whole,
+            "invokable": comp._instructions._invokable,
+            "int_value": comp.int_value,
+            "value_true": comp.value_true,
+            "value_false": comp.value_false,
+            "tag_true": comp.tag_true,
+            "tag_false": comp.tag_false,
+            "Tag": comp.Tag,
+            "Struct": comp.Struct,
+            "Value": comp.Value,
+            "CodeError": comp.CodeError,
+            "cleanup": comp._interp._frame_exit_cleanup,
+        }
+        self.lines = [
+            "def body(frame):",
+            "    if frame.registers or frame.failure is not None:",
+            "        return frame.run(instructions)",
+        ]
+        self.synced = 0
+
+    def instruction(self, reg, instr, resume_at):
+        """Add the source for one instruction, leaving its result in ``r{reg}``.
+
+        Superinstructions are written out one fused step at a time, each
+        step filling the next register.
+
+        Args:
+            reg: (int) First register the instruction fills
+            instr: (Instruction) Instruction to translate
+            resume_at: (int) Index of the next instruction, where the
+                interpreter takes over after a slow path or failure
+        """
+        self.namespace[f"i{reg}"] = instr
+        r = f"r{reg}"
+        instr_mod = comp._instructions
+        instr_type = type(instr)
+        emit = self.lines.extend
+
+        if instr_type is instr_mod.Const:
+            self.namespace[f"c{reg}"] = instr.value
+            emit([f"    {r} = c{reg}"])
+
+        elif instr_type is instr_mod.ConstOp:
+            self.namespace[f"c{reg}"] = instr.value
+            emit([f"    {r} = c{reg}"])
+            self.instruction(reg + 1, instr.op, resume_at)
+
+        elif instr_type is instr_mod.LoadLocal or instr_type is instr_mod.LoadLocalFields:
+            name = repr(instr.name)
+            message = f"Undefined local variable: '{instr.name}'"
+            emit([
+                f"    {r} = frame._dollar_vars.get({name}) or frame.env.get({name})",
+                f"    if {r} is None:",
+                f"        raise CodeError({message!r})",
+            ])
+            for pos, field in enumerate(getattr(instr, "fields", ())):
+                self.namespace[f"i{reg + 1 + pos}"] = field
+                self._get_field(reg + 1 + pos, field)
+
+        elif instr_type is instr_mod.GetField:
+            self._get_field(reg, instr)
+
+        elif instr_type is instr_mod.StoreLocal:
+            source = self.operand(instr.source, reg, "s")
+            emit([f"    {r} = {source}", f"    frame.env[{instr.name!r}] = {r}"])
+
+        elif instr_type is instr_mod.BuildStruct:
+            lines = [f"    d{reg} = Struct()"]
+            for pos, (key, source) in enumerate(instr.keyed):
+                self.namespace[f"k{reg}_{pos}"] = key
+                value = self.operand(source, reg, f"s{pos}_")
+                lines.append(f"    d{reg}[k{reg}_{pos}] = {value}")
+            lines.append(f"    {r} = Value(d{reg})")
+            emit(lines)
+
+        elif isinstance(instr, instr_mod.NumBinOp):
+            self._num_binop(reg, instr, resume_at)
+
+        elif isinstance(instr, instr_mod.CmpNum):
+            self._cmp_num(reg, instr, resume_at)
+
+        elif isinstance(instr, instr_mod.EqTag):
+            self._eq_tag(reg, instr, resume_at)
+
+        elif isinstance(instr, instr_mod.BoolBinOp):
+            a = self.operand(instr.left, reg, "a")
+            b = self.operand(instr.right, reg, "b")
+            combine = "and" if instr.op == "!and" else "or"
+            emit([
+                f"    x{reg} = {a}.data",
+                f"    y{reg} = {b}.data",
+                f"    if (x{reg} is tag_true or x{reg} is tag_false) and (y{reg} is tag_true or y{reg} is tag_false):",
+                f"        {r} = value_true if x{reg} is tag_true {combine} y{reg} is tag_true else value_false",
+                "    else:",
+                *self.finish(reg, resume_at, "        "),
+            ])
+
+        elif instr_type is instr_mod.NegNum:
+            v = self.operand(instr.operand, reg, "a")
+            emit([
+                f"    x{reg} = {v}.data",
+                f"    if type(x{reg}) is tuple and x{reg}[1] == 1 and x{reg}[2] == 0 and {v}.unit is None:",
+                f"        {r} = int_value(-x{reg}[0])",
+                "    else:",
+                *self.finish(reg, resume_at, "        "),
+            ])
+
+        elif instr_type is instr_mod.NotBool:
+            v = self.operand(instr.operand, reg, "a")
+            emit([
+                f"    x{reg} = {v}.data",
+                f"    if x{reg} is tag_true:",
+                f"        {r} = value_false",
+                f"    elif x{reg} is tag_false:",
+                f"        {r} = value_true",
+                "    else:",
+                *self.finish(reg, resume_at, "        "),
+            ])
+
+        elif instr_type is instr_mod.BinOp and instr.op not in ("!and", "!or"):
+            self._guarded(reg, instr, resume_at, "math_binary", _BINOP_ERRORS)
+
+        elif instr_type is instr_mod.CmpOp:
+            self._guarded(reg, instr, resume_at, "compare", "(TypeError, ValueError)")
+
+        elif instr_type is instr_mod.PipeInvoke:
+            # Plain values pass through; anything invokable runs in place
+            stage = self.operand(instr.callable, reg, "c")
+            emit([
+                f"    if not invokable({stage}):",
+                f"        {r} = {stage}",
+                "    else:",
+                *self.sync(reg, "        "),
+                f"        {r} = i{reg}.execute(frame)",
+                "        if frame.failure is not None:",
+                f"            return frame.resume(instructions, {resume_at}, {r})",
+            ])
+
+        else:
+            last = reg + instr.width - 1
+            emit(self.sync(reg, "    "))
+            emit([
+                f"    r{last} = i{reg}.execute(frame)",
+                "    if frame.failure is not None:",
+                f"        return frame.resume(instructions, {resume_at}, r{last})",
+            ])
+            # Other superinstructions fill several registers; later code may read any
+            for step in range(reg, last):
+                self.lines.append(f"    r{step} = frame.registers[{step}]")
+            self.synced = reg + instr.width
+
+    def sync(self, reg, indent):
+        """Lines copying the registers below reg into ``frame.registers``.
+
+        Copies from however many the list holds at run time, which is at
+        least ``synced``.
+        """
+        start = self.synced
+        if start >= reg:
+            return []
+        values = ", ".join(f"r{n}" for n in range(start, reg))
+        return [
+            f"{indent}regs = frame.registers",
+            f"{indent}regs.extend(({values},)[len(regs) - {start}:])",
+        ]
+
+    def finish(self, reg, resume_at, indent):
+        """Lines running instruction ``i{reg}`` and the rest of the body in
+        the interpreter, for when its inlined fast path does not apply."""
+        return self.sync(reg, indent) + [
+            f"{indent}r{reg} = i{reg}.execute(frame)",
+            f"{indent}return frame.resume(instructions, {resume_at}, r{reg})",
+        ]
+
+    def operand(self, source, reg, label):
+        """Source expression for an instruction operand.
+
+        Operands are register indexes or, occasionally, Values placed
+        directly in the instruction; those become constants in the
+        generated namespace.
+        """
+        if isinstance(source, int):
+            return f"r{source}"
+        const = f"v{reg}{label}"
+        self.namespace[const] = source
+        return const
+
+    def _get_field(self, reg, instr):
+        source = self.operand(instr.struct_reg, reg, "s")
+        message = f"Field '{instr.field}' not found in struct"
+        self.lines.extend([
+            f"    r{reg} = {source}.data.get(i{reg}.key)",
+            f"    if r{reg} is None:",
+            f"        raise CodeError({message!r}, i{reg}.cop)",
+        ])
+
+    def _guarded(self, reg, instr, resume_at, func, errors):
+        # A failing operation is re-run by the instruction so the failure
+        # value is built exactly as the interpreter loop would build it
+        a = self.operand(instr.left, reg, "a")
+        b = self.operand(instr.right, reg, "b")
+        self.lines.extend([
+            "    try:",
+            f"        r{reg} = {func}({instr.op!r}, {a}, {b})",
+            f"    except {errors}:",
+            *self.finish(reg, resume_at, "        "),
+        ])
+
+    def _num_binop(self, reg, instr, resume_at):
+        a = self.operand(instr.left, reg, "a")
+        b = self.operand(instr.right, reg, "b")
+        x, y, n, d = f"x{reg}", f"y{reg}", f"n{reg}", f"d{reg}"
+        test = (f"type({x}) is tuple and type({y}) is tuple and {x}[1] == 1 and {y}[1] == 1"
+                f" and {a}.unit is None and {b}.unit is None")
+        whole = _WHOLE.get(type(instr).__name__)
+        if whole is None:
+            # DivNum: only exact quotients are whole
+            head = [f"    if {test} and ({n} := div_whole({x}[0], {y}[0])) is not None:"]
+        else:
+            head = [f"    if {test}:", f"        {n} = {whole.format(x=x, y=y)}"]
+        self.lines.extend([
+            f"    {x} = {a}.data",
+            f"    {y} = {b}.data",
+            *head,
+            f"        {d} = {x}[2] if {x}[2] > {y}[2] else {y}[2]",
+            f"        r{reg} = int_value({n}) if {d} == 0 else Value(({n}, 1, {d}))",
+            "    else:",
+            "        try:",
+            f"            r{reg} = math_binary({instr.op!r}, {a}, {b})",
+            f"        except {_BINOP_ERRORS}:",
+            *self.finish(reg, resume_at, "            "),
+        ])
+
+    def _cmp_num(self, reg, instr, resume_at):
+        a = self.operand(instr.left, reg, "a")
+        b = self.operand(instr.right, reg, "b")
+        x, y, op = f"x{reg}", f"y{reg}", instr.op
+        self.lines.extend([
+            f"    {x} = {a}.data",
+            f"    {y} = {b}.data",
+            f"    if type({x}) is tuple and type({y}) is tuple and {a}.unit is None and {b}.unit is None:",
+            f"        if {x}[1] == 1 and {y}[1] == 1 and {x}[2] == {y}[2]:",
+            f"            r{reg} = value_true if {x}[0] {op} {y}[0] else value_false",
+            "        else:",
+            f"            r{reg} = value_true if compare_num({x}, {y}) {op} 0 else value_false",
+            "    else:",
+            "        try:",
+            f"            r{reg} = compare({op!r}, {a}, {b})",
+            "        except (TypeError, ValueError):",
+            *self.finish(reg, resume_at, "            "),
+        ])
+
+    def _eq_tag(self, reg, instr, resume_at):
+        self.namespace[f"t{reg}"] = instr.tag
+        other = self.operand(instr.other, reg, "o")
+        a = self.operand(instr.left, reg, "a")
+        b = self.operand(instr.right, reg, "b")
+        same, differ = ("value_true", "value_false") if instr.equal else ("value_false", "value_true")
+        x, t = f"x{reg}", f"t{reg}"
+        self.lines.extend([
+            f"    {x} = {other}.data",
+            f"    if {x} is {t}:",
+            f"        r{reg} = {same}",
+            f"    elif not isinstance({x}, Tag) or {x}.qualified != {t}.qualified:",
+            f"        r{reg} = {differ}",
+            "    else:",
+            "        try:",
+            f"            r{reg} = compare({instr.op!r}, {a}, {b})",
+            "        except (TypeError, ValueError):",
+            *self.finish(reg, resume_at, "            "),
+        ])
@@ -1,6 +1,6 @@
 """Compile module statements into Definitions.
 
-Translates scanned statement dicts into Definition objects by parsing
+Translates scanned Statements into Definition objects by parsing
 statement bodies through Lark, converting to COP trees, and running
 structural validation.  This module is the comp language's specific
 compiler — other languages or formats would provide their own path to
@@ -14,7 +14,18 @@ adopting the returned Definitions into the module.
 import comp
 
 
-def compile_definition(stmt, module_id):
+# Grammar start rule for the body of each definition operator
+START_RULES = {
+    "func": "start_func",
+    "pure": "start_func",
+    "tag": "start_tag",
+    "shape": "start_shape",
+    "startup": "start_startup",
+    "main": "start_main",
+}
+
+
+def compile_definition(stmt, module_id, cop=None):
     """Compile a single statement into one or more Definitions.
 
     Parses the statement body, converts to COP, validates structure,
@@ -24,43 +35,65 @@ def compile_definition(stmt, module_id):
     and child tags).  All other statement types produce exactly one.
 
     Args:
-        stmt: (dict) Statement dict from the scanner with operator, name,
-              body, pos, body_col keys
+        stmt: (Statement) Statement from the scanner with operator, name,
+              body, pos, body_col fields
         module_id: (str) Module token string for the Definition
+        cop: (Value | None) Previously parsed COP for this statement body,
+             used instead of parsing again (see BuildCache)
 
     Returns:
-        (list) List of (qualified_name, Definition) tuples
+        (list) List of (qualified_name, Definition) tuples.  The first
+        definition always carries the statement's parsed COP.
 
     Raises:
         comp.ParseError: If the statement body fails to parse
         comp.CodeError: If COP structure validation fails or on duplicate names
     """
-    operator = stmt.get("operator")
+    operator = stmt.operator
     if operator in ("func", "pure"):
-        return _compile_func(stmt, module_id)
+        return _compile_func(stmt, module_id, cop)
     elif operator == "tag":
-        return _compile_tag(stmt, module_id)
+        return _compile_tag(stmt, module_id, cop)
     elif operator == "shape":
-        return _compile_shape(stmt, module_id)
+        return _compile_shape(stmt, module_id, cop)
     elif operator == "startup":
-        return _compile_startup(stmt, module_id)
+        return _compile_startup(stmt, module_id, cop)
     elif operator == "main":
-        return _compile_main(stmt, module_id)
+        return _compile_main(stmt, module_id, cop)
     else:
         raise comp.CodeError(f"Unknown definition operator: {operator}")
 
 
+def parse_statement(stmt):
+    """Parse a definition statement's body into its COP.
+
+    This is the parse that compile_definition() does when it is not given
+    a COP, and the one part of compiling that needs no Module state.
+
+    Args:
+        stmt: (Statement) Statement whose operator is in START_RULES
+
+    Returns:
+        (Value) Structurally checked COP tree
+
+    Raises:
+        comp.ParseError: If the statement body fails to parse
+        comp.CodeError: If COP structure validation fails
+    """
+    return _parse_stmt_body(stmt, START_RULES[stmt.operator])
+
+
 def compile_mod_value(stmt):
     """Compile a !mod statement into a (name, cop_value) pair.
 
     Args:
-        stmt: (dict) Statement dict with operator=="mod"
+        stmt: (Statement) Statement with operator=="mod"
 
     Returns:
         (tuple) (name, cop_value)
     """
-    name = stmt.get("name")
-    body = stmt.get("body", "").strip()
+    name = stmt.name
+    body = stmt.body.strip()
     lark_tree = comp.lark_parse(body, "comp", rule="start_mod")
     cop_value = comp._parse.lark_to_cop(lark_tree)
     return name, cop_value
@@ -70,16 +103,16 @@ def compile_deferred(stmt):
     """Extract deferred alias/export info from a statement.
 
     Args:
-        stmt: (dict) Statement dict with operator=="alias" or "export"
+        stmt: (Statement) Statement with operator=="alias" or "export"
 
     Returns:
         (tuple) (kind, name, ref_string, is_private) or None if empty ref
     """
-    operator = stmt.get("operator")
-    raw_name = stmt.get("name")
+    operator = stmt.operator
+    raw_name = stmt.name
     is_private = raw_name.endswith("&")
     name = raw_name[:-1] if is_private else raw_name
-    ref = stmt.get("body", "").strip()
+    ref = stmt.body.strip()
     if not ref:
         # Bare !alias foo — re-export the name as-is from the namespace
         ref = name
@@ -94,15 +127,15 @@ def _parse_stmt_body(stmt, start_rule):
     """Parse a statement body through Lark and convert to COP.
 
     Args:
-        stmt: (dict) Statement dict
+        stmt: (Statement) Statement
         start_rule: (str) Lark grammar entry point
 
     Returns:
         (Value) COP node
     """
-    body = stmt.get("body", "")
-    line_offset = stmt.get("pos", [1])[0]
-    col_offset = stmt.get("body_col", 0)
+    body = stmt.body
+    line_offset = stmt.pos[0]
+    col_offset = stmt.body_col
     tree = comp.lark_parse(body, "comp", start_rule,
                            line_offset=line_offset, col_offset=col_offset)
     cop = comp.lark_to_cop(tree)
@@ -116,16 +149,17 @@ def _split_name(stmt):
     Returns:
         (tuple) (name, is_private)
     """
-    raw_name = stmt.get("name")
+    raw_name = stmt.name
     is_private = raw_name.endswith("&")
     name = raw_name[:-1] if is_private else raw_name
     return name, is_private
 
 
-def _compile_func(stmt, module_id):
+def _compile_func(stmt, module_id, cop=None):
     """Compile a !func or !pure statement."""
     name, is_private = _split_name(stmt)
-    cop = _parse_stmt_body(stmt, "start_func")
+    if cop is None:
+        cop = _parse_stmt_body(stmt, "start_func")
 
     shape = comp.shape_block
     if comp.cop_tag(cop) == "value.wrapper":
@@ -139,13 +173,13 @@ def _compile_func(stmt, module_id):
             shape = comp.shape_struct
 
     definition = comp.Definition(name, module_id, cop, shape, private=is_private)
-    if stmt.get("operator") == "pure":
+    if stmt.operator == "pure":
         definition.pure = True
 
     return [(name, definition)]
 
 
-def _compile_tag(stmt, module_id):
+def _compile_tag(stmt, module_id, cop=None):
     """Compile a !tag statement into tag hierarchy definitions.
 
     Tag definitions produce multiple results: the main tag, any
@@ -154,7 +188,8 @@ def _compile_tag(stmt, module_id):
     caller must set tag.module after adoption.
     """
     name, is_private = _split_name(stmt)
-    cop = _parse_stmt_body(stmt, "start_tag")
+    if cop is None:
+        cop = _parse_stmt_body(stmt, "start_tag")
 
     results = []
 
@@ -198,23 +233,25 @@ def _compile_tag(stmt, module_id):
     return results
 
 
-def _compile_shape(stmt, module_id):
+def _compile_shape(stmt, module_id, cop=None):
     """Compile a !shape statement."""
     name, is_private = _split_name(stmt)
-    cop = _parse_stmt_body(stmt, "start_shape")
+    if cop is None:
+        cop = _parse_stmt_body(stmt, "start_shape")
     definition = comp.Definition(name, module_id, cop, comp.shape_shape,
                                  private=is_private)
     return [(name, definition)]
 
 
-def _compile_startup(stmt, module_id):
+def _compile_startup(stmt, module_id, cop=None):
     """Compile a !startup context preparation statement.
 
     The COP is a startup.define node containing optional dependency names
     and a struct body that produces context values.
     """
-    name = stmt.get("name")
-    cop = _parse_stmt_body(stmt, "start_startup")
+    name = stmt.name
+    if cop is None:
+        cop = _parse_stmt_body(stmt, "start_startup")
     qualified = f"!startup.{name}"
     definition = comp.Definition(qualified, module_id, cop, comp.shape_block,
                                  private=True)
@@ -231,14 +268,15 @@ def _compile_startup(stmt, module_id):
     return [(qualified, definition)]
 
 
-def _compile_main(stmt, module_id):
+def _compile_main(stmt, module_id, cop=None):
     """Compile a !main entry point statement.
 
     The COP is a main.define node containing optional dependency names
     and a function body.
     """
-    name = stmt.get("name")
-    cop = _parse_stmt_body(stmt, "start_main")
+    name = stmt.name
+    if cop is None:
+        cop = _parse_stmt_body(stmt, "start_main")
     qualified = f"!main.{name}"
     definition = comp.Definition(qualified, module_id, cop, comp.shape_block,
                                  private=True)
@@ -131,7 +131,7 @@ def _create_cop_module(module):
     kids_field = comp.ShapeField(
         name="kids",
         shape=kids_collection,
-        default=comp.Value.from_python({})
+        default=comp.value_empty
     )
     cop_shape.fields.append(kids_field)
 
@@ -140,15 +140,15 @@ def describe_name(module, name):
                 },
             }
 
-        Each "doc" entry is a dict with keys "content", "type", "pos".
+        Each "doc" entry is a comp._scan.Comment with content, type and pos.
     """
     statements = module.statements()
     definitions = module.definitions()
-    docs = module.scan().to_python("docs") or []
+    docs = module.scan().docs
 
     # Check for a shape first
     shape_stmt = next(
-        (s for s in statements if s.get("name") == name and s.get("operator") == "shape"),
+        (s for s in statements if s.name == name and s.operator == "shape"),
         None,
     )
     if shape_stmt is not None:
@@ -157,7 +157,7 @@ def describe_name(module, name):
     # Fall back to func / pure overloads
     matching = [
         s for s in statements
-        if s.get("name") == name and s.get("operator") in ("func", "pure")
+        if s.name == name and s.operator in ("func", "pure")
     ]
     if not matching:
         return None
@@ -171,7 +171,7 @@ def describe_name(module, name):
             continue
         definition = definitions.get(qualified)
 
-        pos = stmt.get("pos") or (0, 0, 0, 0)
+        pos = stmt.pos or (0, 0, 0, 0)
         start_line = pos[0] if len(pos) > 0 else 0
         end_line = pos[2] if len(pos) > 2 else start_line
 
@@ -183,8 +183,8 @@ def describe_name(module, name):
 
         overloads.append({
             "qualified": qualified,
-            "operator": stmt.get("operator", "func"),
-            "pure": stmt.get("operator") == "pure",
+            "operator": stmt.operator,
+            "pure": stmt.operator == "pure",
             "pos": pos,
             "input_shape": input_shape,
             "params": params,
@@ -208,7 +208,7 @@ def _describe_shape(module, name, stmt, definitions, docs, statements):
     Args:
         module: (Module) The module
         name: (str) Shape name
-        stmt: (dict) Statement dict from module.statements()
+        stmt: (Statement) Statement from module.statements()
         definitions: (dict) module.definitions()
         docs: (list) All scan docs
         statements: (list) All statements (for line-range lookups)
@@ -222,7 +222,7 @@ def _describe_shape(module, name, stmt, definitions, docs, statements):
 
     source_lines = module.source.content.splitlines()
 
-    pos = stmt.get("pos") or (0, 0, 0, 0)
+    pos = stmt.pos or (0, 0, 0, 0)
     start_line = pos[0] if len(pos) > 0 else 0
     end_line = pos[2] if len(pos) > 2 else start_line
     comments = gather_statement_comments(docs, start_line, end_line, source_lines)
@@ -234,7 +234,7 @@ def _describe_shape(module, name, stmt, definitions, docs, statements):
     # If the statement-level suffix comment was consumed by a field, suppress the
     # duplicate so it doesn't appear twice in the output.
     if comments.get("suffix"):
-        suffix_content = comments["suffix"].get("content", "")
+        suffix_content = comments["suffix"].content
         if any(f.get("comment") == suffix_content for f in (shape_info.get("fields") or [])):
             comments["suffix"] = None
 
@@ -252,10 +252,10 @@ def _describe_shape(module, name, stmt, definitions, docs, statements):
         # Find the statement for this shape to get its pos / comments
         ref_stmt = next(
             (s for s in statements
-             if s.get("name") == ref_name and s.get("operator") == "shape"),
+             if s.name == ref_name and s.operator == "shape"),
             None,
         )
-        ref_pos = ref_stmt.get("pos") if ref_stmt else (0, 0, 0, 0)
+        ref_pos = ref_stmt.pos if ref_stmt else (0, 0, 0, 0)
         ref_start = ref_pos[0] if ref_pos and len(ref_pos) > 0 else 0
         ref_end = ref_pos[2] if ref_pos and len(ref_pos) > 2 else ref_start
         ref_comments = gather_statement_comments(docs, ref_start, ref_end, source_lines)
@@ -292,9 +292,9 @@ def _build_overload_index(statements):
     counters = {}
     index = {}
     for stmt in statements:
-        if stmt.get("operator") not in ("func", "pure"):
+        if stmt.operator not in ("func", "pure"):
             continue
-        name = stmt.get("name")
+        name = stmt.name
         if not name:
             continue
         n = counters.get(name, 0) + 1
@@ -452,7 +452,7 @@ def annotate_field_comments(shape_info, docs, source_lines):
 
     Args:
         shape_info: (dict) Result from extract_shape_info()
-        docs: (list) Comment dicts from module.scan().to_python("docs")
+        docs: (list) Comments from module.scan().docs
         source_lines: (list) Source split by ``str.splitlines()``
     """
     if shape_info.get("kind") != "struct":
@@ -466,9 +466,9 @@ def annotate_field_comments(shape_info, docs, source_lines):
             line_to_field[end_line] = field
 
     for doc in docs:
-        if doc.get("type") != "line":
+        if doc.type != "line":
             continue
-        pos = doc.get("pos") or (0, 0, 0, 0)
+        pos = doc.pos or (0, 0, 0, 0)
         doc_line = pos[0] if len(pos) > 0 else 0
         doc_col = pos[1] if len(pos) > 1 else 1
         if doc_line not in line_to_field:
@@ -477,7 +477,7 @@ def annotate_field_comments(shape_info, docs, source_lines):
         if _has_code_before(doc_line, doc_col, source_lines):
             field = line_to_field[doc_line]
             if field["comment"] is None:  # first match wins
-                field["comment"] = doc["content"]
+                field["comment"] = doc.content
 
 
 # ---------------------------------------------------------------------------
@@ -497,26 +497,25 @@ def gather_statement_comments(docs, stmt_start_line, stmt_end_line, source_lines
       before it on the same source line (i.e. not standalone).
 
     Args:
-        docs: (list) Comment dicts from ``module.scan().to_python("docs")``,
-              each with "content", "type", "pos" (4-tuple).
+        docs: (list) Comment objects from ``module.scan().docs``.
         stmt_start_line: (int) First source line of the statement (1-based).
         stmt_end_line: (int) Last source line of the statement (1-based).
         source_lines: (list | None) Source split by splitlines(), used to
               distinguish suffix from standalone comments.
 
     Returns:
-        (dict) With keys "preceding" (list), "internal" (list), "suffix" (dict | None).
+        (dict) With keys "preceding" (list), "internal" (list), "suffix" (Comment | None).
     """
     before = []
     internal = []
     suffix = None
 
     for doc in docs:
-        pos = doc.get("pos") or (0, 0, 0, 0)
+        pos = doc.pos or (0, 0, 0, 0)
         doc_start = pos[0] if len(pos) > 0 else 0
         doc_end = pos[2] if len(pos) > 2 else doc_start
 
-        if doc_start == stmt_end_line and doc.get("type") == "line":
+        if doc_start == stmt_end_line and doc.type == "line":
             # Suffix only when code precedes // on that line; standalone → internal
             doc_col = pos[1] if len(pos) > 1 else 1
             if source_lines is None or _has_code_before(doc_start, doc_col, source_lines):
@@ -531,7 +530,7 @@ def gather_statement_comments(docs, stmt_start_line, stmt_end_line, source_lines
     preceding = []
     boundary = stmt_start_line
     for doc in reversed(before):
-        pos = doc.get("pos") or (0, 0, 0, 0)
+        pos = doc.pos or (0, 0, 0, 0)
         doc_end = pos[2] if len(pos) > 2 else 0
         doc_start = pos[0] if len(pos) > 0 else 0
         if doc_end >= boundary - 1:
@@ -696,7 +695,7 @@ def _format_function_markdown(description):
 
         # Preceding doc comments as prose
         for doc in ov["comments"]["preceding"]:
-            out.append(doc["content"])
+            out.append(doc.content)
         if ov["comments"]["preceding"]:
             out.append("")
 
@@ -726,14 +725,14 @@ def _format_function_markdown(description):
 
         # Internal comments as // lines
         for doc in ov["comments"]["internal"]:
-            out.append(f"  // {doc['content']}")
+            out.append(f"  // {doc.content}")
         if ov["comments"]["internal"]:
             out.append("")
 
         # Suffix comment on closing line
         suffix = ov["comments"]["suffix"]
         if suffix:
-            out.append(f"  // {suffix['content']}")
+            out.append(f"  // {suffix.content}")
             out.append("")
 
     return "\n".join(out)
@@ -757,7 +756,7 @@ def _format_shape_markdown(description):
 
     # Preceding comments as prose
     for doc in comments["preceding"]:
-        out.append(doc["content"])
+        out.append(doc.content)
     if comments["preceding"]:
         out.append("")
 
@@ -798,12 +797,12 @@ def _format_shape_markdown(description):
 
     # Internal / suffix comments
     for doc in comments["internal"]:
-        out.append(f"  // {doc['content']}")
+        out.append(f"  // {doc.content}")
     if comments["internal"]:
         out.append("")
 
     if comments["suffix"]:
-        out.append(f"  // {comments['suffix']['content']}")
+        out.append(f"  // {comments['suffix'].content}")
         out.append("")
 
     # Referenced shapes -- compact single-line header + fields, no sub-subheadings
@@ -823,7 +822,7 @@ def _format_shape_markdown(description):
             ref_preceding = ref["comments"]["preceding"]
             comment_note = ""
             if ref_preceding:
-                first_line = ref_preceding[-1]["content"].split("\n")[0][:60]
+                first_line = ref_preceding[-1].content.split("\n")[0][:60]
                 comment_note = f"  // {first_line}"
 
             # Summary line for this ref
@@ -271,7 +271,7 @@ def _coptimize_walk(cop, fold, namespace, locals, references, locals_defined=Non
                     if field_tag == "ident.token":
                         # Named field access
                         field_name = field_token.to_python("value")
-                        field_key = comp.Value.from_python(field_name)
+                        field_key = comp.text_key(field_name)
                         field_val = result.data.get(field_key)
                         if field_val is None:
                             break  # Field not found, can't fold
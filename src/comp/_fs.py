@@ -876,25 +876,25 @@ def _create_fs_module(module):
     # ------------------------------------------------------------------
     # Struct field keys (pre-allocated for efficiency)
     # ------------------------------------------------------------------
-    _key_entry_type = comp.Value.from_python("entry-type")
-    _key_name = comp.Value.from_python("name")
-    _key_path = comp.Value.from_python("path")
-    _key_root = comp.Value.from_python("root")
-    _key_vfs = comp.Value.from_python("vfs")
-    _key_handle = comp.Value.from_python("handle")
-    _key_parent = comp.Value.from_python("parent")
-    _key_size = comp.Value.from_python("size")
-    _key_modified = comp.Value.from_python("modified")
+    _key_entry_type = comp.text_key("entry-type")
+    _key_name = comp.text_key("name")
+    _key_path = comp.text_key("path")
+    _key_root = comp.text_key("root")
+    _key_vfs = comp.text_key("vfs")
+    _key_handle = comp.text_key("handle")
+    _key_parent = comp.text_key("parent")
+    _key_size = comp.text_key("size")
+    _key_modified = comp.text_key("modified")
 
     # Datetime struct keys (matching time.comp date-time shape)
-    _key_year = comp.Value.from_python("year")
-    _key_month = comp.Value.from_python("month")
-    _key_day = comp.Value.from_python("day")
-    _key_hour = comp.Value.from_python("hour")
-    _key_minute = comp.Value.from_python("minute")
-    _key_second = comp.Value.from_python("second")
-    _key_zone = comp.Value.from_python("zone")
-    _key_offset_sec = comp.Value.from_python("offset-sec")
+    _key_year = comp.text_key("year")
+    _key_month = comp.text_key("month")
+    _key_day = comp.text_key("day")
+    _key_hour = comp.text_key("hour")
+    _key_minute = comp.text_key("minute")
+    _key_second = comp.text_key("second")
+    _key_zone = comp.text_key("zone")
+    _key_offset_sec = comp.text_key("offset-sec")
     _utc_zone_val = comp.Value({
         _key_name: comp.Value.from_python("UTC"),
         _key_offset_sec: comp.Value.from_python(0),
@@ -986,7 +986,7 @@ def _create_fs_module(module):
             _make_fail(f"{op_name}: entry has no valid name")
         return name_val.data
 
-    _nil_val = comp.Value(comp.tag_nil)
+    _nil_val = comp.value_nil
 
     def _epoch_to_datetime(epoch_secs):
         """Convert epoch seconds to a Comp date-time struct Value."""
@@ -1329,7 +1329,7 @@ def _create_fs_module(module):
             _backend_write_file(parent_state.raw_handle, name, data)
         except OSError as e:
             _make_fail(f"write: {e}")
-        return comp.Value.from_python(None)
+        return comp.value_nil
 
     def _entry_list(input_val, args_val, frame):
         """List all children of a directory entry.
@@ -1372,7 +1372,7 @@ def _create_fs_module(module):
             _backend_remove(parent_state.raw_handle, name)
         except OSError as e:
             _make_fail(f"remove: {e}")
-        return comp.Value.from_python(None)
+        return comp.value_nil
 
     def _entry_meta(input_val, args_val, frame):
         """Return an enriched copy of an entry with full stat metadata.
@@ -1453,9 +1453,9 @@ def _create_fs_module(module):
         if inst.tag is not dir_tag:
             _make_fail(f"close-dir: expected handle#dir, got handle#{inst.tag.qualified}")
         if inst.released:
-            return comp.Value.from_python(None)
+            return comp.value_nil
         if inst.private_data is None:
-            return comp.Value.from_python(None)
+            return comp.value_nil
         state = inst.private_data.data
         if isinstance(state, _DirState) and not state.closed:
             try:
@@ -1463,7 +1463,7 @@ def _create_fs_module(module):
             except OSError:
                 pass
             state.closed = True
-        return comp.Value.from_python(None)
+        return comp.value_nil
 
     def _drop_handle(input_val, args_val, frame):
         """Auto-close a handle#dir when it is dropped."""
@@ -10,6 +10,25 @@ The instruction stream is linear and easy to march through.
 Performance optimizations can happen later - clarity first.
 """
 
+__all__ = [
+    "Instruction", "Const", "LoadVar", "LoadLocal", "LoadOverload",
+    "StoreLocal", "DeliverDependency", "SelectResult", "SetContext",
+    "DeepSetLocal", "Invoke", "PipeInvoke", "Forward", "BinOp", "UnOp",
+    "CmpOp", "NumBinOp", "AddNum", "SubNum", "MulNum", "DivNum",
+    "BoolBinOp", "AndBool", "OrBool", "NegNum", "NotBool", "CmpNum",
+    "EqNum", "NeNum", "LtNum", "LeNum", "GtNum", "GeNum", "EqTag", "NeTag",
+    "ConstOp", "LoadLocalFields", "GetField", "GetIndex", "GetDynamicIndex",
+    "GetStash", "SetStash", "BuildStruct", "BuildInvokeData",
+    "SetBlockWrapper", "BuildBlock",
+    "BuildShapeWithLimits", "BuildShape", "BuildShapeUnion",
+    "BuildShapeCollection", "CastUnit", "StripUnit", "GrabHandle",
+    "DropHandle", "PullHandle", "PushHandle", "RaiseFail", "MergeWithPiped",
+    "FlattenFields", "Fallback", "PipeFallback", "DispatchOn",
+    "DispatchOnTags",
+]
+
+import operator
+
 import comp
 import comp._fmt
 
@@ -39,25 +58,22 @@ def _deep_set_value(base, path, new_value):
 
     if isinstance(segment, int):
         # Positional index access
-        items = list(base_data.items())
-        if segment < 0 or segment >= len(items):
+        if segment < 0 or segment >= len(base_data):
             raise comp.CodeError(
                 f"Index {segment} out of range for deep assignment "
-                f"(struct has {len(items)} fields)"
+                f"(struct has {len(base_data)} fields)"
             )
-        key, current = items[segment]
+        key, current = comp.struct_item(base_data, segment)
     else:
         # Named field access
-        key = comp.Value.from_python(segment)
-        current = base_data.get(key, comp.Value.from_python({}))
+        key = comp.text_key(segment)
+        current = base_data.get(key, comp.value_empty)
 
     if remaining and not isinstance(current.data, dict):
-        current = comp.Value.from_python({})
+        current = comp.value_empty
 
     new_field_value = _deep_set_value(current, remaining, new_value)
-    new_data = dict(base_data)
-    new_data[key] = new_field_value
-    return comp.Value(new_data)
+    return comp.Value(comp.struct_assoc(base_data, key, new_field_value))
 
 
 # ---------------------------------------------------------------------------
@@ -68,6 +84,7 @@ class Instruction:
     """Base class for all instructions."""
 
     can_catch_failure = False  # Override True in Fallback/PipeFallback
+    width = 1  # Registers written; superinstructions write one per fused step
 
     def __init__(self, cop):
         self.cop = cop  # Source COP node for error reporting
@@ -221,8 +238,7 @@ class DeliverDependency(Instruction):
     def execute(self, frame):
         value = frame.get_value(self.source)
         frame.env[self.name] = value
-        frame._last_delivery[self.name] = value
-        frame._delivered_coupling[self.name] = value
+        frame.deliver(self.name, value)
         return frame.set_result(value)
 
     def format(self, idx):
@@ -264,7 +280,7 @@ class SetContext(Instruction):
     def execute(self, frame):
         value = frame.get_value(self.source)
         frame.env[self.name] = value
-        frame.context[self.name] = value
+        frame.set_context(self.name, value)
         return frame.set_result(value)
 
     def format(self, idx):
@@ -298,12 +314,12 @@ class DeepSetLocal(Instruction):
     def execute(self, frame):
         base = frame.env.get(self.base_name)
         if base is None or not isinstance(base.data, dict):
-            base = comp.Value.from_python({})
+            base = comp.value_empty
         new_value = frame.get_value(self.value_reg)
         result = _deep_set_value(base, self.path, new_value)
         frame.env[self.base_name] = result
         if self.update_context:
-            frame.context[self.base_name] = result
+            frame.set_context(self.base_name, result)
         return frame.set_result(result)
 
     def format(self, idx):
@@ -326,7 +342,7 @@ class Invoke(Instruction):
     def execute(self, frame):
         callable_val = frame.get_value(self.callable)
         args_val = frame.get_value(self.args)
-        incoming_delivery = dict(getattr(frame, "_pipeline_delivery", {}) or {})
+        incoming_delivery = frame._pipeline_delivery
         try:
             result = frame.invoke_block(
                 callable_val,
@@ -335,9 +351,9 @@ class Invoke(Instruction):
                 delivery=incoming_delivery,
                 source_cop=self.cop,
             )
-            frame._pipeline_delivery = dict(getattr(frame, "_last_delivery", {}) or {})
+            frame._pipeline_delivery = frame._last_delivery
         except comp.CompFail as e:
-            frame._pipeline_delivery = {}
+            frame._pipeline_delivery = comp._interp._EMPTY_MAP
             frame.failure = e.value
             return frame.set_result(e.value)
         return frame.set_result(result)
@@ -346,8 +362,24 @@ class Invoke(Instruction):
         return f"%{idx}  Invoke %{self.callable} (%{self.args})"
 
 
+def _invokable(value):
+    """True when invoke_block does anything but fail with ~fail.invoke.
+
+    Every other kind of data is a plain value that a pipeline stage passes
+    through unchanged.
+    """
+    return isinstance(value.data, (
+        comp.Callable, comp.InternalCallable, comp.Shape,
+        comp.ShapeUnion, comp.ShapeCollection, comp.Tag,
+    ))
+
+
 class PipeInvoke(Instruction):
-    """Invoke a function/block with piped input and arguments."""
+    """Invoke a function/block with piped input and arguments.
+
+    A stage holding a plain value (not a block, builtin, shape or tag)
+    passes it through without calling invoke_block.
+    """
 
     def __init__(self, cop, callable, piped, args):
         super().__init__(cop)
@@ -357,9 +389,11 @@ class PipeInvoke(Instruction):
 
     def execute(self, frame):
         callable_val = frame.get_value(self.callable)
+        if not _invokable(callable_val):
+            return frame.set_result(callable_val)
         piped_val = frame.get_value(self.piped)
         args_val = frame.get_value(self.args)
-        incoming_delivery = dict(getattr(frame, "_pipeline_delivery", {}) or {})
+        incoming_delivery = frame._pipeline_delivery
         try:
             result = frame.invoke_block(
                 callable_val,
@@ -368,7 +402,7 @@ class PipeInvoke(Instruction):
                 delivery=incoming_delivery,
                 source_cop=self.cop,
             )
-            frame._pipeline_delivery = dict(getattr(frame, "_last_delivery", {}) or {})
+            frame._pipeline_delivery = frame._last_delivery
         except comp.CompFail as e:
             # Try-invoke semantics: a "not callable" failure means the value is
             # not a block, so treat it as a pass-through (return the value itself).
@@ -383,7 +417,7 @@ class PipeInvoke(Instruction):
                     return frame.set_result(callable_val)
             except (TypeError, KeyError):
                 pass
-            frame._pipeline_delivery = {}
+            frame._pipeline_delivery = comp._interp._EMPTY_MAP
             frame.failure = e.value
             return frame.set_result(e.value)
         return frame.set_result(result)
@@ -442,7 +476,7 @@ class Forward(Instruction):
             )
 
         # Re-dispatch skipping our own block
-        _empty = comp.Value.from_python({})
+        _empty = comp.value_empty
         result = frame._dispatch_overload(callable_val.data, _empty, piped_val, skip_name=skip_name)
         if result is None:
             raise comp.CodeError(
@@ -547,6 +581,319 @@ class CmpOp(Instruction):
         return f"%{idx}  CmpOp '{self.op}' %{self.left} %{self.right}"
 
 
+# ---------------------------------------------------------------------------
+# Operator-specialized opcodes
+#
+# The peephole pass in _codegen replaces BinOp / UnOp / CmpOp with these once
+# the operator is known.  Each takes a fast path for the common operand types
+# and otherwise falls back to the generic instruction, so results and
+# failures are exactly the same.
+# ---------------------------------------------------------------------------
+
+def _div_whole(n, d):
+    """Whole quotient of two integers, or None when it is not exact."""
+    if d == 0 or n % d:
+        return None
+    return n // d
+
+
+class NumBinOp(BinOp):
+    """Arithmetic on a fixed operator with a whole-number fast path."""
+
+    op = None  # Operator symbol, set by each subclass
+    whole = None  # (callable) Integer result for whole operands, or None
+
+    def __init__(self, cop, left, right):
+        super().__init__(cop, self.op, left, right)
+
+    def execute(self, frame):
+        left_val = frame.get_value(self.left)
+        right_val = frame.get_value(self.right)
+        ldata = left_val.data
+        rdata = right_val.data
+        if (type(ldata) is tuple and type(rdata) is tuple and ldata[1] == 1 and rdata[1] == 1
+                and left_val.unit is None and right_val.unit is None):
+            n = self.whole(ldata[0], rdata[0])
+            if n is not None:
+                dp = ldata[2] if ldata[2] > rdata[2] else rdata[2]
+                if dp == 0:
+                    return frame.set_result(comp.int_value(n))
+                return frame.set_result(comp.Value((n, 1, dp)))
+        return BinOp.execute(self, frame)
+
+    def format(self, idx):
+        return f"%{idx}  {type(self).__name__} %{self.left} %{self.right}"
+
+
+class AddNum(NumBinOp):
+    """Addition (+)."""
+
+    op = "+"
+    whole = staticmethod(operator.add)
+
+
+class SubNum(NumBinOp):
+    """Subtraction (-)."""
+
+    op = "-"
+    whole = staticmethod(operator.sub)
+
+
+class MulNum(NumBinOp):
+    """Multiplication (*)."""
+
+    op = "*"
+    whole = staticmethod(operator.mul)
+
+
+class DivNum(NumBinOp):
+    """Division (/), fast only when the quotient is whole."""
+
+    op = "/"
+    whole = staticmethod(_div_whole)
+
+
+class BoolBinOp(BinOp):
+    """!and / !or with a fast path for boolean operands."""
+
+    op = None  # "!and" or "!or", set by each subclass
+    combine = None  # (callable) Python result for two bools
+
+    def __init__(self, cop, left, right):
+        super().__init__(cop, self.op, left, right)
+
+    def execute(self, frame):
+        ldata = frame.get_value(self.left).data
+        rdata = frame.get_value(self.right).data
+        true, false = comp.tag_true, comp.tag_false
+        if (ldata is true or ldata is false) and (rdata is true or rdata is false):
+            result = self.combine(ldata is true, rdata is true)
+            return frame.set_result(comp.value_true if result else comp.value_false)
+        return BinOp.execute(self, frame)
+
+    def format(self, idx):
+        return f"%{idx}  {type(self).__name__} %{self.left} %{self.right}"
+
+
+class AndBool(BoolBinOp):
+    """Logical and (!and)."""
+
+    op = "!and"
+    combine = staticmethod(operator.and_)
+
+
+class OrBool(BoolBinOp):
+    """Logical or (!or)."""
+
+    op = "!or"
+    combine = staticmethod(operator.or_)
+
+
+class NegNum(UnOp):
+    """Unary minus with a fast path for whole numbers without units."""
+
+    def __init__(self, cop, operand):
+        super().__init__(cop, "-", operand)
+
+    def execute(self, frame):
+        operand_val = frame.get_value(self.operand)
+        data = operand_val.data
+        if type(data) is tuple and data[1] == 1 and data[2] == 0 and operand_val.unit is None:
+            return frame.set_result(comp.int_value(-data[0]))
+        return UnOp.execute(self, frame)
+
+    def format(self, idx):
+        return f"%{idx}  NegNum %{self.operand}"
+
+
+class NotBool(UnOp):
+    """!not with a fast path for boolean operands."""
+
+    def __init__(self, cop, operand):
+        super().__init__(cop, "!not", operand)
+
+    def execute(self, frame):
+        data = frame.get_value(self.operand).data
+        if data is comp.tag_true:
+            return frame.set_result(comp.value_false)
+        if data is comp.tag_false:
+            return frame.set_result(comp.value_true)
+        return UnOp.execute(self, frame)
+
+    def format(self, idx):
+        return f"%{idx}  NotBool %{self.operand}"
+
+
+class CmpNum(CmpOp):
+    """Comparison on a fixed operator with a fast path for plain numbers.
+
+    ``test`` is applied to the two whole numerators when both sides are
+    whole with the same display hint, otherwise to the ``_compare_num``
+    result and zero.
+    """
+
+    op = None  # Operator symbol, set by each subclass
+    test = None  # (callable) Python comparison for the operator
+
+    def __init__(self, cop, left, right):
+        super().__init__(cop, self.op, left, right)
+
+    def execute(self, frame):
+        left_val = frame.get_value(self.left)
+        right_val = frame.get_value(self.right)
+        ldata = left_val.data
+        rdata = right_val.data
+        if (type(ldata) is tuple and type(rdata) is tuple
+                and left_val.unit is None and right_val.unit is None):
+            if ldata[1] == 1 and rdata[1] == 1 and ldata[2] == rdata[2]:
+                result = self.test(ldata[0], rdata[0])
+            else:
+                result = self.test(comp._ops._compare_num(ldata, rdata), 0)
+            return frame.set_result(comp.value_true if result else comp.value_false)
+        return CmpOp.execute(self, frame)
+
+    def format(self, idx):
+        return f"%{idx}  {type(self).__name__} %{self.left} %{self.right}"
+
+
+class EqNum(CmpNum):
+    """Equality (==)."""
+
+    op = "=="
+    test = staticmethod(operator.eq)
+
+
+class NeNum(CmpNum):
+    """Inequality (!=)."""
+
+    op = "!="
+    test = staticmethod(operator.ne)
+
+
+class LtNum(CmpNum):
+    """Less than (<)."""
+
+    op = "<"
+    test = staticmethod(operator.lt)
+
+
+class LeNum(CmpNum):
+    """Less than or equal (<=)."""
+
+    op = "<="
+    test = staticmethod(operator.le)
+
+
+class GtNum(CmpNum):
+    """Greater than (>)."""
+
+    op = ">"
+    test = staticmethod(operator.gt)
+
+
+class GeNum(CmpNum):
+    """Greater than or equal (>=)."""
+
+    op = ">="
+    test = staticmethod(operator.ge)
+
+
+class EqTag(CmpOp):
+    """== against a constant tag, decided by identity where possible.
+
+    Any value that is not a Tag, or is a Tag with another qualified name,
+    is unequal under the total ordering.  Only a distinct Tag object with
+    the same name needs the generic comparison.
+    """
+
+    op = "=="
+    equal = True  # Result when the values are equal
+
+    def __init__(self, cop, left, right, tag, other):
+        super().__init__(cop, self.op, left, right)
+        self.tag = tag  # comp.Tag held by the constant operand
+        self.other = other  # Register or Value of the other operand
+
+    def execute(self, frame):
+        data = frame.get_value(self.other).data
+        if data is self.tag:
+            equal = True
+        elif not isinstance(data, comp.Tag) or data.qualified != self.tag.qualified:
+            equal = False
+        else:
+            return CmpOp.execute(self, frame)
+        return frame.set_result(comp.value_true if equal is self.equal else comp.value_false)
+
+    def format(self, idx):
+        return f"%{idx}  {type(self).__name__} %{self.left} %{self.right}"
+
+
+class NeTag(EqTag):
+    """!= against a constant tag."""
+
+    op = "!="
+    equal = False
+
+
+# ---------------------------------------------------------------------------
+# Superinstructions
+#
+# Fused sequences still write one register per original instruction, so the
+# register numbering the rest of the body refers to is unchanged.  Only the
+# instruction list gets shorter; ``width`` says how many registers each one
+# fills.
+# ---------------------------------------------------------------------------
+
+class ConstOp(Instruction):
+    """A Const immediately followed by the operation that reads it."""
+
+    def __init__(self, const, op):
+        super().__init__(op.cop)
+        self.value = const.value
+        self.op = op  # BinOp / CmpOp (or a specialization) reading the constant
+        self.width = 2
+
+    def execute(self, frame):
+        frame.registers.append(self.value)
+        return self.op.execute(frame)
+
+    def format(self, idx):
+        return f"%{idx}  Const {self.value.format()} ; {self.op.format(idx + 1)}"
+
+
+class LoadLocalFields(Instruction):
+    """LoadLocal followed by a chain of GetField on each previous result."""
+
+    def __init__(self, load, fields):
+        super().__init__(load.cop)
+        self.name = load.name
+        self.fields = fields  # GetField instructions, in chain order
+        self.width = 1 + len(fields)
+
+    def execute(self, frame):
+        value = frame._dollar_vars.get(self.name) or frame.env.get(self.name)
+        if value is None:
+            raise comp.CodeError(f"Undefined local variable: '{self.name}'")
+        registers = frame.registers
+        registers.append(value)
+        for field in self.fields:
+            result = value.data.get(field.key)
+            if result is None:
+                raise comp.CodeError(f"Field '{field.field}' not found in struct", field.cop)
+            registers.append(result)
+            value = result
+        return value
+
+    def format(self, idx):
+        path = "".join(f".{field.field}" for field in self.fields)
+        return f"%{idx}  LoadLocalFields '{self.name}'{path} (%{idx}-%{idx + len(self.fields)})"
+
+
+def _register_count(instructions):
+    """Number of registers an instruction list fills when it runs."""
+    return sum(instr.width for instr in instructions)
+
+
 # ---------------------------------------------------------------------------
 # Struct / Field Access
 # ---------------------------------------------------------------------------
@@ -558,12 +905,12 @@ class GetField(Instruction):
         super().__init__(cop)
         self.struct_reg = struct_reg  # Register containing the struct
         self.field = field  # Field name to extract
+        self.key = comp.text_key(field)  # Interned key Value for the field
 
     def execute(self, frame):
         struct_val = frame.get_value(self.struct_reg)
         # Look up the field by name
-        field_key = comp.Value.from_python(self.field)
-        result = struct_val.data.get(field_key)
+        result = struct_val.data.get(self.key)
         if result is None:
             raise comp.CodeError(f"Field '{self.field}' not found in struct", self.cop)
         return frame.set_result(result)
@@ -583,10 +930,10 @@ class GetIndex(Instruction):
     def execute(self, frame):
         struct_val = frame.get_value(self.struct_reg)
         # Get field by position
-        items = list(struct_val.data.items())
-        if self.index < 0 or self.index >= len(items):
-            raise comp.CodeError(f"Index {self.index} out of range for struct with {len(items)} fields", self.cop)
-        _, result = items[self.index]
+        count = len(struct_val.data)
+        if self.index < 0 or self.index >= count:
+            raise comp.CodeError(f"Index {self.index} out of range for struct with {count} fields", self.cop)
+        _, result = comp.struct_item(struct_val.data, self.index)
         return frame.set_result(result)
 
     def format(self, idx):
@@ -609,10 +956,10 @@ class GetDynamicIndex(Instruction):
         if index_val.data[1] != 1:
             raise comp.CodeError(f"Index must be a whole number", self.cop)
         index = index_val.data[0]
-        items = list(struct_val.data.items())
-        if index < 0 or index >= len(items):
-            raise comp.CodeError(f"Index {index} out of range for struct with {len(items)} fields", self.cop)
-        _, result = items[index]
+        count = len(struct_val.data)
+        if index < 0 or index >= count:
+            raise comp.CodeError(f"Index {index} out of range for struct with {count} fields", self.cop)
+        _, result = comp.struct_item(struct_val.data, index)
         return frame.set_result(result)
 
     def format(self, idx):
@@ -623,8 +970,8 @@ def _stash_deep_set(struct_val, path, value):
     """Return a new struct value with path[0][path[1]...] = value.
 
     Creates empty structs along the way if any level is missing or non-struct.
-    The returned value is always a fresh Value wrapping a new dict — callers
-    may safely store it back without sharing mutation.
+    The returned value is always a fresh Value wrapping new struct data —
+    callers may safely store it back without sharing mutation.
 
     Args:
         struct_val: (Value) The struct to update (or any value — will be replaced)
@@ -635,18 +982,15 @@ def _stash_deep_set(struct_val, path, value):
         (Value) A new Value with the path set
     """
     if not isinstance(getattr(struct_val, "data", None), dict):
-        struct_val = comp.Value({})
+        struct_val = comp.value_empty
     if not path:
         return value
     key = path[0]
-    field_key = comp.Value.from_python(key)
-    new_data = dict(struct_val.data)
-    if len(path) == 1:
-        new_data[field_key] = value
-    else:
-        sub = new_data.get(field_key)
-        new_data[field_key] = _stash_deep_set(sub, path[1:], value)
-    return comp.Value(new_data)
+    field_key = comp.text_key(key)
+    if len(path) > 1:
+        sub = struct_val.data.get(field_key)
+        value = _stash_deep_set(sub, path[1:], value)
+    return comp.Value(comp.struct_assoc(struct_val.data, field_key, value))
 
 
 class GetStash(Instruction):
@@ -677,8 +1021,7 @@ class GetStash(Instruction):
             )
             frame.failure = fail_val
             return frame.set_result(fail_val)
-        field_key = comp.Value.from_python(self.field)
-        result = stash.data.get(field_key)
+        result = stash.data.get(comp.text_key(self.field))
         if result is None:
             fail_val = comp._interp._make_fail_value(
                 f"Field '{self.field}' not found in stash",
@@ -716,11 +1059,15 @@ class SetStash(Instruction):
                 f"!stash: undefined variable '{self.target_name}'", self.cop
             )
         module_key = frame.module.token if frame.module else "__global__"
+        if id(target_val) in comp._value._constant_ids:
+            # Never attach a stash to a shared constant like nil or 0
+            target_val = target_val.with_unit(target_val.unit)
+            frame.env[self.target_name] = target_val
         if target_val.stash is None:
             target_val.stash = {}
         stash = target_val.stash.get(module_key)
         if stash is None or not isinstance(stash.data, dict):
-            stash = comp.Value({})
+            stash = comp.value_empty
         new_val = frame.get_value(self.value_reg)
         full_path = [self.key] + list(self.path)
         new_stash = _stash_deep_set(stash, full_path, new_val)
@@ -738,13 +1085,17 @@ class BuildStruct(Instruction):
     def __init__(self, cop, fields):
         super().__init__(cop)
         self.fields = fields  # List of (key, source_idx) tuples
+        # Field names converted to key Values once, shared by every struct built
+        self.keyed = [
+            (key if isinstance(key, comp.Unnamed) else comp.text_key(key), source)
+            for key, source in fields
+        ]
 
     def execute(self, frame):
-        struct_data = {}
-        for key, source in self.fields:
-            value = frame.get_value(source)
-            struct_data[key] = value
-        result = comp.Value.from_python(struct_data)
+        struct_data = comp.Struct()
+        for key, source in self.keyed:
+            struct_data[key] = frame.get_value(source)
+        result = comp.Value(struct_data)
         return frame.set_result(result)
 
     def format(self, idx):
@@ -766,6 +1117,8 @@ class BuildInvokeData(Instruction):
       locals    — all frame env bindings except the $ family
       context   — the frame context dict
 
+    locals and context are built only if the wrapper reads them.
+
     This is emitted by the codegen for every @wrapper expression and for
     wrapper-annotated function definitions, so the wrapper function receives
     the full call-site context.
@@ -777,35 +1130,8 @@ class BuildInvokeData(Instruction):
 
     def execute(self, frame):
         statement_val = frame.get_value(self.statement_reg)
-
-        statement_stored = statement_val
-
-        # Current piped input ($)
-        _nil = comp.Value.from_python(comp.tag_nil)
-        input_val = frame._dollar_vars.get("$", _nil)
-
-        # locals: env bindings that are actual user-defined locals
-        # (no namespace-qualified names like mod.func)
-        local_data = {}
-        for k, v in frame.env.items():
-            if "." not in k:
-                local_data[comp.Value.from_python(k)] = v
-        locals_val = comp.Value(local_data)
-
-        # context dict
-        ctx_data = {}
-        for k, v in frame.context.items():
-            ctx_data[comp.Value.from_python(k)] = v
-        context_val = comp.Value(ctx_data)
-
-        _k = comp.Value.from_python
-        result = comp.Value({
-            _k("statement"): statement_stored,
-            _k("input"):     input_val,
-            _k("locals"):    locals_val,
-            _k("context"):   context_val,
-        })
-        return frame.set_result(result)
+        input_val = frame._dollar_vars.get("$", comp.value_nil)
+        return frame.set_result(comp._interp._invoke_data(frame, statement_val, input_val))
 
     def format(self, idx):
         return f"%{idx}  BuildInvokeData stmt=%{self.statement_reg}"
@@ -839,8 +1165,74 @@ class SetBlockWrapper(Instruction):
 # Block / Shape Construction
 # ---------------------------------------------------------------------------
 
+class _BlockSignature:
+    """Parsed block signature, applied to each Block a BuildBlock creates.
+
+    Holds everything BuildBlock reads from the signature COP.  Once cached
+    on the instruction it is shared by every Block built from it, so it is
+    never modified after parsing.
+    """
+
+    __slots__ = (
+        "module",
+        "resolved",
+        "input_shape",
+        "input_name",
+        "arg_name",
+        "arg_shape",
+        "param_names",
+        "dependency_shape",
+        "dependency_names",
+        "deliver_specs",
+    )
+
+    def __init__(self, module):
+        self.module = module  # Module whose names the shapes were resolved in
+        self.resolved = True  # False if any shape reference failed to resolve
+        self.input_shape = None
+        self.input_name = None
+        self.arg_name = None
+        self.arg_shape = None
+        self.param_names = []
+        self.dependency_shape = None
+        self.dependency_names = []
+        self.deliver_specs = []
+
+    def apply(self, block):
+        """Copy the signature onto a new Block."""
+        block.input_shape = self.input_shape
+        block.input_name = self.input_name
+        block.arg_name = self.arg_name
+        block.arg_shape = self.arg_shape
+        block.param_names = self.param_names
+        block.dependency_shape = self.dependency_shape
+        block.dependency_names = self.dependency_names
+        if self.deliver_specs:
+            block.deliver_specs = list(self.deliver_specs)
+
+
+# Signature COP nodes whose meaning depends on the executing frame
+_FRAME_SIGNATURE_TAGS = frozenset(("value.identifier", "shape.default", "value.limit"))
+
+
+def _signature_is_static(cop):
+    """True if a signature COP only refers to constants and namespace names."""
+    if cop is None:
+        return True
+    if comp.cop_tag(cop) in _FRAME_SIGNATURE_TAGS:
+        return False
+    return all(_signature_is_static(kid) for kid in comp.cop_kids(cop))
+
+
 class BuildBlock(Instruction):
-    """Build a block/function value."""
+    """Build a block/function value.
+
+    The signature is parsed into a _BlockSignature the first time the
+    instruction runs.  When it refers only to constants and namespace names
+    (no locals, parameter defaults or limit arguments) and every shape
+    resolved, that result is kept and later executions only capture the
+    closure environment and $ vars.
+    """
 
     def __init__(self, cop, signature_cop, body_instructions, dispatch_own_name=None, dispatch_set_name=None, pure=False):
         super().__init__(cop)
@@ -849,17 +1241,42 @@ class BuildBlock(Instruction):
         self.dispatch_own_name = dispatch_own_name
         self.dispatch_set_name = dispatch_set_name
         self.pure = pure
+        self.static = _signature_is_static(signature_cop)
+        self.signature = None  # _BlockSignature once a static signature is parsed
 
     def execute(self, frame):
+        signature = self.signature
+        if signature is None or signature.module is not frame.module:
+            signature = self._parse_signature(frame)
+            if self.static and signature.resolved:
+                self.signature = signature
+
         # Create a Block object and store the execution data
         block = comp.Block(self.dispatch_own_name or "anonymous")
         block.module = frame.module  # Capture the defining module
         block.body_instructions = self.body_instructions
         block.closure_env = frame.env
-        block.captured_dollar_vars = dict(frame._dollar_vars)
+        block.captured_dollar_vars = frame._dollar_vars
         block.signature_cop = self.signature_cop
         block.dispatch_set_name = self.dispatch_set_name
         block.pure = self.pure
+        signature.apply(block)
+
+        callable = comp.Callable(block.qualified)
+        callable.add(block)
+        result = comp.Value(callable)
+        return frame.set_result(result)
+
+    def _parse_signature(self, frame):
+        """Parse the signature COP into a _BlockSignature.
+
+        Args:
+            frame: (ExecutionFrame) Frame for shape lookups and default values
+
+        Returns:
+            (_BlockSignature) Parsed signature
+        """
+        signature = _BlockSignature(frame.module)
 
         # Parse signature to extract parameter names and shapes.
         # Two formats may appear depending on origin:
@@ -887,12 +1304,12 @@ class BuildBlock(Instruction):
                 for fkid in inner_kids:
                     fkid_tag = comp.cop_tag(fkid)
                     if fkid_tag == "shape.define":
-                        block.input_shape = self._build_shape_from_cop(fkid, frame)
+                        signature.input_shape = self._signature_shape(signature, fkid, frame)
                         break
                     elif fkid_tag in ("value.identifier", "value.constant"):
-                        resolved = self._resolve_shape_ref(fkid, frame)
+                        resolved = self._signature_shape(signature, fkid, frame)
                         if resolved is not None:
-                            block.input_shape = resolved
+                            signature.input_shape = resolved
                         break
 
             elif field_tag in ("signature.param",):
@@ -914,9 +1331,9 @@ class BuildBlock(Instruction):
                         if default_kids:
                             param_default = frame.eval(default_kids[0])
                     elif fkid_tag == "shape.define":
-                        param_type_shape = self._build_shape_from_cop(fkid, frame)
+                        param_type_shape = self._signature_shape(signature, fkid, frame)
                     else:
-                        resolved = self._resolve_shape_ref(fkid, frame)
+                        resolved = self._signature_shape(signature, fkid, frame)
                         if resolved is not None:
                             param_type_shape = resolved
 
@@ -942,9 +1359,9 @@ class BuildBlock(Instruction):
                         if default_kids:
                             param_default = frame.eval(default_kids[0])
                     elif fkid_tag == "shape.define":
-                        param_type_shape = self._build_shape_from_cop(fkid, frame)
+                        param_type_shape = self._signature_shape(signature, fkid, frame)
                     else:
-                        resolved = self._resolve_shape_ref(fkid, frame)
+                        resolved = self._signature_shape(signature, fkid, frame)
                         if resolved is not None:
                             param_type_shape = resolved
 
@@ -963,14 +1380,14 @@ class BuildBlock(Instruction):
                 for fkid in inner_kids:
                     fkid_tag = comp.cop_tag(fkid)
                     if fkid_tag == "shape.define":
-                        deliver_shape = self._build_shape_from_cop(fkid, frame)
+                        deliver_shape = self._signature_shape(signature, fkid, frame)
                         continue
-                    resolved = self._resolve_shape_ref(fkid, frame)
+                    resolved = self._signature_shape(signature, fkid, frame)
                     if resolved is not None:
                         deliver_shape = resolved
                         break
 
-                block.deliver_specs.append({
+                signature.deliver_specs.append({
                     "name": deliver_name,
                     "shape": deliver_shape,
                 })
@@ -987,43 +1404,50 @@ class BuildBlock(Instruction):
                 for fkid in field_kids:
                     fkid_tag = comp.cop_tag(fkid)
                     if fkid_tag == "shape.define":
-                        param_shape = self._build_shape_from_cop(fkid, frame)
+                        param_shape = self._signature_shape(signature, fkid, frame)
                         break
                     elif fkid_tag in ("value.identifier", "value.constant", "value.namespace"):
-                        resolved = self._resolve_shape_ref(fkid, frame)
+                        resolved = self._signature_shape(signature, fkid, frame)
                         if resolved is not None:
                             param_shape = resolved
                         break
 
                 if legacy_index == 0:
                     if param_name:
-                        block.input_name = param_name
+                        signature.input_name = param_name
                     if param_shape is not None:
-                        block.input_shape = param_shape
+                        signature.input_shape = param_shape
                 elif legacy_index == 1:
                     if param_name:
-                        block.arg_name = param_name
+                        signature.arg_name = param_name
                     if param_shape is not None:
-                        block.arg_shape = param_shape
+                        signature.arg_shape = param_shape
                 legacy_index += 1
 
         # Build arg Shape from accumulated !param fields.
         if param_fields:
             arg_shape = comp.Shape("args", private=False)
             arg_shape.fields = param_fields
-            block.arg_shape = arg_shape
-            block.param_names = [f.name for f in param_fields if f.name]
+            signature.arg_shape = arg_shape
+            signature.param_names = [f.name for f in param_fields if f.name]
 
         if coupling_fields:
             dependency_shape = comp.Shape("dependency", private=False)
             dependency_shape.fields = coupling_fields
-            block.dependency_shape = dependency_shape
-            block.dependency_names = [f.name for f in coupling_fields if f.name]
+            signature.dependency_shape = dependency_shape
+            signature.dependency_names = [f.name for f in coupling_fields if f.name]
 
-        callable = comp.Callable(block.qualified)
-        callable.add(block)
-        result = comp.Value(callable)
-        return frame.set_result(result)
+        return signature
+
+    def _signature_shape(self, signature, fkid, frame):
+        """Resolve a shape in the signature, noting on it when that fails."""
+        if comp.cop_tag(fkid) == "shape.define":
+            shape = self._build_shape_from_cop(fkid, frame)
+        else:
+            shape = self._resolve_shape_ref(fkid, frame)
+        if shape is None:
+            signature.resolved = False
+        return shape
 
     def _resolve_shape_ref(self, fkid, frame):
         """Resolve a COP node that references a shape by name (value.identifier etc.).
@@ -1257,11 +1681,11 @@ class BuildBlock(Instruction):
             if id_kids:
                 name = id_kids[0].to_python("value")
                 if name == "nil":
-                    return comp.Value.from_python(comp.tag_nil)
+                    return comp.value_nil
                 elif name == "true":
-                    return comp.Value.from_python(comp.tag_true)
+                    return comp.value_true
                 elif name == "false":
-                    return comp.Value.from_python(comp.tag_false)
+                    return comp.value_false
         # For complex expressions, return None (no default)
         return None
 
@@ -1853,9 +2277,9 @@ def _format_fail_message(msg, frame):
     parsed = comp._fmt.parse_format_text(msg)
     if all(isinstance(seg, str) for seg in parsed):
         return msg
-    _nil = comp.Value.from_python(comp.tag_nil)
-    scope = {comp.Value.from_python(k): v for k, v in frame.env.items() if "." not in k}
-    scope[comp.Value.from_python("$")] = frame._dollar_vars.get("$", _nil)
+    _nil = comp.value_nil
+    scope = {comp.text_key(k): v for k, v in frame.env.items() if "." not in k}
+    scope[comp.text_key("$")] = frame._dollar_vars.get("$", _nil)
     return comp._fmt.apply_format(parsed, comp.Value(scope))
 
 
@@ -1920,12 +2344,11 @@ class MergeWithPiped(Instruction):
 
     def execute(self, frame):
         result = frame.get_value(self.result_reg)
-        _nil = comp.Value.from_python(comp.tag_nil)
+        _nil = comp.value_nil
         piped = frame._dollar_vars.get("$", _nil)
         if not isinstance(piped.data, dict) or not isinstance(result.data, dict):
             return frame.set_result(result)
-        merged = dict(piped.data)
-        merged.update(result.data)
+        merged = comp.struct_update(piped.data, result.data.items())
         return frame.set_result(comp.Value(merged))
 
     def format(self, idx):
@@ -2022,18 +2445,18 @@ class PipeFallback(Instruction):
             return frame.set_result(frame.get_value(self.piped_reg))
         # Failure — clear it and invoke the handler with failure as piped input
         frame.failure = None
-        frame._pipeline_delivery = {}
+        frame._pipeline_delivery = comp._interp._EMPTY_MAP
         callable_frame = frame._make_child_frame(dict(frame.env), module=frame.module)
         callable_val = callable_frame.run(self.callable_instructions)
         args_frame = frame._make_child_frame(dict(frame.env), module=frame.module)
         args_val = args_frame.run(self.args_instructions)
         if args_val is None:
-            args_val = comp.Value.from_python({})
+            args_val = comp.value_empty
         try:
             result = frame.invoke_block(callable_val, args_val, piped=failure, source_cop=self.cop)
-            frame._pipeline_delivery = dict(getattr(frame, "_last_delivery", {}) or {})
+            frame._pipeline_delivery = frame._last_delivery
         except comp.CompFail as e:
-            frame._pipeline_delivery = {}
+            frame._pipeline_delivery = comp._interp._EMPTY_MAP
             frame.failure = e.value
             return frame.set_result(e.value)
         return frame.set_result(result)
@@ -2055,71 +2478,176 @@ class DispatchOn(Instruction):
 
     Both lists are run in child frames that share the current
     lexical environment so that !let bindings remain accessible.
+
+    Patterns that are a single constant are taken straight from the
+    instruction.  Patterns built only from namespace references (named or
+    anonymous shapes) are evaluated the first time they are needed and
+    then reused.  Only patterns that read locals are rebuilt on every
+    dispatch.
     """
 
     def __init__(self, cop, condition, branches):
         super().__init__(cop)
         self.condition = condition  # int register index of the condition value
         self.branches = branches  # list of (pattern_instructions, result_instructions)
+        # Pattern value per branch once known, None until then
+        self.patterns = [_constant_pattern(pattern) for pattern, _ in branches]
+        # Whether a branch pattern can be evaluated once and reused
+        self.static = [_static_pattern(pattern) for pattern, _ in branches]
 
     def execute(self, frame):
         condition_val = frame.get_value(self.condition)
+        index = self._match(condition_val, frame)
+        if index is None:
+            # No branch matched — return nil (not an error)
+            return frame.set_result(comp.value_nil)
+        return self._run_branch(index, frame)
+
+    def _match(self, condition_val, frame):
+        """Index of the first branch whose pattern matches, or None."""
+        for index, (pattern_instructions, _) in enumerate(self.branches):
+            pattern_val = self._pattern(index, frame)
+            if pattern_val is not None and _pattern_matches(condition_val, pattern_val, frame):
+                return index
+        return None
+
+    def _pattern(self, index, frame):
+        """Get the pattern value of a branch, evaluating it if needed."""
+        pattern_val = self.patterns[index]
+        if pattern_val is not None:
+            return pattern_val
+        # Build the shape/tag pattern in a child frame sharing current env
+        pattern_frame = frame._make_child_frame(dict(frame.env), module=frame.module)
+        pattern_frame._dollar_vars = frame._dollar_vars
+        pattern_val = pattern_frame.run(self.branches[index][0])
+        if self.static[index] and pattern_val is not None:
+            self.patterns[index] = pattern_val
+        return pattern_val
+
+    def _run_branch(self, index, frame):
+        """Run the result instructions of the matched branch."""
+        result_frame = frame._make_child_frame(frame.env, module=frame.module)
+        result_frame._dollar_vars = frame._dollar_vars
+        # Propagate branch failure to the parent frame so fast-forward
+        # continues and invoke_block can detect and raise it.
+        result = result_frame.run(self.branches[index][1])
+        if result_frame._delivered_coupling:
+            frame._delivered_coupling = {**frame._delivered_coupling, **result_frame._delivered_coupling}
+        if result_frame._last_delivery:
+            frame._last_delivery = {**frame._last_delivery, **result_frame._last_delivery}
+        if result_frame.failure is not None:
+            frame.failure = result_frame.failure
+        return frame.set_result(result)
+
+    def format(self, idx):
+        return f"%{idx}  DispatchOn %{self.condition} ({len(self.branches)} branches)"
 
-        for pattern_instructions, result_instructions in self.branches:
-            # Build the shape/tag pattern in a child frame sharing current env
-            pattern_frame = frame._make_child_frame(dict(frame.env), module=frame.module)
-            pattern_frame._dollar_vars = dict(frame._dollar_vars)
-            pattern_val = pattern_frame.run(pattern_instructions)
 
-            if pattern_val is None:
-                continue
+class DispatchOnTags(DispatchOn):
+    """Pattern dispatch where every branch pattern is a constant.
 
-            pattern_data = pattern_val.data
-
-            # morph() accepts Shape, ShapeUnion, and Tag — pass the raw data object.
-            # For anything else (e.g. a bare constant), fall back to equality.
-            if isinstance(pattern_data, (comp.Shape, comp.ShapeUnion, comp.Tag)):
-                morph_result = comp.morph(condition_val, pattern_data, frame)
-                matched = not morph_result.failure_reason
-                # Dispatch requires exact unit matching — a sibling unit score of 1
-                # means "same family but different unit" (e.g. ~num#year matching
-                # 1#week because both are measure.time.*).  Reject those: the user
-                # wrote ~num#year to mean exactly year-units, not any time unit.
-                if matched and morph_result.score[2] == 1:
-                    matched = False
-                # Leaf-tag identity: morph rejects depth-0 matches (tags are
-                # abstract shape roots, not values).  For exact leaf-tag dispatch
-                # (e.g. ~true, ~false, ~nil, ~less) fall back to qualified-name
-                # equality so condition_val bearing that exact tag still matches.
-                if not matched and isinstance(pattern_data, comp.Tag) and isinstance(condition_val.data, comp.Tag):
-                    matched = (condition_val.data.qualified == pattern_data.qualified)
-            else:
-                # Direct equality: the condition must produce the same value
-                matched = (comp._ops.compare("==", condition_val, pattern_val).data is comp.tag_true)
-
-            if matched:
-                result_frame = frame._make_child_frame(frame.env, module=frame.module)
-                result_frame._dollar_vars = dict(frame._dollar_vars)
-                # Propagate branch failure to the parent frame so fast-forward
-                # continues and invoke_block can detect and raise it.
-                result = result_frame.run(result_instructions)
-                frame._delivered_coupling.update(getattr(result_frame, "_delivered_coupling", {}) or {})
-                frame._last_delivery.update(getattr(result_frame, "_last_delivery", {}) or {})
-                if result_frame.failure is not None:
-                    frame.failure = result_frame.failure
-                return frame.set_result(result)
-
-        # No branch matched — return nil (not an error)
-        return frame.set_result(comp.Value(comp.tag_nil))
+    Emitted by codegen for the common ``!on`` over constant tags and
+    shapes (``~true``/``~false``, ``~flow-control``, ``~nil``, ``~any``).
+    When the condition is a tag, the matching branch depends only on that
+    tag, so the result of matching is remembered in a jump table keyed by
+    the tag.  Later dispatches on the same tag go straight to the branch
+    without any morphing.  Other conditions match like DispatchOn, but
+    never need to build a pattern.
+    """
+
+    def __init__(self, cop, condition, branches):
+        super().__init__(cop, condition, branches)
+        self.jump = {}  # Tag -> branch index, or None when no branch matches
+        self.tabled = None  # Whether the jump table may be used, decided on first run
+
+    def execute(self, frame):
+        condition_val = frame.get_value(self.condition)
+        data = condition_val.data
+        if self.tabled is None:
+            # Shapes with limits may run code per value, so their outcome
+            # is not a property of the tag alone
+            self.tabled = not any(
+                comp._interp._has_limits(pattern.data)
+                for pattern in self.patterns
+                if isinstance(pattern.data, (comp.Shape, comp.ShapeUnion))
+            )
+        if self.tabled and isinstance(data, comp.Tag) and condition_val.unit is None:
+            index = self.jump.get(data, _NO_ENTRY)
+            if index is _NO_ENTRY:
+                index = self.jump[data] = self._match(condition_val, frame)
+        else:
+            index = self._match(condition_val, frame)
+        if index is None:
+            return frame.set_result(comp.value_nil)
+        return self._run_branch(index, frame)
 
     def format(self, idx):
-        return f"%{idx}  DispatchOn %{self.condition} ({len(self.branches)} branches)"
+        return f"%{idx}  DispatchOnTags %{self.condition} ({len(self.branches)} branches)"
+
+
+_NO_ENTRY = object()
+
+# Instructions a pattern may contain and still be evaluated only once
+_STATIC_PATTERN_TYPES = (
+    Const, LoadVar, LoadOverload,
+    BuildShape, BuildShapeUnion, BuildShapeWithLimits, BuildShapeCollection,
+)
+
+
+def _constant_pattern(pattern_instructions):
+    """Pattern value of a branch that is a single Const, else None."""
+    if len(pattern_instructions) == 1 and isinstance(pattern_instructions[0], Const):
+        return pattern_instructions[0].value
+    return None
+
+
+def _static_pattern(pattern_instructions):
+    """True if a branch pattern only depends on constants and namespace names."""
+    return all(isinstance(instr, _STATIC_PATTERN_TYPES) for instr in pattern_instructions)
+
+
+def _pattern_matches(condition_val, pattern_val, frame):
+    """Test a condition value against one !on branch pattern.
+
+    Args:
+        condition_val: (Value) Value being dispatched on
+        pattern_val: (Value) Branch pattern, usually a Shape or Tag
+        frame: (ExecutionFrame) Frame used to run morph limits
+
+    Returns:
+        (bool) True if the branch should run
+    """
+    pattern_data = pattern_val.data
+
+    # morph() accepts Shape, ShapeUnion, and Tag — pass the raw data object.
+    # For anything else (e.g. a bare constant), fall back to equality.
+    if isinstance(pattern_data, (comp.Shape, comp.ShapeUnion, comp.Tag)):
+        morph_result = comp.morph(condition_val, pattern_data, frame)
+        matched = not morph_result.failure_reason
+        # Dispatch requires exact unit matching — a sibling unit score of 1
+        # means "same family but different unit" (e.g. ~num#year matching
+        # 1#week because both are measure.time.*).  Reject those: the user
+        # wrote ~num#year to mean exactly year-units, not any time unit.
+        if matched and morph_result.score[2] == 1:
+            matched = False
+        # Leaf-tag identity: morph rejects depth-0 matches (tags are
+        # abstract shape roots, not values).  For exact leaf-tag dispatch
+        # (e.g. ~true, ~false, ~nil, ~less) fall back to qualified-name
+        # equality so condition_val bearing that exact tag still matches.
+        if not matched and isinstance(pattern_data, comp.Tag) and isinstance(condition_val.data, comp.Tag):
+            matched = (condition_val.data.qualified == pattern_data.qualified)
+        return matched
+    # Direct equality: the condition must produce the same value
+    return comp._ops.compare("==", condition_val, pattern_val).data is comp.tag_true
 
 
 def _ensure_definition_value(defn, frame):
     """Lazily populate a definition's value if needed."""
     if defn.value is not None:
         return defn.value
+    interp = frame.interp
+    if interp is not None and id(defn) in interp._pending_definitions:
+        return interp.build_definition(defn)
     if defn.original_cop:
         cop_tag = comp.cop_tag(defn.original_cop)
         if cop_tag == "value.block":
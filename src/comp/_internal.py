@@ -8,7 +8,8 @@ __all__ = [
 ]
 
 import copy
-import inspect
+import importlib
+import itertools
 import sys
 import comp
 import comp._colorize
@@ -85,11 +86,7 @@ class InternalModule(comp.Module):
         super().__init__(source)
         self._interp_phase = 2  # Internal modules are always fully available
 
-        docs = [{"content": doc}]
-        scan = {
-            "docs": comp.Value.from_python(docs)
-        }
-        self._scan = comp.Value.from_python(scan)
+        self._scan = comp._scan.ScanResult([], [comp._scan.Comment(doc)])
         self._imports = {}
         self._definitions = {}
 
@@ -347,7 +344,7 @@ def _builtin_tee(input_val, args_val, frame):
     """
     expr_val = args_val.positional(0)
     if expr_val is not None:
-        frame.invoke_block(expr_val, comp.Value.from_python({}), piped=input_val)
+        frame.invoke_block(expr_val, comp.value_empty, piped=input_val)
     return input_val
 
 
@@ -396,7 +393,7 @@ def _builtin_fit(input_val, args_val, frame):
     le_int = comp.num_floor_int(le_val)
     modulus = le_int - ge_int + 1
     result = (v - ge_int) % modulus + ge_int
-    return comp.Value((result, 1, 0))
+    return comp.int_value(result)
 
 
 def _builtin_wrap(input_val, args_val, frame):
@@ -408,13 +405,13 @@ def _builtin_wrap(input_val, args_val, frame):
     # invokable instead of passing through each wrapper
     # input_val is ~(callable input args)
     ctx = input_val.data
-    callable_val = ctx.get(comp.Value.from_python("callable"))
-    inner_input = ctx.get(comp.Value.from_python("input"))
-    inner_args = ctx.get(comp.Value.from_python("args"))
+    callable_val = ctx.get(comp.text_key("callable"))
+    inner_input = ctx.get(comp.text_key("input"))
+    inner_args = ctx.get(comp.text_key("args"))
 
     # Invoke: inner_input | callable(inner_args)
     if callable_val is None:
-        return comp.Value.from_python(None)
+        return comp.value_nil
 
     # callable_val is already a Value from struct.get()
     return frame.invoke_block(callable_val, inner_args, inner_input)
@@ -527,8 +524,7 @@ def _builtin_item_at(input_val, args_val, frame):
     if index >= len(input_val.data):
         raise comp.CodeError(f"item-at index {index} outside struct length")
 
-    items = list(input_val.data.items())
-    item = items[index]
+    item = comp.struct_item(input_val.data, index)
 
     if isinstance(item[0], comp.Unnamed):
         item = [item[1]]
@@ -594,16 +590,29 @@ def _builtin_merge(input_val, args_val, frame):
     if len(input_val.data) == 0:
         raise comp.CodeError("merge input must not be empty")
 
-    result = {}
-    for container in input_val.data.values():
+    containers = list(input_val.data.values())
+    for container in containers:
         if container.shape != comp.shape_struct:
             raise comp.CodeError("merge input values must be structs")
+
+    first = containers[0].data
+    if len(first) >= comp.PERSISTENT_THRESHOLD:
+        # Large leading struct: share its storage and only set the new fields
+        return comp.Value(comp.struct_update(first, _merge_fields(containers[1:])))
+
+    result = comp.Struct()
+    for key, value in _merge_fields(containers):
+        result[key] = value
+    return comp.Value(result)
+
+
+def _merge_fields(containers):
+    """Yield the (key, value) fields of merged structs, renewing unnamed keys."""
+    for container in containers:
         for key, value in container.data.items():
             if isinstance(key, comp.Unnamed):
                 key = comp.Unnamed()
-            result[key] = value
-
-    return comp.Value.from_python(result)
+            yield key, value
 
 
 def _builtin_forever(input_val, args_val, frame):
@@ -641,11 +650,11 @@ def _builtin_forever(input_val, args_val, frame):
     if block_val is None:
         raise comp.CodeError("forever requires a callable as positional argument")
 
-    _empty_args = comp.Value.from_python({})
+    invoke = frame.block_loop(block_val)
     acc = input_val
 
     while True:
-        value = frame.invoke_block(block_val, _empty_args, piped=acc)
+        value = invoke(acc)
         if isinstance(value.data, comp.Tag):
             if value.data is comp.tag_flow_stop:
                 break
@@ -698,13 +707,13 @@ def _builtin_invoke(input_val, args_val, frame):
     if not isinstance(ctx, dict):
         raise comp.CodeError("invoke requires invoke-data as piped input")
 
-    _key = comp.Value.from_python
+    _key = comp.text_key
     statement = ctx.get(_key("statement"))
     input_v   = ctx.get(_key("input"))
-    params    = ctx.get(_key("params")) or comp.Value.from_python({})
+    params    = ctx.get(_key("params")) or comp.value_empty
 
     if statement is None:
-        return comp.Value.from_python(comp.tag_nil)
+        return comp.value_nil
 
     if isinstance(statement.data, (comp.Callable, comp.InternalCallable)):
         return frame.invoke_block(statement, params, piped=input_v)
@@ -723,7 +732,7 @@ def _clone_block_with_extra(body_block, extra_instr):
     """
     new_block = copy.copy(body_block)
     if body_block.body_instructions is not None:
-        last_reg = len(body_block.body_instructions) - 1
+        last_reg = comp._instructions._register_count(body_block.body_instructions) - 1
         new_block.body_instructions = list(body_block.body_instructions) + [
             extra_instr(last_reg)
         ]
@@ -750,7 +759,7 @@ def _builtin_update(input_val, args_val, frame):
     if not isinstance(ctx, dict):
         raise comp.CodeError("update requires invoke-data as piped input")
 
-    _key = comp.Value.from_python
+    _key = comp.text_key
     statement = ctx.get(_key("statement"))
 
     if statement is None:
@@ -820,7 +829,7 @@ def _builtin_flat(input_val, args_val, frame):
 
     # Wrapper mode: input is invoke-data (has a "statement" key)
     if isinstance(input_val.data, dict):
-        _key = comp.Value.from_python
+        _key = comp.text_key
         statement = input_val.data.get(_key("statement"))
         inner_input = input_val.data.get(_key("input"))
 
@@ -875,11 +884,11 @@ def _builtin_reduce(input_val, args_val, frame):
     args_data = args_val.data if isinstance(args_val.data, dict) else {}
 
     # Get initial accumulator from :initial named arg
-    _key = comp.Value.from_python
+    _key = comp.text_key
     initial_key = _key("initial")
     acc = args_data.get(initial_key)
     if acc is None:
-        acc = comp.Value(comp.tag_nil)
+        acc = comp.value_nil
 
     # Get fold callable from the first positional arg
     fold_val = None
@@ -894,7 +903,7 @@ def _builtin_reduce(input_val, args_val, frame):
     # Iterate over input struct fields in order
     items = list(input_val.data.values()) if isinstance(input_val.data, dict) else []
 
-    _empty_args = comp.Value.from_python({})
+    _empty_args = comp.value_empty
     for item in items:
         # Pass item as the first positional arg, acc as piped input
         item_args = comp.Value({comp.Unnamed(): item})
@@ -967,21 +976,21 @@ def _builtin_fmt(input_val, args_val, frame):
 
     # Wrapper mode: input is invoke-data (has a "statement" key)
     if isinstance(input_val.data, dict):
-        stmt_key = comp.Value.from_python("statement")
+        stmt_key = comp.text_key("statement")
         if stmt_key in input_val.data:
             stmt = input_val.data[stmt_key]
             if stmt is None or stmt.shape is not comp.shape_text:
                 raise comp.CodeError("@fmt requires a text statement")
-            locals_val = input_val.data.get(comp.Value.from_python("locals"))
-            input_from_data = input_val.data.get(comp.Value.from_python("input"))
+            locals_val = input_val.data.get(comp.text_key("locals"))
+            input_from_data = input_val.data.get(comp.text_key("input"))
             parsed = _fmt.parse_format_text(stmt.data)
             # In wrapper mode, %(name) resolves from the current scope (locals).
             # Bake the piped-input value ($) into a derived scope so %($)
             # resolves to the value that was piped into the wrapped block.
             base = dict(locals_val.data) if locals_val is not None and isinstance(locals_val.data, dict) else {}
             if input_from_data is not None:
-                base[comp.Value.from_python("$")] = input_from_data
-            scope = comp.Value(base) if base else comp.Value.from_python({})
+                base[comp.text_key("$")] = input_from_data
+            scope = comp.Value(base) if base else comp.value_empty
             result = _fmt.apply_format(parsed, scope)
             return comp.Value.from_python(result)
 
@@ -1015,7 +1024,7 @@ def _builtin_fmt(input_val, args_val, frame):
                         # Annotate the spec string with the template unit so
                         # the substitute overload can dispatch on it (spec~text[unit])
                         spec_annotated = comp.Value.from_python(spec_str).with_unit(ut)
-                        args = comp.Value({comp.Value.from_python("spec"): spec_annotated})
+                        args = comp.Value({comp.text_key("spec"): spec_annotated})
                         result = fr.invoke_block(sv, args, piped=val)
                         if result is None:
                             return ""
@@ -1043,7 +1052,7 @@ def _builtin_get_unit_tag(input_val, args_val, frame):
     """
     unit = input_val.unit
     if unit is None:
-        return comp.Value.from_python(None)  # nil
+        return comp.value_nil  # nil
     return comp.Value.from_python(unit)
 
 
@@ -1063,10 +1072,10 @@ def _builtin_namespace_lookup(input_val, args_val, frame):
       42   | namespace-lookup "substitute"   // → :nil  (not a tag)
     """
     if not isinstance(input_val.data, comp.Tag):
-        return comp.Value.from_python(None)  # nil — not a tag
+        return comp.value_nil  # nil — not a tag
     tag = input_val.data
     if tag.module is None:
-        return comp.Value.from_python(None)  # nil — tag has no owning module
+        return comp.value_nil  # nil — tag has no owning module
     name_val = args_val.positional(0)
     if name_val is None or name_val.shape is not comp.shape_text:
         raise comp.CodeError("namespace-lookup requires a text name argument")
@@ -1075,17 +1084,17 @@ def _builtin_namespace_lookup(input_val, args_val, frame):
     ns = tag.module.namespace()
     entry = ns.get(name)
     if entry is None:
-        return comp.Value.from_python(None)
+        return comp.value_nil
     if isinstance(entry, comp.Callable):
         # Build the Callable and return
         try:
             return comp._instructions._load_name(name, frame)
         except NameError:
-            return comp.Value.from_python(None)
+            return comp.value_nil
     # Single Definition
     if hasattr(entry, "value") and entry.value is not None:
         return entry.value
-    return comp.Value.from_python(None)
+    return comp.value_nil
 
 
 def _resolve_from_module(name, module, frame):
@@ -1207,7 +1216,7 @@ def _builtin_dispatch(input_val, args_val, frame):
         )
 
     # Invoke with original piped input and forwarded args
-    forwarded_args = comp.Value(forwarded) if forwarded else comp.Value.from_python({})
+    forwarded_args = comp.Value(forwarded) if forwarded else comp.value_empty
     return frame.invoke_block(callable_val, forwarded_args, piped=input_val)
 
 
@@ -1232,6 +1241,7 @@ def _builtin_promote_root(input_val, args_val, frame):
         field = name_val.data
     key = comp.Value.from_python(field)
     input_val.data[key] = input_val
+    input_val._hash = None  # Cached from the data before the new field
     return input_val
 
 
@@ -1286,7 +1296,7 @@ def _builtin_substitute(input_val, args_val, frame):
     # Extract optional spec argument (named :spec= or first positional)
     spec = ""
     if isinstance(args_val.data, dict):
-        spec_key = comp.Value.from_python("spec")
+        spec_key = comp.text_key("spec")
         spec_val = args_val.data.get(spec_key)
         if spec_val is not None and isinstance(spec_val.data, str):
             spec = spec_val.data
@@ -1316,17 +1326,33 @@ def _builtin_substitute(input_val, args_val, frame):
 
 # Registry of internal modules
 _internal_registered = {}
+_internal_sources = {}
 _internal_modules = {}
 
 
-def register_internal_module(resource):
-    """Decorator for registering internal modules to a create function."""
+def register_internal_module(resource, source=None):
+    """Decorator for registering internal modules to a create function.
+
+    With *source*, records the Python module that registers the create
+    function instead; it is imported the first time the internal module
+    is requested.
+    """
+    if source is not None:
+        _internal_sources[resource] = source
+        return None
+
     def fn(callback):
         _internal_registered[resource] = callback
         return callback
     return fn
 
 
+register_internal_module("cop", "comp._cop")
+register_internal_module("cob", "comp._cob")
+register_internal_module("py", "comp._py")
+register_internal_module("fs-native", "comp._fs")
+
+
 def _builtin_cop_tag(input_val, args_val, frame):
     """Get the tag name of a COP node as text.
 
@@ -1372,32 +1398,32 @@ def _builtin_is_pure(input_val, args_val, frame):
     """
     name_val = args_val.positional(0)
     if name_val is None or not isinstance(name_val.data, str):
-        return comp.Value.from_python(False)
+        return comp.value_false
     name = name_val.data
 
     ns = input_val.data
     if not isinstance(ns, dict):
-        return comp.Value.from_python(False)
+        return comp.value_false
 
     # Namespace was converted via from_python so keys are Value(str)
-    name_key = comp.Value.from_python(name)
+    name_key = comp.text_key(name)
     entry_val = ns.get(name_key)
     if entry_val is None:
-        return comp.Value.from_python(False)
+        return comp.value_false
 
     # Unwrap: from_python wraps Callable in Value
     entry = entry_val.data if isinstance(entry_val, comp.Value) else entry_val
     if not isinstance(entry, comp.Callable):
-        return comp.Value.from_python(False)
+        return comp.value_false
 
     for defn in entry.entries:
         if not isinstance(defn, comp.Definition):
             continue
         if defn.shape != comp.shape_block:
-            return comp.Value.from_python(True)
+            return comp.value_true
         return comp.Value.from_python(comp._pure._is_pure_definition(defn))
 
-    return comp.Value.from_python(False)
+    return comp.value_false
 
 
 def _builtin_walk_cop(input_val, args_val, frame):
@@ -1437,7 +1463,7 @@ def _builtin_walk_cop(input_val, args_val, frame):
 
     # Extract named args
     filter_text = ""
-    initial_accum = comp.Value.from_python(comp.tag_nil)
+    initial_accum = comp.value_nil
     for k, v in args_data.items():
         if not isinstance(k, comp.Unnamed):
             key_str = k.data if hasattr(k, "data") else str(k)
@@ -1446,7 +1472,7 @@ def _builtin_walk_cop(input_val, args_val, frame):
             elif key_str == "initial":
                 initial_accum = v
 
-    _empty_args = comp.Value.from_python({})
+    _empty_args = comp.value_empty
     collected = []
 
     def walk(node, depth, accum):
@@ -1459,7 +1485,7 @@ def _builtin_walk_cop(input_val, args_val, frame):
         if matches:
             context = comp.Value.from_python({
                 "node": node,
-                "depth": comp.Value((depth, 1, 0)),
+                "depth": comp.int_value(depth),
                 "accum": accum,
             })
             result = frame.invoke_block(op_val, _empty_args, piped=context)
@@ -1468,13 +1494,13 @@ def _builtin_walk_cop(input_val, args_val, frame):
             if isinstance(result.data, comp.Tag):
                 if result.data is comp.tag_flow_skip:
                     skip_children = True
-                    result = comp.Value.from_python({})
+                    result = comp.value_empty
 
             # Extract callouts and accum from result struct
             if isinstance(result.data, dict):
-                callouts_key = comp.Value.from_python("callouts")
-                accum_key = comp.Value.from_python("accum")
-                recurse_key = comp.Value.from_python("recurse")
+                callouts_key = comp.text_key("callouts")
+                accum_key = comp.text_key("accum")
+                recurse_key = comp.text_key("recurse")
 
                 callouts_val = result.data.get(callouts_key)
                 new_accum = result.data.get(accum_key, accum)
@@ -1517,13 +1543,13 @@ def _builtin_contains_field(input_val, args_val, frame):
     Usage: struct-val | contains-field "field-name"  =>  true/false
     """
     if not isinstance(input_val.data, dict):
-        return comp.Value.from_python(comp.tag_false)
+        return comp.value_false
     field_name = args_val.positional(0)
     name = field_name.data if isinstance(field_name.data, str) else str(field_name.data)
-    key = comp.Value.from_python(name)
+    key = comp.text_key(name)
     if key in input_val.data:
-        return comp.Value.from_python(comp.tag_true)
-    return comp.Value.from_python(comp.tag_false)
+        return comp.value_true
+    return comp.value_false
 
 
 def _builtin_find_duplicates(input_val, args_val, frame):
@@ -1535,7 +1561,7 @@ def _builtin_find_duplicates(input_val, args_val, frame):
     Returns an empty struct if no duplicates found.
     """
     if not isinstance(input_val.data, dict):
-        return comp.Value.from_python({})
+        return comp.value_empty
     seen = {}
     dupes = {}
     for val in input_val.data.values():
@@ -1562,11 +1588,11 @@ def _builtin_cop_pattern_key(input_val, args_val, frame):
     """
     branch_kids = comp._cop.cop_kids(input_val)
     if not branch_kids:
-        return comp.Value.from_python(comp.tag_nil)
+        return comp.value_nil
     shape_node = branch_kids[0]  # shape.define
     shape_kids = comp._cop.cop_kids(shape_node)
     if not shape_kids:
-        return comp.Value.from_python(comp.tag_nil)
+        return comp.value_nil
     first_kid = shape_kids[0]
     tag = comp._cop.cop_tag(first_kid)
     if tag == "value.identifier":
@@ -1580,7 +1606,7 @@ def _builtin_cop_pattern_key(input_val, args_val, frame):
                     parts.append(val_node.data)
         if parts:
             return comp.Value.from_python(".".join(parts))
-    return comp.Value.from_python(comp.tag_nil)
+    return comp.value_nil
 
 
 def _builtin_apply(input_val, args_val, frame):
@@ -1656,10 +1682,14 @@ def get_internal_module(resource):
             module = SystemModule()
         else:
             callback = _internal_registered.get(resource)
+            if not callback and resource in _internal_sources:
+                importlib.import_module(_internal_sources[resource])
+                callback = _internal_registered.get(resource)
             if not callback:
                 # Todo, this is begging for an exception?
                 return None
 
+            import inspect
             doc = inspect.getdoc(callback) or ""
             module = comp.InternalModule(resource, doc)
             callback(module)
@@ -1695,7 +1725,7 @@ def _builtin_tag_owner(input_val, args_val, frame):
         resource = getattr(data.module.source, "resource", None)
         if resource is not None:
             return comp.Value.from_python(resource)
-    return comp.Value.from_python(None)
+    return comp.value_nil
 
 
 def _builtin_tag_parent(input_val, args_val, frame):
@@ -1706,25 +1736,25 @@ def _builtin_tag_parent(input_val, args_val, frame):
     """
     data = input_val.data
     if not isinstance(data, comp.Tag):
-        return comp.Value.from_python(None)
+        return comp.value_nil
 
     hierarchy = _get_hierarchy_for_tag(data)
     if hierarchy is None:
-        return comp.Value.from_python(None)
+        return comp.value_nil
 
     tag_slot = hierarchy._slot.get(data)
     if tag_slot is None:
-        return comp.Value.from_python(None)
+        return comp.value_nil
 
     parent_slot = hierarchy._parent_slot.get(tag_slot)
     if parent_slot is None:
-        return comp.Value.from_python(None)
+        return comp.value_nil
 
     # Find any tag in the parent slot
     for tag, slot in hierarchy._slot.items():
         if slot == parent_slot:
             return comp.Value.from_python(tag)
-    return comp.Value.from_python(None)
+    return comp.value_nil
 
 
 def _builtin_tag_children(input_val, args_val, frame):
@@ -1735,20 +1765,20 @@ def _builtin_tag_children(input_val, args_val, frame):
     """
     data = input_val.data
     if not isinstance(data, comp.Tag):
-        return comp.Value.from_python({})
+        return comp.value_empty
 
     hierarchy = _get_hierarchy_for_tag(data)
     if hierarchy is None:
-        return comp.Value.from_python({})
+        return comp.value_empty
 
     my_slot = hierarchy._slot.get(data)
     if my_slot is None:
-        return comp.Value.from_python({})
+        return comp.value_empty
 
     # Find slots whose parent is my_slot
     child_slots = {s for s, p in hierarchy._parent_slot.items() if p == my_slot}
     if not child_slots:
-        return comp.Value.from_python({})
+        return comp.value_empty
 
     # Collect one representative tag per child slot
     children = []
@@ -1772,15 +1802,15 @@ def _builtin_tag_ancestors(input_val, args_val, frame):
     """
     data = input_val.data
     if not isinstance(data, comp.Tag):
-        return comp.Value.from_python({})
+        return comp.value_empty
 
     hierarchy = _get_hierarchy_for_tag(data)
     if hierarchy is None:
-        return comp.Value.from_python({})
+        return comp.value_empty
 
     tag_slot = hierarchy._slot.get(data)
     if tag_slot is None:
-        return comp.Value.from_python({})
+        return comp.value_empty
 
     ancestors = []
     current = tag_slot
@@ -1808,15 +1838,15 @@ def _builtin_tag_is_ancestor(input_val, args_val, frame):
     """
     data = input_val.data
     if not isinstance(data, comp.Tag):
-        return comp.Value.from_python(False)
+        return comp.value_false
 
     ancestor_val = args_val.positional(0)
     if ancestor_val is None or not isinstance(ancestor_val.data, comp.Tag):
-        return comp.Value.from_python(False)
+        return comp.value_false
 
     hierarchy = _get_hierarchy_for_tag(data)
     if hierarchy is None:
-        return comp.Value.from_python(False)
+        return comp.value_false
 
     depth = hierarchy.ancestor_depth(data, ancestor_val.data)
     return comp.Value.from_python(depth is not None)
@@ -1833,3 +1863,228 @@ def _get_hierarchy_for_tag(tag):
         return None
     return getattr(module, "tag_hierarchy", None)
 
+
+@register_internal_module("loop-native")
+def _create_loop_native_module(module):
+    """Native struct iteration used by the loop stdlib module.
+
+    Each function walks its input struct once and builds the result in a
+    single dict, so the cost is linear in the number of fields.  The loop
+    module wraps these with its documented signatures; the callables here
+    take their arguments positionally, in the order listed on each one.
+    """
+    module.add_callable("iterate", _loop_iterate, pure=True, input_shape=comp.shape_struct)
+    module.add_callable("generate", _loop_generate, pure=True)
+    module.add_callable("map", _loop_map, pure=True, input_shape=comp.shape_struct)
+    module.add_callable("where", _loop_where, pure=True, input_shape=comp.shape_struct)
+    module.add_callable("reduce", _loop_reduce, pure=True, input_shape=comp.shape_struct)
+    module.add_callable("some", _loop_some, pure=True, input_shape=comp.shape_struct)
+    module.add_callable("every", _loop_every, pure=True, input_shape=comp.shape_struct)
+    module.add_callable("slice", _loop_slice, pure=True, input_shape=comp.shape_struct)
+    module.add_callable("reverse", _loop_reverse, pure=True, input_shape=comp.shape_struct)
+
+
+def _loop_args(args_val, name, count):
+    """Get the leading positional arguments for a loop-native callable.
+
+    Args:
+        args_val: (Value) Argument struct
+        name: (str) Callable name for error messages
+        count: (int) Number of positional arguments required
+
+    Returns:
+        (list) The first ``count`` positional argument Values
+    """
+    args_data = args_val.data if isinstance(args_val.data, dict) else {}
+    found = [v for k, v in args_data.items() if isinstance(k, comp.Unnamed)]
+    if len(found) < count:
+        raise comp.CodeError(f"{name} requires {count} positional argument(s)")
+    return found[:count]
+
+
+def _loop_flow(value):
+    """Classify a block result as "stop", "skip", or None for a plain value."""
+    data = value.data
+    if data is comp.tag_flow_stop:
+        return "stop"
+    if data is comp.tag_flow_skip:
+        return "skip"
+    return None
+
+
+def _loop_test(value, name):
+    """Convert a predicate result to a Python bool, failing on non-booleans."""
+    if value.data is comp.tag_true:
+        return True
+    if value.data is comp.tag_false:
+        return False
+    raise comp.CodeError(f"{name} test must return true or false, got {value.format()}")
+
+
+def _loop_iterate(input_val, args_val, frame):
+    """Call a block for each field, collecting non-skip results.
+
+    The op block receives {position item accum} as piped input, where item
+    is the single-field struct at that position and accum is the previous
+    result.  Returning skip omits the result and keeps the previous accum;
+    returning stop ends the loop.
+
+    Args (positional): op
+    """
+    op_val, = _loop_args(args_val, "iterate", 1)
+    invoke = frame.block_loop(op_val)
+    position_key = comp.text_key("position")
+    item_key = comp.text_key("item")
+    accum_key = comp.text_key("accum")
+    accum = comp.value_nil
+    result = comp.Struct()
+    for pos, (key, value) in enumerate(input_val.data.items()):
+        if isinstance(key, comp.Unnamed):
+            entry = comp.Value({comp.Unnamed(): value})
+        else:
+            entry = comp.Value({key: value})
+        state = comp.Value({
+            position_key: comp.int_value(pos),
+            item_key: entry,
+            accum_key: accum,
+        })
+        value = invoke(state)
+        flow = _loop_flow(value)
+        if flow == "stop":
+            break
+        if flow is None:
+            result[comp.Unnamed()] = value
+            accum = value
+    return comp.Value(result)
+
+
+def _loop_generate(input_val, args_val, frame):
+    """Collect states produced by repeatedly calling a block until stop.
+
+    The piped input is the first state.  Each call receives the current
+    state and returns the next one; the current state is collected when
+    the call returns a plain value.  Returning skip collects nothing and
+    calls the block again with the same state.
+
+    Args (positional): gen
+    """
+    gen_val, = _loop_args(args_val, "generate", 1)
+    invoke = frame.block_loop(gen_val)
+    state = input_val
+    result = comp.Struct()
+    while True:
+        following = invoke(state)
+        flow = _loop_flow(following)
+        if flow == "stop":
+            break
+        if flow == "skip":
+            continue
+        result[comp.Unnamed()] = state
+        state = following
+    return comp.Value(result)
+
+
+def _loop_map(input_val, args_val, frame):
+    """Transform each field value, dropping field names.
+
+    Args (positional): transform
+    """
+    transform_val, = _loop_args(args_val, "map", 1)
+    invoke = frame.block_loop(transform_val)
+    result = comp.Struct()
+    for value in input_val.data.values():
+        value = invoke(value)
+        flow = _loop_flow(value)
+        if flow == "stop":
+            break
+        if flow is None:
+            result[comp.Unnamed()] = value
+    return comp.Value(result)
+
+
+def _loop_where(input_val, args_val, frame):
+    """Keep the field values where a predicate returns true.
+
+    Args (positional): test
+    """
+    test_val, = _loop_args(args_val, "where", 1)
+    invoke = frame.block_loop(test_val)
+    result = comp.Struct()
+    for value in input_val.data.values():
+        if _loop_test(invoke(value), "where"):
+            result[comp.Unnamed()] = value
+    return comp.Value(result)
+
+
+def _loop_reduce(input_val, args_val, frame):
+    """Fold field values into an accumulator.
+
+    The fold block receives the accumulator as piped input and the item as
+    its first positional argument.  Returning skip leaves the accumulator
+    unchanged; returning stop ends the fold early.
+
+    Args (positional): initial, fold
+    """
+    accum, fold_val = _loop_args(args_val, "reduce", 2)
+    for value in input_val.data.values():
+        result = frame.invoke_block(fold_val, comp.Value({comp.Unnamed(): value}), piped=accum)
+        flow = _loop_flow(result)
+        if flow == "stop":
+            break
+        if flow is None:
+            accum = result
+    return accum
+
+
+def _loop_some(input_val, args_val, frame):
+    """True when any field value passes the test; stops at the first match.
+
+    Args (positional): test
+    """
+    test_val, = _loop_args(args_val, "some", 1)
+    invoke = frame.block_loop(test_val)
+    for value in input_val.data.values():
+        if _loop_test(invoke(value), "some"):
+            return comp.Value(comp.tag_true)
+    return comp.Value(comp.tag_false)
+
+
+def _loop_every(input_val, args_val, frame):
+    """True when all field values pass the test; stops at the first failure.
+
+    Args (positional): test
+    """
+    test_val, = _loop_args(args_val, "every", 1)
+    invoke = frame.block_loop(test_val)
+    for value in input_val.data.values():
+        if not _loop_test(invoke(value), "every"):
+            return comp.Value(comp.tag_false)
+    return comp.Value(comp.tag_true)
+
+
+def _loop_slice(input_val, args_val, frame):
+    """Field values from position start up to (not including) end.
+
+    An end of -1 means the end of the struct.
+
+    Args (positional): start, end
+    """
+    start_val, end_val = _loop_args(args_val, "slice", 2)
+    if start_val.shape is not comp.shape_num or end_val.shape is not comp.shape_num:
+        raise comp.CodeError("slice start and end must be numbers")
+    start = comp.num_floor_int(start_val.data)
+    end = comp.num_floor_int(end_val.data)
+    if end == -1:
+        end = len(input_val.data)
+    result = comp.Struct()
+    for value in itertools.islice(input_val.data.values(), max(start, 0), max(end, 0)):
+        result[comp.Unnamed()] = value
+    return comp.Value(result)
+
+
+def _loop_reverse(input_val, args_val, frame):
+    """Field values in reverse order, dropping field names."""
+    result = comp.Struct()
+    for value in reversed(input_val.data.values()):
+        result[comp.Unnamed()] = value
+    return comp.Value(result)
@@ -5,9 +5,12 @@ through a three-phase pipeline.  ExecutionFrame provides the runtime
 stack for instruction execution.
 """
 
+import copy
+import dataclasses
 import hashlib
 import os
 import sys
+import types
 from pathlib import Path
 
 import comp
@@ -80,12 +83,154 @@ def _make_fail_value(message, tag=None, cause=None, cop_val=None):
 
 def _build_delivery_struct(delivery_map):
     """Convert a Python name->Value map into a Comp struct Value."""
+    if not delivery_map:
+        return comp.value_empty
     fields = {}
-    for name, value in (delivery_map or {}).items():
-        fields[comp.Value.from_python(name)] = value
+    for name, value in delivery_map.items():
+        fields[comp.text_key(name)] = value
     return comp.Value(fields)
 
 
+def _invoke_data(frame, statement_val, input_val):
+    """Build the invoke-data struct a wrapper receives as its piped input.
+
+    The locals and context fields are LazyValues, so their structs are only
+    built if the wrapper reads them.  They still show the frame as it was
+    at the call: the env gets a plain dict copy, and the context is shared
+    copy-on-write like a child frame's.
+
+    Args:
+        frame: (ExecutionFrame) Frame making the wrapped call
+        statement_val: (Value) The wrapped statement
+        input_val: (Value) The piped input
+
+    Returns:
+        (Value) Struct with statement, input, locals and context fields
+    """
+    _key = comp.text_key
+    env = dict(frame.env)
+    context = frame.context
+    frame._context_owned = False
+
+    def build_locals():
+        # Only plain locals, not namespace-qualified names like mod.func
+        return {_key(k): v for k, v in env.items() if "." not in k}
+
+    def build_context():
+        return {_key(k): v for k, v in context.items()}
+
+    size = 0
+    locals_handles = None
+    for k, v in env.items():
+        if "." not in k:
+            size += 1
+            if v.handles:
+                locals_handles = True
+    context_handles = True if any(v.handles for v in context.values()) else None
+    return comp.Value({
+        _key("statement"): statement_val,
+        _key("input"):     input_val,
+        _key("locals"):    comp.LazyValue(build_locals, size, locals_handles),
+        _key("context"):   comp.LazyValue(build_context, len(context), context_handles),
+    })
+
+
+def _cop_references(cop):
+    """Yield (module_id, qualified) for each namespace reference in a cop tree."""
+    stack = [cop]
+    while stack:
+        node = stack.pop()
+        if comp.cop_tag(node) in ("value.namespace", "value.reference"):
+            try:
+                qualified = node.to_python("qualified")
+                module_id = node.to_python("module_id")
+            except (KeyError, AttributeError):
+                continue
+            if isinstance(qualified, list):
+                for name in qualified:
+                    yield (module_id, name)
+            else:
+                yield (module_id, qualified)
+        stack.extend(comp.cop_kids(node))
+
+
+def _default_module(modules):
+    """Find the default module among loaded modules.
+
+    Located once per build so _apply_aliases doesn't have to walk each
+    module's import graph (user modules don't import default).
+    """
+    for mod in modules:
+        resource = getattr(mod.source, "resource", "") or ""
+        if (resource in ("default", "default.comp")
+                or resource.endswith("/default.comp")
+                or resource.endswith("\\default.comp")):
+            return mod
+    return None
+
+
+def _cop_identifiers(cop):
+    """Yield every dotted prefix of the identifiers in an unresolved cop tree.
+
+    ``loop.map.x`` yields "loop", "loop.map" and "loop.map.x", covering
+    whichever part of it names a namespace entry.
+    """
+    stack = [cop]
+    while stack:
+        node = stack.pop()
+        kids = comp.cop_kids(node)
+        if comp.cop_tag(node) == "value.identifier":
+            parts = []
+            for kid in kids:
+                if comp.cop_tag(kid) != "ident.token":
+                    break
+                parts.append(kid.to_python("value"))
+                yield ".".join(parts)
+        stack.extend(kids)
+
+
+def _import_statements(module):
+    """(name, body) of each !import in a module, or None if it fails to scan."""
+    try:
+        return [(stmt.name, stmt.body.strip()) for stmt in module.statements()
+                if stmt.operator == "import"]
+    except Exception:
+        return None
+
+
+def _namespace_entries(item):
+    """Definitions behind a namespace entry."""
+    if isinstance(item, comp.Callable):
+        return item.entries
+    if isinstance(item, comp.Ambiguous):
+        return item.definitions
+    return (item,)
+
+
+def _changed_names(old, new):
+    """Names that resolve differently in two namespaces.
+
+    Entries are compared by what name resolution and codegen look at, so
+    a definition replaced by an edit of its body still counts as the same.
+    """
+    names = {name for name in old if name not in new}
+    for name, item in new.items():
+        prev = old.get(name)
+        if prev is None or _entry_signature(prev) != _entry_signature(item):
+            names.add(name)
+    return names
+
+
+def _entry_signature(item):
+    signature = []
+    for entry in _namespace_entries(item):
+        if isinstance(entry, comp.Definition):
+            signature.append((entry.module_id, entry.qualified, entry.shape, entry.private, entry.pure))
+        else:
+            signature.append(id(entry))
+    return signature
+
+
 class Interp:
     """Comp language interpreter.
 
@@ -107,6 +252,8 @@ class Interp:
 
     Each phase is idempotent: re-calling is a no-op.  Adding a new module
     resets back to phase 0 so subsequent build calls pick it up.
+    ``reload()`` picks up edited module sources and rebuilds only the
+    definitions they affect.
 
     Build methods are best-effort — they return ``[(Module, Exception)]``
     error lists and never raise.  Only ``invoke()`` raises on errors.
@@ -117,9 +264,59 @@ class Interp:
     def __init__(self):
         self.system = comp.get_internal_module("system")
         # Import-related state (was ImportContext)
-        comp_root = str(Path(__file__).parent)
-        working_dir = str(Path.cwd())
-        self.comp_root = comp_root
+        self.comp_root = str(Path(__file__).parent)
+        self.search_fds = []
+        self._set_working_dir(str(Path.cwd()))
+
+        self.module_cache = {}
+        self._phase = 0  # 0=modules added, 1=namespaces built, 2=instructions built
+        # Guard to avoid recursive callout validation while building callout stdlib.
+        self._disable_build_validations = 0
+        # Populated by build_namespaces/build_instructions when timing is needed.
+        self.timings = {}
+        # Set to True to print a line to stderr for every module load/cache-hit.
+        self.trace_imports = False
+        # Optional persistent artifact cache (comp._cache.BuildCache).  Assign
+        # before loading modules so every module picks it up.
+        self.build_cache = None
+        # Optional pool of worker processes (comp._parallel.ParsePool) that
+        # parses statement bodies for build_namespaces(), which closes it
+        # once they are parsed.
+        self.parse_pool = None
+        # Remembers which overload wins for each input signature.
+        self.dispatch_cache = DispatchCache()
+        # How block bodies execute: "interp" steps through the instruction
+        # objects, "python" runs them as generated Python functions.
+        self.backend = "interp"
+        # Set by build_instructions(roots=...): definitions outside the
+        # roots' reach are built on first load instead of up front.
+        self.lazy_build = False
+        # Definitions a rooted build_instructions() skipped, by id, mapped
+        # to (module, name, definition).
+        self._pending_definitions = {}
+        # Environment each module's definitions execute in, by module id.
+        self._module_envs = {}
+        # Ids of the modules the last build_instructions() or reload()
+        # built; modules loaded after it are built on top by reload().
+        self._built_modules = set()
+
+    def __del__(self):
+        for fd in getattr(self, 'search_fds', []):
+            if fd >= 0:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _set_working_dir(self, working_dir):
+        """Point the project search paths at a working directory.
+
+        Modules already loaded stay cached; the new paths apply to the
+        modules located from now on.
+        """
+        for fd in self.search_fds:
+            if fd >= 0:
+                os.close(fd)
         self.working_dir = working_dir
         self.search_paths = [
             os.path.join(self.comp_root, "stdlib"),  # Built-in stdlib
@@ -143,23 +340,6 @@ class Interp:
                 # Use -1 to indicate fallback to path-based search
                 self.search_fds.append(-1)
 
-        self.module_cache = {}
-        self._phase = 0  # 0=modules added, 1=namespaces built, 2=instructions built
-        # Guard to avoid recursive callout validation while building callout stdlib.
-        self._disable_build_validations = 0
-        # Populated by build_namespaces/build_instructions when timing is needed.
-        self.timings = {}
-        # Set to True to print a line to stderr for every module load/cache-hit.
-        self.trace_imports = False
-
-    def __del__(self):
-        for fd in getattr(self, 'search_fds', []):
-            if fd >= 0:
-                try:
-                    os.close(fd)
-                except OSError:
-                    pass
-
     def __repr__(self):
         return "Interp<>"
 
@@ -273,11 +453,13 @@ class Interp:
         if defn is None:
             raise comp.CodeError(f"Function {name!r} not found in module")
 
+        if defn.value is None:
+            self.build_definition(defn)
         if defn.value is None:
             raise comp.CodeError(f"Function {name!r} has no value (not yet built?)")
 
         if args is None:
-            args = comp.Value.from_python({})
+            args = comp.value_empty
         elif isinstance(args, dict):
             args = comp.Value.from_python(args)
 
@@ -406,7 +588,7 @@ class Interp:
         """
         main_defn = module.main_entry(main_name)
         if main_defn is None:
-            return comp.Value.from_python({})
+            return comp.value_empty
 
         dag_order = self.resolve_startup_dag(main_defn)
         merged_context = {}
@@ -493,27 +675,56 @@ class Interp:
         all_modules = self._all_modules()
         errors = []
 
+        if self.parse_pool is not None:
+            _t0 = _time.perf_counter()
+            try:
+                self.parse_pool.prefetch(all_modules, self.build_cache)
+            finally:
+                # Nothing else parses through the pool, so its workers
+                # would otherwise idle until the program exits.
+                self.parse_pool.close()
+            _elapsed = _time.perf_counter() - _t0
+            self.timings["ns.parse_pool"] = self.timings.get("ns.parse_pool", 0.0) + _elapsed
+            self.timings["ns.definitions"] = self.timings.get("ns.definitions", 0.0) + _elapsed
+        self._namespace_passes(all_modules, _default_module(all_modules), errors)
+
+        if self.build_cache is not None:
+            self.build_cache.flush()
+        self._phase = 1
+        return errors
+
+    def _namespace_passes(self, modules, default_mod, errors):
+        """Run the build_namespaces() passes over the given modules.
+
+        Args:
+            modules: (list) Modules to build, in dependency order
+            default_mod: (Module | None) The default module, whose aliases
+                are injected into modules without !no-default
+            errors: (list) Receives (Module, Exception) pairs
+        """
+        import time as _time
+
         # Pass 1: Definitions — parse all statements into cop nodes
         _t0 = _time.perf_counter()
-        for mod in all_modules:
+        for mod in modules:
             try:
                 mod.definitions()
             except (comp.ParseError, comp.CodeError) as e:
                 errors.append((mod, e))
 
         # Stamp phase 1 on all modules so namespace() gate is unlocked
-        for mod in all_modules:
+        for mod in modules:
             mod._interp_phase = 1
         _t1 = _time.perf_counter()
 
         # Pass 2: Namespace — build namespace for each module
-        for mod in all_modules:
+        for mod in modules:
             if mod._definitions_error is not None:
                 continue
             mod.namespace()
 
         # Pass 2b: Tag hierarchies — build per-module tag ancestry maps
-        for mod in all_modules:
+        for mod in modules:
             if mod._definitions_error is not None:
                 continue
             _ = mod.tag_hierarchy
@@ -521,25 +732,14 @@ class Interp:
         _t2 = _time.perf_counter()
 
         # Pass 3: Resolve aliases — resolve alias/export refs against namespace
-        for mod in all_modules:
+        for mod in modules:
             if mod._definitions_error is not None:
                 continue
             mod._resolve_deferred()
         _t3 = _time.perf_counter()
 
         # Pass 4: Apply aliases — inject resolved aliases into all namespaces
-        # Locate the default module once so _apply_aliases doesn't have to
-        # walk each module's import graph (user modules don't import default).
-        default_mod = None
-        for _mod in all_modules:
-            _resource = getattr(_mod.source, "resource", "") or ""
-            if (_resource in ("default", "default.comp")
-                    or _resource.endswith("/default.comp")
-                    or _resource.endswith("\\default.comp")):
-                default_mod = _mod
-                break
-
-        for mod in all_modules:
+        for mod in modules:
             if mod._definitions_error is not None:
                 continue
             mod._apply_aliases(default_mod=default_mod)
@@ -550,10 +750,7 @@ class Interp:
         self.timings["ns.resolve"]     = self.timings.get("ns.resolve",     0.0) + (_t3 - _t2)
         self.timings["ns.aliases"]     = self.timings.get("ns.aliases",     0.0) + (_t4 - _t3)
 
-        self._phase = 1
-        return errors
-
-    def build_instructions(self):
+    def build_instructions(self, roots=None, main=None):
         """Build all modules through the full pipeline (phase 1 → 2).
 
         Auto-calls ``build_namespaces()`` if not yet at phase 1.  Then
@@ -561,16 +758,31 @@ class Interp:
         runs comp-side validators, generates bytecode, and executes
         definitions to populate their values.
 
+        When *roots* or *main* is given, only those definitions and the
+        ones their resolved code references (transitively) are built.  Every other
+        definition is left pending and built by ``build_definition()``
+        the first time something loads it, so validation errors in code
+        that never runs are not reported.
+
         Best-effort: accumulates errors and continues.  Definitions
         that fail validation are skipped during codegen.
 
-        Idempotent if already at phase 2+.
+        Idempotent if already at phase 2+.  Modules loaded after a
+        completed build are built on top of it, the way ``reload()``
+        builds edited modules.
+
+        Args:
+            roots: (list | None) Definitions to build from
+            main: (tuple | None) (Module, name) of a !main entry point;
+                builds from ``entry_definitions()`` for it
 
         Returns:
             (list) List of (Module, Exception) pairs for all errors
         """
         if self._phase >= 2:
             return []
+        if self._built_modules and not self._disable_build_validations:
+            return self._rebuild(None, roots, main)
 
         import time as _time
         _tb0 = _time.perf_counter()
@@ -578,6 +790,10 @@ class Interp:
         _tb1 = _time.perf_counter()
         self.timings["build.build_namespaces"] = self.timings.get("build.build_namespaces", 0.0) + (_tb1 - _tb0)
         all_modules = self._all_modules()
+        if main is not None:
+            roots = self.entry_definitions(*main)
+        if roots is not None:
+            self.lazy_build = True
 
         # Resolve + fold + validate each definition via Definition.callouts()
         # Definitions with error callouts are marked to skip codegen.
@@ -585,38 +801,23 @@ class Interp:
         # to avoid recursion.
         failed_defs = set()
         skip_validation = self._disable_build_validations > 0
+        cache = self.build_cache
         _t0 = _time.perf_counter()
         _callout_bootstrap_before = self.timings.get("callout.bootstrap", 0.0)
-        for mod in all_modules:
-            if mod._definitions_error is not None:
-                continue
-            mod_all_defs = mod.all_definitions()
-            mod_ns = mod.namespace()
-            for _name, defn in mod_all_defs:
-                # Resolve and fold even when skipping validation
-                if defn.original_cop is None:
+        if roots is None:
+            selected = {}
+            for mod in all_modules:
+                if mod._definitions_error is not None:
                     continue
-                if defn.resolved_cop is None:
-                    defn.resolved_cop = comp.cop_resolve_names(
-                        defn.original_cop, mod_ns
-                    )
-                defn.resolved_cop = comp.coptimize(defn.resolved_cop, True, mod_ns)
-
-                if not skip_validation:
-                    defn_callouts = comp._callout.cop_callouts(defn, interp=self, namespace=mod_ns)
-                    for c in defn_callouts:
-                        if c.severity == comp.ERROR:
-                            failed_defs.add(id(defn))
-                            err = comp.CodeError(c.message)
-                            if c.primary and c.primary.span:
-                                s = c.primary.span
-                                err.row = s.line
-                                err.col = s.col
-                                err.end_col = s.col + s.length
-                            err.module = mod
-                            err.callout_code = c.code
-                            errors.append((mod, err))
-                            break
+                selected[id(mod)] = mod.all_definitions()
+                for _name, defn in selected[id(mod)]:
+                    # Resolve and fold even when skipping validation
+                    if defn.original_cop is None:
+                        continue
+                    if not self._resolve_definition(mod, defn, skip_validation, errors):
+                        failed_defs.add(id(defn))
+        else:
+            selected = self._resolve_reachable(all_modules, roots, skip_validation, errors, failed_defs)
         _t1 = _time.perf_counter()
         _callout_bootstrap_after = self.timings.get("callout.bootstrap", 0.0)
         self.timings["build.resolve_fold_validate"] = (
@@ -624,80 +825,63 @@ class Interp:
             + (_t1 - _t0) - (_callout_bootstrap_after - _callout_bootstrap_before)
         )
 
-        # Pure evaluation (optional — always enabled for build_instructions)
+        self._generate(all_modules, selected, failed_defs, errors)
+
+        # Stamp phase 2 on all modules
         for mod in all_modules:
-            if mod._definitions_error is not None:
+            mod._interp_phase = 2
+        if cache is not None:
+            cache.flush()
+        self._phase = 2
+        self._built_modules = {id(mod) for mod in all_modules}
+        # A nested build (see cop_callouts) may have deferred definitions
+        # this one went on to build
+        self._pending_definitions = {
+            key: entry for key, entry in self._pending_definitions.items()
+            if entry[2].value is None
+        }
+        self.timings["build.deferred"] = len(self._pending_definitions)
+
+        return errors
+
+    def _generate(self, modules, selected, failed_defs, errors):
+        """Pure-evaluate, generate code for and execute resolved definitions.
+
+        Args:
+            modules: (list) Modules in dependency order
+            selected: (dict) Module id to the (name, Definition) pairs to build
+            failed_defs: (set) Ids of definitions that failed validation
+            errors: (list) Receives (Module, Exception) pairs
+        """
+        import time as _time
+        _t1 = _time.perf_counter()
+        # Pure evaluation (optional — always enabled for build_instructions)
+        for mod in modules:
+            if id(mod) not in selected:
                 continue
-            mod_all_defs = mod.all_definitions()
             mod_env = {}
-            for name, defn in mod_all_defs:
+            for name, defn in selected[id(mod)]:
                 if id(defn) in failed_defs:
                     continue
-                if defn.pure and defn.resolved_cop is not None and defn.value is None:
-                    try:
-                        defn.instructions = comp.generate_code_for_definition(
-                            defn.resolved_cop,
-                            dispatch_own_name=defn.qualified,
-                            dispatch_set_name=defn.qualified,
-                            pure=True,
-                            namespace=mod.namespace(),
-                        )
-                        result = self._execute(defn.instructions, mod_env, module=mod)
-                        defn.value = result
-                        mod_env[name] = result
-                    except Exception:
-                        pass
+                self._pure_eval_definition(mod, defn, mod_env, name)
         _t2 = _time.perf_counter()
 
         # Codegen — generate instructions for all non-failed definitions
-        for mod in all_modules:
-            if mod._definitions_error is not None:
+        for mod in modules:
+            if id(mod) not in selected:
                 continue
-            mod_all_defs = mod.all_definitions()
-            for name, defn in mod_all_defs:
+            for name, defn in selected[id(mod)]:
                 if id(defn) in failed_defs:
                     continue
-                if defn.instructions is not None:
-                    continue
-                if defn.resolved_cop is None:
-                    continue
-                try:
-                    defn.instructions = comp.generate_code_for_definition(
-                        defn.resolved_cop,
-                        dispatch_own_name=defn.qualified,
-                        dispatch_set_name=defn.qualified,
-                        pure=defn.pure,
-                        namespace=mod.namespace(),
-                    )
-                except (comp.CodeError, Exception) as e:
-                    if isinstance(e, comp.CodeError):
-                        e.module = mod
-                        e.definition_name = defn.qualified
-                        # If error has no position, use definition's position
-                        if getattr(e, "row", None) is None:
-                            src_cop = defn.original_cop
-                            if src_cop is not None:
-                                try:
-                                    pos = src_cop.field("pos")
-                                    if pos is not None:
-                                        e.row = pos.to_python(0)
-                                        e.col = pos.to_python(1)
-                                        e.end_col = pos.to_python(3)
-                                except (KeyError, AttributeError, IndexError):
-                                    pass
-                        errors.append((mod, e))
-                    else:
-                        errors.append((mod, comp.CodeError(
-                            f"Code generation error for {mod.token}:{name}: {e}"
-                        )))
+                self._codegen_definition(mod, defn, name, errors)
         _t3 = _time.perf_counter()
 
         # Execute — run instructions to populate definition values
-        for mod in all_modules:
-            if mod._definitions_error is not None:
+        for mod in modules:
+            if id(mod) not in selected:
                 continue
-            mod_all_defs = mod.all_definitions()
-            mod_env = {}
+            mod_all_defs = selected[id(mod)]
+            mod_env = self._module_envs.setdefault(id(mod), {})
             # Shapes first (they don't depend on blocks)
             for name, defn in mod_all_defs:
                 if defn.instructions and defn.value is None:
@@ -719,20 +903,479 @@ class Interp:
                         continue
                     defn.value = result
                     mod_env[name] = result
-
-        # Stamp phase 2 on all modules
-        for mod in all_modules:
-            mod._interp_phase = 2
-        self._phase = 2
         _t4 = _time.perf_counter()
 
-        self.timings["build.build_namespaces"] = self.timings.get("build.build_namespaces", 0.0)
         self.timings["build.pure_eval"]  = self.timings.get("build.pure_eval",  0.0) + (_t2 - _t1)
         self.timings["build.codegen"]    = self.timings.get("build.codegen",    0.0) + (_t3 - _t2)
         self.timings["build.execute"]    = self.timings.get("build.execute",    0.0) + (_t4 - _t3)
 
+    def entry_definitions(self, module, main_name):
+        """Definitions a ``!main`` entry point needs before it starts.
+
+        The entry itself plus every ``!startup`` provider in its startup
+        DAG.
+
+        Args:
+            module: (Module) The root module containing the !main
+            main_name: (str) Name of the !main entry point
+
+        Returns:
+            (list | None) Definitions, or None if there is no such entry
+                or the modules do not parse; a full build reports why
+        """
+        try:
+            main_defn = module.main_entry(main_name)
+            if main_defn is None:
+                return None
+            roots = [main_defn]
+            for layer_name in self.resolve_startup_dag(main_defn):
+                roots.extend(defn for _mod, defn in self.collect_startup_providers(layer_name))
+        except (comp.ParseError, comp.CodeError):
+            return None
+        return roots
+
+    def build_definition(self, defn):
+        """Build a definition that a rooted ``build_instructions()`` left pending.
+
+        Runs the same resolve, fold, validate, codegen and execute steps
+        as the full build, for this definition only.  Definitions it
+        references are left pending in turn.
+
+        Args:
+            defn: (Definition) Definition to build
+
+        Returns:
+            (Value | None) The definition's value
+
+        Raises:
+            comp.CodeError: If the definition fails to build
+        """
+        entry = self._pending_definitions.pop(id(defn), None)
+        if entry is None:
+            return defn.value
+
+        import time as _time
+        _t0 = _time.perf_counter()
+        mod, name, _defn = entry
+        errors = []
+        skip_validation = self._disable_build_validations > 0
+        try:
+            if self._resolve_definition(mod, defn, skip_validation, errors):
+                mod_env = self._module_envs.setdefault(id(mod), {})
+                self._pure_eval_definition(mod, defn, {}, name)
+                self._codegen_definition(mod, defn, name, errors)
+                if defn.instructions and defn.value is None and not errors:
+                    defn.value = self._execute(defn.instructions, mod_env, module=mod)
+                    mod_env[name] = defn.value
+            if self.build_cache is not None:
+                self.build_cache.flush()
+        finally:
+            self.timings["build.lazy"] = self.timings.get("build.lazy", 0.0) + (_time.perf_counter() - _t0)
+            self.timings["build.lazy_definitions"] = self.timings.get("build.lazy_definitions", 0) + 1
+        if errors:
+            raise errors[0][1]
+        return defn.value
+
+    def reload(self, updates=None):
+        """Pick up edited module sources and rebuild only what they affect.
+
+        For interpreters that stay alive while their files are edited.
+        Definitions from statements that did not change are kept, already
+        parsed, resolved and built; only new or edited statements are
+        parsed.  Namespaces are rebuilt for the edited modules and for
+        every module that imports them, directly or through re-exports
+        (the default module counts as imported by each module that uses
+        it).  In those modules a kept definition is rebuilt only when a
+        name it mentions now resolves to different definitions, or when
+        it folds in or evaluates at build time a definition that was
+        rebuilt.
+
+        Statements are matched by ``Statement.key``, which includes the
+        line they start on, so inserting lines re-parses everything below.
+        Modules loaded since the last build are built here too.
+        Before the first ``build_instructions()`` this only swaps in the
+        new sources.  After a rooted build, new definitions other than
+        ``!main`` and ``!startup`` are left pending like the rest.
+
+        Args:
+            updates: (dict | None) Module to its new source text; when
+                None, every file module whose file changed is re-read
+
+        Returns:
+            (list) (Module, Exception) pairs for errors in what was rebuilt
+        """
+        return self._rebuild(updates)
+
+    def _rebuild(self, updates, roots=None, main=None):
+        """Do the work of ``reload()``.
+
+        With *roots* or *main*, as for ``build_instructions()``, only the
+        rebuilt definitions they reach are built; the others are left
+        pending like in a rooted build.
+        """
+        import time as _time
+        _t0 = _time.perf_counter()
+        before = self._all_modules()
+        edited = []
+        if updates is None:
+            for mod in before:
+                location = mod.source.location
+                if not location or not os.path.isabs(location):
+                    continue
+                try:
+                    src = comp._import.locate_resource(
+                        resource=location,
+                        etag=mod.source.etag,
+                        search_paths=self.search_paths,
+                        search_fds=self.search_fds,
+                    )
+                except comp.ModuleNotFoundError:
+                    continue  # Deleted; keep the last version
+                if src is not None:
+                    edited.append((mod, src.etag, src.content))
+        else:
+            for mod, text in updates.items():
+                etag = hashlib.sha256(text.encode('utf-8')).hexdigest()
+                if etag != mod.source.etag:
+                    edited.append((mod, etag, text))
+        added = [mod for mod in before if id(mod) not in self._built_modules]
+        if not edited and not (added and self._built_modules):
+            return []
+
+        # Registering changed imports resets the phase
+        was_built = bool(self._built_modules)
+        old_namespaces = {id(mod): mod._namespace for mod in before}
+        for mod, etag, text in edited:
+            old_imports = _import_statements(mod)
+            mod._update_source(dataclasses.replace(mod.source, etag=etag, content=text))
+            new_imports = _import_statements(mod)
+            if new_imports is not None and new_imports != old_imports:
+                self._new_module(mod)
+        if not was_built:
+            for mod in self._all_modules():
+                mod._reset_namespace()
+            self._phase = 0
+            return []
+
+        # Edited and newly imported modules, plus everything that sees them
+        all_modules = self._all_modules()
+        default_mod = _default_module(all_modules)
+        changed = {id(mod) for mod, _etag, _text in edited}
+        changed.update(id(mod) for mod in all_modules if id(mod) not in self._built_modules)
+        importers = {}
+        for mod in all_modules:
+            for child, _err in (mod._imports or {}).values():
+                if child is not None:
+                    importers.setdefault(id(child), []).append(mod)
+            if default_mod is not None and mod is not default_mod and not mod.no_default:
+                importers.setdefault(id(default_mod), []).append(mod)
+        affected = set(changed)
+        stack = list(changed)
+        while stack:
+            for mod in importers.get(stack.pop(), ()):
+                if id(mod) not in affected:
+                    affected.add(id(mod))
+                    stack.append(id(mod))
+        modules = [mod for mod in all_modules if id(mod) in affected]
+
+        errors = []
+        for mod in modules:
+            mod._reset_namespace()
+        self._namespace_passes(modules, default_mod, errors)
+        if main is not None:
+            roots = self.entry_definitions(*main)
+        if roots is not None:
+            self.lazy_build = True
+
+        # Pick definitions to rebuild: new ones, then kept ones whose names
+        # now resolve differently, then whatever folds or evaluates those
+        identifiers = {}
+
+        def mentions(defn, names):
+            idents = identifiers.get(id(defn))
+            if idents is None:
+                idents = identifiers[id(defn)] = set(_cop_identifiers(defn.original_cop))
+            return not idents.isdisjoint(names)
+
+        built = [mod for mod in modules if mod._definitions_error is None]
+        rebuilt = set()
+        kept = []
+        for mod in built:
+            old_ns = old_namespaces.get(id(mod))
+            changed_names = None if old_ns is None else _changed_names(old_ns, mod.namespace())
+            for name, defn in mod.all_definitions():
+                if defn.original_cop is None or id(defn) in self._pending_definitions:
+                    continue
+                if defn.resolved_cop is None:
+                    rebuilt.add(id(defn))
+                elif defn.shape is not comp.shape_tag:
+                    # Tag values come from the statement alone
+                    if changed_names is None or mentions(defn, changed_names):
+                        rebuilt.add(id(defn))
+                    else:
+                        kept.append((mod, defn))
+        while True:
+            grown = False
+            for mod in built:
+                # Non-callable values are folded into the code that names them
+                folded, evaluated = set(), set()
+                for ns_name, item in mod.namespace().items():
+                    for entry in _namespace_entries(item):
+                        if id(entry) in rebuilt:
+                            evaluated.add(ns_name)
+                            if entry.shape is not comp.shape_block:
+                                folded.add(ns_name)
+                remaining = []
+                for owner, defn in kept:
+                    if owner is not mod:
+                        remaining.append((owner, defn))
+                        continue
+                    at_build = defn.pure or defn.shape is not comp.shape_block
+                    if mentions(defn, evaluated if at_build else folded):
+                        rebuilt.add(id(defn))
+                        grown = True
+                    else:
+                        remaining.append((owner, defn))
+                kept = remaining
+            if not grown:
+                break
+
+        # Reset and build them the same way build_instructions() does
+        failed_defs = set()
+        skip_validation = self._disable_build_validations > 0
+        selected = {}
+        live = set()
+        for mod in built:
+            env = self._module_envs.get(id(mod))
+            names = set()
+            pairs = []
+            for name, defn in mod.all_definitions():
+                names.add(name)
+                live.add(id(defn))
+                if id(defn) not in rebuilt:
+                    continue
+                if env:
+                    env.pop(name, None)
+                if roots is not None or (self.lazy_build and defn.resolved_cop is None
+                                         and not (defn.main or defn.startup)):
+                    self._pending_definitions[id(defn)] = (mod, name, defn)
+                    continue
+                if defn.resolved_cop is not None:
+                    defn.resolved_cop = None
+                    defn.instructions = None
+                    defn.value = None
+                pairs.append((name, defn))
+            if env:
+                for name in [name for name in env if name not in names]:
+                    del env[name]
+            selected[id(mod)] = pairs
+        self._pending_definitions = {
+            key: entry for key, entry in self._pending_definitions.items()
+            if id(entry[0]) not in affected or key in live
+        }
+        resolved = set()
+        if roots is not None:
+            # Follow references the way _resolve_reachable() does, through
+            # the definitions left pending above
+            by_name = {}
+            for _mod, _name, defn in self._pending_definitions.values():
+                by_name.setdefault((defn.module_id, defn.qualified), []).append(defn)
+            stack = list(roots)
+            while stack:
+                defn = stack.pop()
+                entry = self._pending_definitions.pop(id(defn), None)
+                if entry is None:
+                    continue
+                mod = entry[0]
+                resolved.add(id(defn))
+                if not self._resolve_definition(mod, defn, skip_validation, errors):
+                    failed_defs.add(id(defn))
+                    continue
+                mod_ns = mod.namespace()
+                for module_id, name in _cop_references(defn.resolved_cop):
+                    item = mod_ns.get(name)
+                    if isinstance(item, comp.Callable):
+                        stack.extend(e for e in item.entries if isinstance(e, comp.Definition))
+                    elif isinstance(item, comp.Definition):
+                        stack.append(item)
+                    else:
+                        stack.extend(by_name.get((module_id, name), ()))
+            for mod in built:
+                selected[id(mod)] = [(name, defn) for name, defn in mod.all_definitions()
+                                     if id(defn) in resolved]
+        for mod in built:
+            for name, defn in selected[id(mod)]:
+                if id(defn) in resolved:
+                    continue
+                if not self._resolve_definition(mod, defn, skip_validation, errors):
+                    failed_defs.add(id(defn))
+        self._generate(modules, selected, failed_defs, errors)
+
+        for mod in modules:
+            mod._interp_phase = 2
+        if self.build_cache is not None:
+            self.build_cache.flush()
+        self.dispatch_cache.clear()
+        self._phase = 2
+        self._built_modules = {id(mod) for mod in all_modules}
+        self.timings["build.deferred"] = len(self._pending_definitions)
+        self.timings["reload"] = self.timings.get("reload", 0.0) + (_time.perf_counter() - _t0)
+        self.timings["reload.modules"] = len(modules)
+        self.timings["reload.definitions"] = sum(len(pairs) for pairs in selected.values())
         return errors
 
+    def _resolve_reachable(self, all_modules, roots, skip_validation, errors, failed_defs):
+        """Resolve the definitions reachable from *roots* and defer the rest.
+
+        Walks the resolved code of each root for namespace references and
+        follows them into the definitions they name, across modules.
+        Unreached definitions are recorded in ``_pending_definitions``.
+
+        Returns:
+            (dict) Module id to the (name, Definition) pairs to build
+        """
+        owners = {}
+        by_name = {}
+        for mod in all_modules:
+            if mod._definitions_error is not None:
+                continue
+            for name, defn in mod.all_definitions():
+                owners[id(defn)] = (mod, name)
+                by_name.setdefault((defn.module_id, defn.qualified), []).append(defn)
+
+        reached = set()
+        pending = [defn for defn in roots if id(defn) in owners]
+        while pending:
+            defn = pending.pop()
+            if id(defn) in reached:
+                continue
+            reached.add(id(defn))
+            if defn.original_cop is None:
+                continue
+            mod, _name = owners[id(defn)]
+            if not self._resolve_definition(mod, defn, skip_validation, errors):
+                failed_defs.add(id(defn))
+                continue
+            mod_ns = mod.namespace()
+            for module_id, name in _cop_references(defn.resolved_cop):
+                # References use the name visible from this module
+                item = mod_ns.get(name)
+                if isinstance(item, comp.Callable):
+                    pending.extend(e for e in item.entries if isinstance(e, comp.Definition))
+                elif isinstance(item, comp.Definition):
+                    pending.append(item)
+                else:
+                    pending.extend(by_name.get((module_id, name), ()))
+            # Builtins and definitions of unparsed modules are not built here
+            pending = [d for d in pending if id(d) in owners]
+
+        selected = {}
+        for mod in all_modules:
+            if mod._definitions_error is not None:
+                continue
+            selected[id(mod)] = []
+            for name, defn in mod.all_definitions():
+                if id(defn) in reached:
+                    selected[id(mod)].append((name, defn))
+                elif defn.value is None and defn.original_cop is not None:
+                    self._pending_definitions[id(defn)] = (mod, name, defn)
+        return selected
+
+    def _resolve_definition(self, mod, defn, skip_validation, errors):
+        """Resolve, fold and validate one definition.
+
+        Error callouts are appended to *errors* as CodeErrors.
+
+        Returns:
+            (bool) False if validation reported an error
+        """
+        mod_ns = mod.namespace()
+        cache = self.build_cache
+        cached = None
+        if cache is not None:
+            cached = cache.resolved(self, mod, defn, not skip_validation)
+        if cached is not None:
+            defn.resolved_cop, defn_callouts = cached
+        else:
+            if defn.resolved_cop is None:
+                defn.resolved_cop = comp.cop_resolve_names(
+                    defn.original_cop, mod_ns
+                )
+            defn.resolved_cop = comp.coptimize(defn.resolved_cop, True, mod_ns)
+            defn_callouts = None
+            if not skip_validation:
+                defn_callouts = comp._callout.cop_callouts(defn, interp=self, namespace=mod_ns)
+            if cache is not None:
+                cache.store_resolved(self, mod, defn, defn.resolved_cop, defn_callouts)
+
+        if defn_callouts:
+            for c in defn_callouts:
+                if c.severity == comp.ERROR:
+                    err = comp.CodeError(c.message)
+                    if c.primary and c.primary.span:
+                        s = c.primary.span
+                        err.row = s.line
+                        err.col = s.col
+                        err.end_col = s.col + s.length
+                    err.module = mod
+                    err.callout_code = c.code
+                    errors.append((mod, err))
+                    return False
+        return True
+
+    def _pure_eval_definition(self, mod, defn, mod_env, name):
+        """Evaluate a pure definition at build time, ignoring failures."""
+        if defn.pure and defn.resolved_cop is not None and defn.value is None:
+            try:
+                defn.instructions = comp.generate_code_for_definition(
+                    defn.resolved_cop,
+                    dispatch_own_name=defn.qualified,
+                    dispatch_set_name=defn.qualified,
+                    pure=True,
+                    namespace=mod.namespace(),
+                )
+                result = self._execute(defn.instructions, mod_env, module=mod)
+                defn.value = result
+                mod_env[name] = result
+            except Exception:
+                pass
+
+    def _codegen_definition(self, mod, defn, name, errors):
+        """Generate instructions for one definition, appending any error."""
+        if defn.instructions is not None:
+            return
+        if defn.resolved_cop is None:
+            return
+        try:
+            defn.instructions = comp.generate_code_for_definition(
+                defn.resolved_cop,
+                dispatch_own_name=defn.qualified,
+                dispatch_set_name=defn.qualified,
+                pure=defn.pure,
+                namespace=mod.namespace(),
+            )
+        except (comp.CodeError, Exception) as e:
+            if isinstance(e, comp.CodeError):
+                e.module = mod
+                e.definition_name = defn.qualified
+                # If error has no position, use definition's position
+                if getattr(e, "row", None) is None:
+                    src_cop = defn.original_cop
+                    if src_cop is not None:
+                        try:
+                            pos = src_cop.field("pos")
+                            if pos is not None:
+                                e.row = pos.to_python(0)
+                                e.col = pos.to_python(1)
+                                e.end_col = pos.to_python(3)
+                        except (KeyError, AttributeError, IndexError):
+                            pass
+                errors.append((mod, e))
+            else:
+                errors.append((mod, comp.CodeError(
+                    f"Code generation error for {mod.token}:{name}: {e}"
+                )))
+
     def callouts(self, module=None, definition=None, min_severity="warning"):
         """Collect validation callouts.
 
@@ -911,6 +1554,7 @@ class Interp:
 
         # Adding a module invalidates completed phases — force rebuild
         self._phase = 0
+        module.build_cache = self.build_cache
 
         # Eagerly pull in the callout module so it's part of _all_modules() from
         # the very first build pass, rather than being bootstrapped mid-validation.
@@ -940,12 +1584,12 @@ class Interp:
 
         # Get statements from the module scan
         statements = module.statements()
-        import_stmts = [s for s in statements if s.get("operator") == "import"]
+        import_stmts = [s for s in statements if s.operator == "import"]
 
         children = {}
         for stmt in import_stmts:
-            name = stmt.get("name")
-            body = stmt.get("body", "").strip()
+            name = stmt.name
+            body = stmt.body.strip()
 
             # Parse the import body: <compiler> "<source>"
             # For now, we'll do simple parsing - later this should use the full parser
@@ -1017,16 +1661,128 @@ class Interp:
         return {"compiler": compiler, "source": source}
 
 
+_DISPATCH_LIMIT = 32
+
+
+class DispatchCache:
+    """Overload choices remembered by input signature.
+
+    Runtime Callables are assembled fresh each time a name is loaded, but
+    the blocks they hold are shared.  Tables are keyed on the identities of
+    a Callable's entries and fallback shape, so every Callable built from
+    the same overload set shares one table, and any change to the entries
+    selects a different table.
+
+    Each table maps a structural signature of the input value to the entry
+    that won dispatch (or None when nothing matched).  Overload sets whose
+    input shapes carry limits are never cached, since limits look at the
+    field values rather than their structure.  A table stops growing after
+    a fixed number of signatures and further new inputs dispatch normally.
+
+    Attributes:
+        hits: (int) Dispatches answered from a table
+        misses: (int) Dispatches that had to morph every candidate
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._tables = {}
+
+    def table(self, callable, skip_name):
+        """Get the signature table for an overload set.
+
+        Args:
+            callable: (Callable) Runtime callable being dispatched
+            skip_name: (str | None) Overload skipped by !forward
+
+        Returns:
+            (dict | None) Signature to entry mapping, or None if uncacheable
+        """
+        key = (tuple(map(id, callable.entries)), id(callable.shape), skip_name)
+        record = self._tables.get(key)
+        if record is None:
+            # Hold the entries so their ids cannot be reused while cached
+            cacheable = not any(
+                _has_limits(getattr(entry, "input_shape", None)) for entry in callable.entries
+            )
+            record = (tuple(callable.entries), callable.shape, {} if cacheable else None)
+            self._tables[key] = record
+        return record[2]
+
+    def clear(self):
+        """Forget every table, releasing the entries they hold."""
+        self._tables.clear()
+
+
+def _has_limits(shape):
+    """True if morphing into shape can invoke limit functions."""
+    if isinstance(shape, comp.ShapeUnion):
+        return any(_has_limits(member) for member in shape.shapes)
+    if isinstance(shape, comp.ShapeCollection):
+        return bool(shape.element.limits)
+    if isinstance(shape, comp.Shape):
+        plan = comp._morph._shape_plan(shape)
+        return bool(plan.shape_limits) or any(plan.limits)
+    return False
+
+
+def _dispatch_signature(value):
+    """Structural signature deciding which overload a value morphs into.
+
+    Covers everything the morph type checks look at: the data type, tag
+    identity, unit, and for structs the field names in order with the
+    signature of each field value.  Nested structs only contribute their
+    length, plus their single value when they could be unwrapped to a
+    scalar.
+
+    Args:
+        value: (Value) The dispatch input
+
+    Returns:
+        (tuple) Hashable signature
+    """
+    data = value.data
+    if isinstance(data, dict):
+        return (dict, value.unit, tuple(
+            (comp._morph._get_field_key(key), _field_signature(field))
+            for key, field in data.items()
+        ))
+    return _field_signature(value)
+
+
+def _field_signature(value):
+    """Signature of a single value for _dispatch_signature."""
+    if type(value) is comp.LazyValue and value.size != 1:
+        return (dict, value.unit, value.size)
+    data = value.data
+    if isinstance(data, dict):
+        if len(data) == 1:
+            return (dict, value.unit, 1, _field_signature(next(iter(data.values()))))
+        return (dict, value.unit, len(data))
+    if isinstance(data, comp.Tag):
+        return (comp.Tag, value.unit, data)
+    if isinstance(data, comp.RawTag):
+        return (comp.RawTag, value.unit, data.qualified)
+    return (type(data), value.unit)
+
+
+# Shared read-only stand-in for frame maps that have nothing in them yet
+_EMPTY_MAP = types.MappingProxyType({})
+
+
 class ExecutionFrame:
     """Runtime execution frame.
 
     Holds registers (temporaries) and environment (variables).
     This is the mutable state passed through instruction execution.
 
-    Uses SSA-style implicit register numbering - instruction index IS the register.
+    Uses SSA-style implicit register numbering - each instruction writes the
+    next register.  Superinstructions write one register per fused step
+    (their ``width``), so registers keep the numbering codegen assigned.
 
     Attributes:
-        registers: List of Values indexed by instruction number
+        registers: List of Values indexed by register number
         env: Dict mapping variable names to Values
         interp: The interpreter instance (for nested calls)
         module: The module being executed (for definition lookups)
@@ -1035,20 +1791,29 @@ class ExecutionFrame:
             (None until the first !grab, to avoid allocating a set for every frame)
         context: Dict of name->Value pairs that flow down into called functions
             as implicit named argument defaults (!ctx bindings)
+
+    Child frames share their parent's context instead of copying it.  A
+    shared context is copied by the first set_context() on either side, so
+    creating a frame costs nothing for the many calls that never write one.
+    The $ vars and delivery maps are never modified in place; they are
+    replaced with a new dict when they change, so frames and blocks can
+    hold the same map without copying.  All of these start as a shared
+    empty read-only map.
     """
 
     def __init__(self, env=None, interp=None, module=None, parent_frame=None, context=None, definition_name=None):
-        self.registers = []  # List indexed by instruction number
+        self.registers = []  # List indexed by register number
         self.env = env if env is not None else {}
-        self._dollar_vars = {}  # "$", "$$", "$$$" — pipeline input context (per-invocation)
-        self._pipeline_delivery = {}
-        self._last_delivery = {}
-        self._delivered_coupling = {}
+        self._dollar_vars = _EMPTY_MAP  # "$", "$$", "$$$" — pipeline input context (per-invocation)
+        self._pipeline_delivery = _EMPTY_MAP
+        self._last_delivery = _EMPTY_MAP
+        self._delivered_coupling = _EMPTY_MAP
         self.interp = interp
         self.module = module
         self.parent_frame = parent_frame
         self.live_handles = None  # Set[HandleInstance] | None
-        self.context = context if context is not None else {}
+        self.context = context if context is not None else _EMPTY_MAP
+        self._context_owned = context is not None  # False while shared or empty
         self.failure = None  # comp.Value when a failure is propagating, else None
         self.definition_name = definition_name
 
@@ -1056,7 +1821,7 @@ class ExecutionFrame:
         """Execute a list of instructions, return final result.
 
         When frame.failure is set, non-catching instructions are skipped but
-        their register slot is filled with the failure value to keep the
+        their register slots are filled with the failure value to keep the
         register index model consistent.  Fallback / PipeFallback instructions
         have can_catch_failure=True and always execute so they may clear the
         failure and resume normal execution.
@@ -1067,11 +1832,27 @@ class ExecutionFrame:
         Returns:
             Value result of final instruction (or None)
         """
-        result = None
-        for idx, instr in enumerate(instructions):
+        return self.resume(instructions, 0, None)
+
+    def resume(self, instructions, start, result):
+        """Continue executing instructions from an index, return final result.
+
+        Compiled block bodies hand control back here once a failure starts
+        propagating, so the fast-forward rules live in one place.
+
+        Args:
+            instructions: List of instruction objects
+            start: (int) Index of the first instruction to execute
+            result: (Value | None) Result of the instruction before start
+
+        Returns:
+            Value result of final instruction (or None)
+        """
+        for idx in range(start, len(instructions)):
+            instr = instructions[idx]
             if self.failure is not None and not instr.can_catch_failure:
                 # Fast-forward: skip but keep register alignment
-                self.registers.append(self.failure)
+                self.registers.extend([self.failure] * instr.width)
                 result = self.failure
             else:
                 result = instr.execute(self)
@@ -1114,6 +1895,28 @@ class ExecutionFrame:
         self.registers.append(value)
         return value
 
+    def set_context(self, name, value):
+        """Bind a !ctx name, copying the context first if it is shared.
+
+        Args:
+            name: (str) Context name
+            value: (Value) Value for the name
+        """
+        if not self._context_owned:
+            self.context = dict(self.context)
+            self._context_owned = True
+        self.context[name] = value
+
+    def deliver(self, name, value):
+        """Record a delivered dependency for the next pipeline stage.
+
+        Args:
+            name: (str) Dependency name
+            value: (Value) Delivered value
+        """
+        self._last_delivery = {**self._last_delivery, name: value}
+        self._delivered_coupling = {**self._delivered_coupling, name: value}
+
     def eval(self, cop):
         """Compile and evaluate a COP expression in this frame's context.
 
@@ -1131,7 +1934,7 @@ class ExecutionFrame:
         ctx = comp._codegen.CodeGenContext()
         ctx.build_expression(resolved)
         sub_frame = self._make_child_frame(dict(self.env), module=self.module)
-        return sub_frame.run(ctx.instructions)
+        return sub_frame.run(ctx.finish())
 
     def invoke_block(self, block_val, args, piped=None, delivery=None, source_cop=None):
         """Call a function with the given arguments.
@@ -1145,7 +1948,7 @@ class ExecutionFrame:
         Returns:
             Value result of the function call
         """
-        self._last_delivery = {}
+        self._last_delivery = _EMPTY_MAP
         callable_obj = block_val.data
         
         # Handle InternalCallable (Python function)
@@ -1275,31 +2078,24 @@ class ExecutionFrame:
         # If the block has a runtime wrapper, build invoke-data on the fly and
         # call the wrapper instead of executing the block directly.
         if block.wrapper is not None:
-            import copy as _copy
             wrapper_val = block.wrapper
-            _key = comp.Value.from_python
-            _nil = comp.Value.from_python(comp.tag_nil)
-            input_for_data = piped if piped is not None else _nil
-            # Create statement: a Callable containing a wrapper-free copy of the
-            # block so the wrapper can call `invoke` without triggering recursion.
-            stmt_block = _copy.copy(block)
-            stmt_block.wrapper = None
-            stmt_callable = comp.Callable(block.qualified)
-            stmt_callable.add(stmt_block)
-            stmt_val = comp.Value(stmt_callable)
-            local_data = {_key(k): v for k, v in self.env.items() if "." not in k}
-            locals_val = comp.Value(local_data)
-            ctx_data = {_key(k): v for k, v in self.context.items()}
-            context_val = comp.Value(ctx_data)
-            invoke_data = comp.Value({
-                _key("statement"): stmt_val,
-                _key("input"):     input_for_data,
-                _key("locals"):    locals_val,
-                _key("context"):   context_val,
-            })
+            input_for_data = piped if piped is not None else comp.value_nil
+            # Statement: a Callable containing a wrapper-free copy of the block
+            # so the wrapper can call `invoke` without triggering recursion.
+            # The copy is kept on the block; copies of the block carry the
+            # cache too, so it records which block it was made from.
+            unwrapped = block.unwrapped
+            if unwrapped is None or unwrapped[0] is not block:
+                stmt_block = copy.copy(block)
+                stmt_block.wrapper = None
+                stmt_block.unwrapped = None
+                stmt_callable = comp.Callable(block.qualified)
+                stmt_callable.add(stmt_block)
+                unwrapped = block.unwrapped = (block, comp.Value(stmt_callable))
+            invoke_data = _invoke_data(self, unwrapped[1], input_for_data)
             return self.invoke_block(
                 wrapper_val,
-                comp.Value.from_python({}),
+                comp.value_empty,
                 piped=invoke_data,
                 source_cop=source_cop,
             )
@@ -1333,10 +2129,10 @@ class ExecutionFrame:
                     piped = args
             else:
                 piped = args
-            args = comp.Value.from_python({})
+            args = comp.value_empty
         
         # Apply morph/mask to parameters based on shapes
-        _nil = comp.Value.from_python(comp.tag_nil)
+        _nil = comp.value_nil
         input_val = piped if piped is not None else _nil
         args_val = args
 
@@ -1431,9 +2227,12 @@ class ExecutionFrame:
         new_frame.definition_name = block.qualified
         new_frame._dollar_vars = _dollar
 
-        result = new_frame.run(block.body_instructions)
+        if self.interp.backend == "python" and type(new_frame).on_step is ExecutionFrame.on_step:
+            result = _compiled_body(block)(new_frame)
+        else:
+            result = new_frame.run(block.body_instructions)
 
-        outgoing_coupling = dict(getattr(new_frame, "_delivered_coupling", {}) or {})
+        outgoing_coupling = new_frame._delivered_coupling
 
         # Skip delivery validation when the frame already holds a failure — the
         # !fail propagation (below) takes priority and the coupling state may be
@@ -1445,6 +2244,7 @@ class ExecutionFrame:
                 source_cop or block.signature_cop,
             )
         if new_frame.failure is None and block.deliver_specs:
+            outgoing_coupling = dict(outgoing_coupling)
             declared_shapes = {}
             for spec in block.deliver_specs:
                 name = spec.get("name")
@@ -1473,28 +2273,34 @@ class ExecutionFrame:
         # If the called block finished with an unhandled failure, raise it so
         # callers can distinguish a failure from a normally-computed value.
         if new_frame.failure is not None:
-            fail = new_frame.failure
-            if isinstance(fail.data, dict):
-                frame_key = comp.Value.from_python("frame")
-                block_name = block.dispatch_set_name or block.qualified
-                if frame_key not in fail.data and block_name:
-                    operator = "pure" if block.pure else "func"
-                    fail.data[frame_key] = comp.Value.from_python(
-                        f"!{operator} `{block_name}`"
-                    )
-            raise CompFail(fail)
+            raise _block_failure(block, new_frame.failure)
 
         self._last_delivery = outgoing_coupling
 
         # Return the final result
-        return result if result is not None else comp.Value.from_python(None)
+        return result if result is not None else comp.value_nil
+
+    def block_loop(self, block_val):
+        """Prepare a block to be invoked repeatedly with no arguments.
+
+        Loop builtins call this once and then call the result with each
+        piped input, instead of going through invoke_block every time.
+
+        Args:
+            block_val: (Value) The callable to invoke on each iteration
+
+        Returns:
+            (_BlockLoop) Callable taking the piped input Value
+        """
+        return _BlockLoop(self, block_val)
 
     def _dispatch_overload(self, callable, args, piped, skip_name=None):
         """Find the best-matching block from a Callable.
 
         Tries each block's input shape against the piped input and returns
         the block with the best morph score. If no block matches, falls back
-        to the Callable's shape and morphs to it.
+        to the Callable's shape and morphs to it.  The winner for each input
+        signature is remembered in the interpreter's DispatchCache.
 
         Args:
             callable: (Callable) Callable with blocks and optional shape
@@ -1505,6 +2311,21 @@ class ExecutionFrame:
         Returns:
             (Block | Value | None) Best matching block, morphed Value from shape, or None
         """
+        table = None
+        if self.interp is not None:
+            cache = self.interp.dispatch_cache
+            table = cache.table(callable, skip_name)
+        if table is not None:
+            signature = _dispatch_signature(piped if piped is not None else args)
+            signature = (piped is None, signature)
+            if signature in table:
+                cache.hits += 1
+                best_block = table[signature]
+                if best_block is not None:
+                    return best_block
+                return self._dispatch_fallback(callable, args, piped)
+            cache.misses += 1
+
         best_block = None
         best_score = None
 
@@ -1521,7 +2342,7 @@ class ExecutionFrame:
             if input_name and not arg_name and piped is None:
                 input_val = args
             else:
-                input_val = piped if piped is not None else comp.Value.from_python({})
+                input_val = piped if piped is not None else comp.value_empty
 
             # Try to morph input to this block's input shape
             input_shape = getattr(block, "input_shape", None)
@@ -1540,10 +2361,25 @@ class ExecutionFrame:
                 best_score = score
                 best_block = block
 
+        if table is not None and len(table) < _DISPATCH_LIMIT:
+            table[signature] = best_block
+
         # If a block matched, return it
         if best_block is not None:
             return best_block
+        return self._dispatch_fallback(callable, args, piped)
+
+    def _dispatch_fallback(self, callable, args, piped):
+        """Morph to a Callable's own shape when no overload matched.
 
+        Args:
+            callable: (Callable) Callable with an optional fallback shape
+            args: (Value) Arguments struct
+            piped: (Value | None) Piped input value
+
+        Returns:
+            (Value | None) Morphed value, the union default, or None
+        """
         # Fall back to shape morph if no block matched
         if callable.shape is not None:
             shape = callable.shape
@@ -1557,6 +2393,7 @@ class ExecutionFrame:
                 return shape.default
 
         return None
+
     def _make_child_frame(self, env, module=None):
         """Create a child frame for nested execution.
 
@@ -1569,8 +2406,140 @@ class ExecutionFrame:
         Returns:
             New ExecutionFrame (or subclass)
         """
-        child = ExecutionFrame(env=env, interp=self.interp, module=module or self.module, parent_frame=self, context=dict(self.context))
-        child._pipeline_delivery = dict(self._pipeline_delivery)
+        child = ExecutionFrame(env=env, interp=self.interp, module=module or self.module, parent_frame=self, context=self.context)
+        child._context_owned = self._context_owned = False
+        child._pipeline_delivery = self._pipeline_delivery
+        return child
+
+
+class _BlockLoop:
+    """Repeated invocation of one block with only the piped input changing.
+
+    A plain single-block callable is resolved once, and one child frame is
+    reused for every iteration with its registers and per-call state reset.
+    The arguments are always empty and the calling frame's context cannot
+    change while a builtin runs, so context injection and the argument mask
+    are done on the first call only.  The input is still morphed every
+    iteration.  Anything else (overloads, shapes, wrappers, Python
+    builtins, dependencies) goes through invoke_block unchanged.
+
+    Args:
+        frame: (ExecutionFrame) Frame the loop builtin was called with
+        block_val: (Value) The callable to invoke
+    """
+
+    def __init__(self, frame, block_val):
+        self.frame = frame
+        self.block_val = block_val
+        self.block = None
+        self.child = None
+        callable_obj = block_val.data
+        if (isinstance(callable_obj, comp.Callable) and len(callable_obj.entries) == 1
+                and callable_obj.shape is None):
+            block = callable_obj.entries[0]
+            if (isinstance(block, comp.Block) and block.wrapper is None
+                    and not block.dependency_shape and not block.deliver_specs):
+                self.block = block
+
+    def __call__(self, piped):
+        """Invoke the block with a piped input, return its result."""
+        block = self.block
+        frame = self.frame
+        if block is None:
+            return frame.invoke_block(self.block_val, comp.value_empty, piped=piped)
+        child = self.child
+        if child is None:
+            child = self._start()
+        env = child.env
+
+        if block.input_shape and isinstance(block.input_shape, comp.Shape):
+            morph_result = comp.morph(piped, block.input_shape, frame)
+            if morph_result.failure_reason:
+                err = comp.CodeError(
+                    f"Input morph failed: {morph_result.failure_reason}"
+                    f"\n  block: {block.qualified or '?'}, input_shape: {block.input_shape.qualified}"
+                    f", input: {piped.format()}"
+                    f" ({piped.shape.qualified if piped.shape else '?'})",
+                    getattr(self.block_val, "cop", None))
+                err.module = frame.module or block.module
+                err.definition_name = frame.definition_name
+                raise err
+
+        # The closure env is shared, so the body may have rebound any of these
+        env["__self__"] = self.self_val
+        if block.input_name:
+            env[block.input_name] = piped
+            if block.arg_name:
+                env[block.arg_name] = self.args_val
+        env.update(self.params)
+
+        child.registers.clear()
+        child.failure = None
+        child.live_handles = None
+        child.context = frame.context
+        child._context_owned = False
+        child._last_delivery = child._delivered_coupling = _EMPTY_MAP
+        child._dollar_vars = {"$$$": self.outer_dollar, "$$": self.dollar, "$": piped}
+
+        if self.compiled is not None:
+            result = self.compiled(child)
+        else:
+            result = child.run(block.body_instructions)
+
+        if child.failure is None and child._delivered_coupling:
+            name = next(iter(child._delivered_coupling))
+            raise comp.CodeError(
+                f"Delivered dependency `{name}` is not declared in signature",
+                block.signature_cop,
+            )
+        if child.failure is not None:
+            raise _block_failure(block, child.failure)
+        frame._last_delivery = _EMPTY_MAP
+        return result if result is not None else comp.value_nil
+
+    def _start(self):
+        """Do the per-loop setup on the first call and create the frame."""
+        block = self.block
+        frame = self.frame
+        _nil = comp.value_nil
+        self_callable = comp.Callable(block.qualified)
+        self_callable.add(block)
+        self.self_val = comp.Value(self_callable)
+
+        args_val = comp.value_empty
+        if block.arg_shape and isinstance(block.arg_shape, comp.Shape):
+            if frame.context:
+                args_val = _inject_context(args_val, block.arg_shape, frame)
+            args_val, error = comp.mask(args_val, block.arg_shape, frame)
+            if error:
+                raise comp.CodeError(f"Argument mask failed: {error}", self.block_val.cop)
+        self.args_val = args_val
+        self.params = {}
+        if block.param_names and isinstance(args_val.data, dict):
+            param_set = set(block.param_names)
+            for k, v in args_val.data.items():
+                fname = comp._morph._get_field_key(k)
+                if fname is not None and fname in param_set:
+                    self.params[fname] = v
+
+        captured = block.captured_dollar_vars or {}
+        self.outer_dollar = captured.get("$$", _nil)
+        self.dollar = captured.get("$", _nil)
+
+        if block.body_instructions is None and block.body:
+            if block.module:
+                ns = block.module.namespace()
+                resolved_body = comp.coptimize(block.body, True, ns)
+                block.body_instructions = comp.generate_code_for_definition(resolved_body, namespace=ns)
+            else:
+                block.body_instructions = comp.generate_code_for_definition(block.body)
+
+        child = frame._make_child_frame(block.closure_env, module=block.module)
+        child.definition_name = block.qualified
+        self.compiled = None
+        if frame.interp.backend == "python" and type(child).on_step is ExecutionFrame.on_step:
+            self.compiled = _compiled_body(block)
+        self.child = child
         return child
 
 
@@ -1578,6 +2547,99 @@ class ExecutionFrame:
 # ===================
 
 
+class ContextPlan:
+    """Precomputed tables for injecting !ctx values into an argument shape.
+
+    Built once per argument shape and stored on its ``context_plan`` slot.
+    Only named fields can take a context value, so the plan keeps those
+    with their result keys.  Field constraints come from the shape's
+    MorphPlan, which resolves deferred names once.  The last context value
+    that passed each field's type check is remembered, so a binding made by
+    !ctx is checked the first time it reaches the field and is then only
+    compared by identity.
+
+    Args:
+        shape: (Shape) The argument shape
+
+    Attributes:
+        source: (list) The field list the plan was built from
+        count: (int) Length of source when the plan was built
+        entries: (tuple) (field index, name, result key) per named field
+        passed: (list) Last context Value that passed each field's check
+    """
+
+    __slots__ = ("source", "count", "entries", "passed")
+
+    def __init__(self, shape):
+        self.source = shape.fields
+        self.count = len(shape.fields)
+        self.entries = tuple(
+            (i, field.name, comp.text_key(field.name))
+            for i, field in enumerate(shape.fields)
+            if field.name is not None
+        )
+        self.passed = [None] * self.count
+
+    def __repr__(self):
+        return f"ContextPlan<{len(self.entries)} named fields>"
+
+    def inject(self, args_val, shape, frame):
+        """Augment args_val with context values for named fields not yet provided.
+
+        Args:
+            args_val: (Value) The caller-supplied argument struct
+            shape: (Shape) The argument shape the plan was built from
+            frame: (ExecutionFrame) The calling frame whose context is consulted
+
+        Returns:
+            (Value) Possibly-augmented args struct (original if nothing was injected)
+        """
+        context = frame.context
+        data = args_val.data
+        explicit_names = ()
+        skip = 0
+        if isinstance(data, dict) and data:
+            explicit_names = set()
+            positional_count = 0
+            for k in data:
+                field_name = comp._morph._get_field_key(k)
+                if field_name is not None:
+                    explicit_names.add(field_name)
+                else:
+                    positional_count += 1
+            if positional_count:
+                fillable = self.count - sum(1 for _, name, _ in self.entries if name in explicit_names)
+                skip = min(positional_count, fillable)
+
+        injections = None
+        passed = self.passed
+        for i, name, key in self.entries:
+            if name in explicit_names:
+                continue
+            # Fields a positional arg would cover are left to the mask
+            if skip:
+                skip -= 1
+                continue
+            ctx_val = context.get(name)
+            if ctx_val is None:
+                continue
+            if ctx_val is not passed[i]:
+                # Only inject if the value satisfies the field's type constraint
+                constraint = comp._morph._shape_plan(shape).constraint(i, frame)
+                if constraint is not None:
+                    if not comp._morph._check_type(ctx_val, constraint, frame):
+                        continue
+                    if comp._morph._is_resolved(shape.fields[i].shape):
+                        passed[i] = ctx_val
+            if injections is None:
+                injections = dict(data) if isinstance(data, dict) else {}
+            injections[key] = ctx_val
+
+        if injections is None:
+            return args_val
+        return comp.Value(injections)
+
+
 def _inject_context(args_val, arg_shape, frame):
     """Augment args_val with context values for named shape fields not yet provided.
 
@@ -1585,7 +2647,9 @@ def _inject_context(args_val, arg_shape, frame):
     args struct, check whether the frame context carries a value under that name.
     If so, and the value passes the shape field's type constraint, inject it as an
     additional named field.  The mask step that follows will pick it up in phase-1
-    (named matching) exactly like an explicitly-passed argument.
+    (named matching) exactly like an explicitly-passed argument.  Fields that
+    positional args could still fill are left alone, so context never overrides
+    what the caller intended.
 
     Args:
         args_val: (Value) The caller-supplied argument struct
@@ -1595,52 +2659,59 @@ def _inject_context(args_val, arg_shape, frame):
     Returns:
         (Value) Possibly-augmented args struct (original if nothing was injected)
     """
-    # Collect the names already present in explicit args, and count positionals
-    explicit_names = set()
-    positional_count = 0
-    if isinstance(args_val.data, dict):
-        for k in args_val.data:
-            field_name = comp._morph._get_field_key(k)
-            if field_name is not None:
-                explicit_names.add(field_name)
-            else:
-                positional_count += 1
-
-    # Count how many shape fields could still be satisfied by positional matching
-    # (those not already provided by name).  If positionals could cover all of them,
-    # context injection would just override what the caller intended.  Skip injection
-    # for those fields so the mask positional-matching pass handles them instead.
-    unnamed_fillable = [
-        sf for sf in arg_shape.fields
-        if sf.name not in explicit_names
-    ]
-    positionals_will_fill = min(positional_count, len(unnamed_fillable))
-
-    injections = {}
-    unfilled_by_positional = 0  # track fields context may still fill
-    for shape_field in arg_shape.fields:
-        name = shape_field.name
-        if name is None or name in explicit_names:
-            continue
-        # If this field would be covered by a positional arg, skip context injection
-        if unfilled_by_positional < positionals_will_fill:
-            unfilled_by_positional += 1
-            continue
-        unfilled_by_positional += 1
-        ctx_val = frame.context.get(name)
-        if ctx_val is None:
-            continue
-        # Only inject if the value satisfies the field's type constraint
-        constraint = comp._morph._resolve_shape_field(shape_field, frame)
-        if constraint is None or comp._morph._check_type(ctx_val, constraint, frame):
-            injections[comp.Value.from_python(name)] = ctx_val
-
-    if not injections:
-        return args_val
-
-    new_data = dict(args_val.data) if isinstance(args_val.data, dict) else {}
-    new_data.update(injections)
-    return comp.Value(new_data)
+    plan = arg_shape.context_plan
+    if plan is None or plan.source is not arg_shape.fields or plan.count != len(arg_shape.fields):
+        plan = ContextPlan(arg_shape)
+        arg_shape.context_plan = plan
+    return plan.inject(args_val, arg_shape, frame)
+
+
+def _compiled_body(block):
+    """Get the generated Python function for a block body, compiling on first use.
+
+    The function is cached on the block together with the instruction list it
+    was generated from, so a body that is recompiled gets a fresh function.
+
+    Args:
+        block: (Block) Block whose body_instructions are executed
+
+    Returns:
+        (function) Callable taking an ExecutionFrame and returning the result
+    """
+    instructions = block.body_instructions
+    cached = block.python_body
+    if cached is not None and cached[0] is instructions and cached[1] == len(instructions):
+        return cached[2]
+    fn = comp._codegen.compile_python(instructions, block.qualified)
+    block.python_body = (instructions, len(instructions), fn)
+    return fn
+
+
+def _block_failure(block, fail):
+    """Wrap the unhandled failure a block body finished with for raising.
+
+    Failure structs are labelled with the block they escaped from, unless
+    an inner frame already did.  The label goes on a new value, since the
+    failure may already be hashed or shared.
+
+    Args:
+        block: (Block) The block that was invoked
+        fail: (Value) The frame's failure value
+
+    Returns:
+        (CompFail) Exception to raise at the call site
+    """
+    if isinstance(fail.data, dict):
+        frame_key = comp.text_key("frame")
+        block_name = block.dispatch_set_name or block.qualified
+        if frame_key not in fail.data and block_name:
+            operator = "pure" if block.pure else "func"
+            label = comp.Value.from_python(f"!{operator} `{block_name}`")
+            labelled = comp.Value(comp.struct_assoc(fail.data, frame_key, label))
+            labelled.cop = fail.cop
+            labelled.stash = fail.stash
+            fail = labelled
+    return CompFail(fail)
 
 
 def _frame_exit_cleanup(frame, result):
@@ -61,6 +61,20 @@ class Module:
         # Per-module tag hierarchy for ancestry checks (built after namespace)
         self._tag_hierarchy = None
 
+        # Persistent artifact cache (BuildCache), assigned by the Interp
+        self.build_cache = None
+
+        # COPs parsed ahead of time by a ParsePool, keyed by id(statement)
+        self._parsed_cops = None
+
+        # (Statement, [(name, Definition)]) for each definition statement
+        # of the last successful definitions() build
+        self._statement_pairs = None
+
+        # Definitions kept from before a source update, by Statement.key,
+        # for statements that did not change
+        self._previous_definitions = None
+
     @property
     def tag_hierarchy(self):
         """Tag ancestor map for morph dispatch.
@@ -93,7 +107,7 @@ class Module:
             try:
                 stmts = self.statements()
                 self._no_default = any(
-                    s.get("operator") == "no-default" for s in stmts
+                    s.operator == "no-default" for s in stmts
                 )
             except Exception:
                 self._no_default = False
@@ -113,7 +127,7 @@ class Module:
         re-raised on future calls.
 
         Returns:
-            ScanResult: Object with .imports(), .package(), .docs() methods
+            ScanResult: Scanned .statements and .docs lists
 
         Raises:
             Exception: If scanning fails (cached for future calls)
@@ -132,7 +146,7 @@ class Module:
     def statements(self):
         """Get list of module-level statements from scan.
 
-        Each statement is a dict with:
+        Each statement is a comp._scan.Statement with:
             - operator: str (e.g., "import", "func", "shape")
             - name: str (the definition name)
             - pos: tuple (line, col, end_line, end_col)
@@ -140,10 +154,9 @@ class Module:
             - hash: str (blake2s digest of body for change detection)
 
         Returns:
-            list: List of statement dicts
+            list: List of Statements (shared, do not modify)
         """
-        scan_result = self.scan()
-        return scan_result.to_python("statements") or []
+        return self.scan().statements
 
     def comment(self, context=None):
         """Get module-level documentation comment.
@@ -156,11 +169,10 @@ class Module:
         """
         if context is not None:
             return ""
-        scan_result = self.scan()
-        docs = scan_result.to_python("docs") or []
+        docs = self.scan().docs
         if not docs:
             return ""
-        return docs[0].get("content", "")
+        return docs[0].content
 
     def package(self):
         """Get package metadata from !package statements.
@@ -171,12 +183,12 @@ class Module:
         statements = self.statements()
         metadata = {}
         for stmt in statements:
-            if stmt.get("operator") != "package":
+            if stmt.operator != "package":
                 continue
-            key = stmt.get("name")
-            body = stmt.get("body", "")
-            line_offset = stmt.get("pos", [1])[0]
-            col_offset = stmt.get("body_col", 0)
+            key = stmt.name
+            body = stmt.body
+            line_offset = stmt.pos[0]
+            col_offset = stmt.body_col
             tree = comp.lark_parse(body, "comp", "start_package", line_offset=line_offset, col_offset=col_offset)
             cop = comp.lark_to_cop(tree)
             sys_ns = comp.get_internal_module("system").namespace()
@@ -206,10 +218,9 @@ class Module:
                 info["source"] = mod.source.resource
                 info["location"] = mod.source.location
                 try:
-                    scan = mod.scan()
-                    docs = scan.to_python("docs") or []
+                    docs = mod.scan().docs
                     if docs:
-                        info["docs"] = docs[0].get("content", "")
+                        info["docs"] = docs[0].content
                 except Exception:
                     pass
             result[name] = info
@@ -224,14 +235,50 @@ class Module:
         """
         self._imports = imports
         self._definitions = None
-        self._namespace = None
-        self._interp_phase = 0
+        self._all_definitions_list = None
         self._scan_error = None
         self._definitions_error = None
         self._mod_values = None
+        self._parsed_cops = None
         self._deferred_defs = []
-        self._exported_aliases = {}
         self._no_default = None
+        self._reset_namespace()
+
+    def _reset_namespace(self):
+        """Drop the namespace, tag hierarchy and resolved aliases.
+
+        Definitions are kept, and the next build recomputes the rest from
+        them and the current imports.  Used by ``Interp.reload()`` for
+        modules that import something that changed.
+        """
+        self._namespace = None
+        self._tag_hierarchy = None
+        self._resolved_deferred = []
+        self._exported_aliases = {}
+        self._interp_phase = 0
+
+    def _update_source(self, source):
+        """Replace the source of the module after an edit.
+
+        Resets the module like ``_register_imports``, but definitions built
+        from statements that are unchanged in the new source (same
+        ``Statement.key``) are handed back by the next ``definitions()``
+        as they are, keeping their resolved code and values.  The
+        interpreter is responsible for re-registering imports.
+
+        Args:
+            source: (ModuleSource) New source
+        """
+        if self._statement_pairs is not None:
+            previous = {stmt.key: pairs for stmt, pairs in self._statement_pairs}
+        else:
+            # The last edit never built; keep what the one before had
+            previous = self._previous_definitions or {}
+        self.source = source
+        self._scan = None
+        self._statement_pairs = None
+        self._register_imports(self._imports)
+        self._previous_definitions = previous
 
     def definitions(self):
         """Parse source and extract definitions into module.definitions dict.
@@ -300,16 +347,22 @@ class Module:
             CodeError: On structural or duplicate-name errors
         """
         statements = self.statements()
+        cache = self.build_cache
+        previous = self._previous_definitions
         defs = {}
         all_pairs = []
+        statement_pairs = []
         mod_values = {}
         deferred = []
 
         for stmt in statements:
-            operator = stmt.get("operator")
+            operator = stmt.operator
 
             if operator in ("func", "pure", "tag", "shape", "startup", "main"):
-                pairs = comp._compiler.compile_definition(stmt, self.token)
+                pairs = previous.get(stmt.key) if previous else None
+                if pairs is None:
+                    pairs = self._compile_statement(stmt, cache)
+                statement_pairs.append((stmt, pairs))
                 for name, defn in pairs:
                     # Tag parent entries (no cop) skip if name already claimed
                     if defn.original_cop is None and defn.shape is comp.shape_tag:
@@ -334,8 +387,27 @@ class Module:
                     deferred.append(entry)
 
         self._all_definitions_list = all_pairs
+        self._statement_pairs = statement_pairs
+        self._previous_definitions = None
         return defs, mod_values, deferred
 
+    def _compile_statement(self, stmt, cache):
+        """Parse one definition statement into (name, Definition) pairs."""
+        cache_key = cop = None
+        if cache is not None:
+            cache_key = cache.statement_key(stmt)
+            cop = cache.parsed_cop(self, cache_key)
+        fresh = cop is None
+        if fresh and self._parsed_cops:
+            cop = self._parsed_cops.pop(id(stmt), None)
+        pairs = comp._compiler.compile_definition(stmt, self.token, cop=cop)
+        if cache is not None and fresh:
+            cache.store_parsed(self, cache_key, pairs[0][1].original_cop)
+        for _name, defn in pairs:
+            if defn.original_cop is not None:
+                defn.cache_key = cache_key
+        return pairs
+
     def startup(self, name):
         """Get the Definition for a !startup context preparation by name.
 
@@ -405,7 +477,7 @@ class Module:
 
         # For now, return an empty context struct.
         # The full DAG execution will be wired up in the interpreter.
-        initial_context = comp.Value.from_python({})
+        initial_context = comp.value_empty
         return defn, initial_context
 
     def namespace(self):
@@ -704,8 +776,9 @@ class Definition:
         startup_deps: (list) Dependency names for !startup context
         main:         (bool) Entry point (!main)
         main_deps:    (list) Dependency names for !main entry point
+        cache_key:    (str | None) BuildCache key of the source statement
     """
-    __slots__ = ("qualified", "module_id", "original_cop", "resolved_cop", "shape", "value", "instructions", "private", "pure", "startup", "startup_deps", "main", "main_deps")
+    __slots__ = ("qualified", "module_id", "original_cop", "resolved_cop", "shape", "value", "instructions", "private", "pure", "startup", "startup_deps", "main", "main_deps", "cache_key")
 
     def __init__(self, qualified, module_id, original_cop, shape, private=False):
         self.qualified = qualified
@@ -721,6 +794,7 @@ class Definition:
         self.resolved_cop = None  # Filled during identifier resolution
         self.value = None  # Filled during constant folding
         self.instructions = None  # Filled during code generation
+        self.cache_key = None  # Set when the module has a BuildCache
 
     def __repr__(self):
         shape_name = self.shape.qualified
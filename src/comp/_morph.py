@@ -56,6 +56,179 @@ class MorphResult:
         return f"MorphResult<score={self.score}>"
 
 
+_UNRESOLVED = object()
+
+
+class MorphPlan:
+    """Precomputed lookup tables for morphing values into one shape.
+
+    A plan is compiled the first time a Shape, ShapeUnion or ShapeCollection
+    is used as a morph target and stored on the shape's ``plan`` slot.  It
+    holds everything about the target that does not depend on the value:
+    field name lookups, result keys, resolved field constraints, units and
+    the limit calls with their argument structs already built.
+
+    Field constraints given as deferred names are resolved on first use and
+    remembered once they resolve.  A plan is rebuilt if the shape's field
+    list is replaced or grows after the plan was made.
+
+    Args:
+        shape: (Shape | ShapeUnion | ShapeCollection) The morph target
+
+    Attributes:
+        source: (list) The field, member or element list the plan was built from
+        count: (int) Length of source when the plan was built
+        fields: (list[ShapeField]) Shape fields; the element field for collections
+        names: (tuple) Field name per shape field, None for positional fields
+        index: (dict) Field name to shape field index
+        keys: (tuple) Result key Value per shape field, None for positional fields
+        constraints: (list) Resolved constraint per field, or unresolved marker
+        units: (tuple) Expected unit tag per field
+        limits: (tuple) Per field tuple of (func_val, args_val) limit calls
+        shape_limits: (tuple) Shape-level (func_val, args_val) limit calls
+        exact: (bool | None) Whether the conforming-layout fast path is usable,
+            None until every constraint is resolved
+    """
+
+    __slots__ = ("source", "count", "fields", "names", "index", "keys", "constraints",
+                 "units", "limits", "shape_limits", "exact")
+
+    def __init__(self, shape):
+        if isinstance(shape, comp.ShapeUnion):
+            self.source = shape.shapes
+            fields = []
+        elif isinstance(shape, comp.ShapeCollection):
+            self.source = shape.element
+            fields = [shape.element]
+        else:
+            self.source = shape.fields
+            fields = list(shape.fields)
+        self.count = len(self.source) if isinstance(self.source, list) else 1
+        self.fields = fields
+        self.names = tuple(field.name for field in fields)
+        self.index = {}
+        for i, name in enumerate(self.names):
+            if name is not None and name not in self.index:
+                self.index[name] = i
+        self.keys = tuple(
+            comp.text_key(name) if name else None for name in self.names
+        )
+        self.constraints = [
+            field.shape if field.shape is None or _is_resolved(field.shape) else _UNRESOLVED
+            for field in fields
+        ]
+        self.units = tuple(field.unit for field in fields)
+        self.limits = tuple(_limit_calls(field.limits) for field in fields)
+        self.shape_limits = _limit_calls(getattr(shape, "limits", None))
+        self.exact = None
+        self._update_exact()
+
+    def __repr__(self):
+        return f"MorphPlan<{len(self.fields)} fields>"
+
+    def constraint(self, i, frame):
+        """Get the resolved shape constraint for a field.
+
+        Args:
+            i: (int) Shape field index
+            frame: (ExecutionFrame | None) Frame for deferred name lookups
+
+        Returns:
+            (Shape | ShapeUnion | Tag | None) The constraint, None if unconstrained
+        """
+        constraint = self.constraints[i]
+        if constraint is not _UNRESOLVED:
+            return constraint
+        field = self.fields[i]
+        constraint = _resolve_shape_field(field, frame)
+        if _is_resolved(field.shape):
+            self.constraints[i] = field.shape
+            self._update_exact()
+        return constraint
+
+    def _update_exact(self):
+        """Decide whether values with a matching key layout can skip matching.
+
+        A positional field with a tag constraint can be claimed out of order
+        by the tag matching phase, so shapes with those always take the full
+        matching path.
+        """
+        if _UNRESOLVED in self.constraints:
+            return
+        self.exact = bool(self.fields) and not any(
+            name is None and isinstance(constraint, comp.Tag)
+            for name, constraint in zip(self.names, self.constraints)
+        )
+
+
+def _is_resolved(shape):
+    """True when a ShapeField constraint no longer needs a runtime lookup."""
+    return isinstance(shape, (comp.Shape, comp.ShapeUnion, comp.Tag))
+
+
+def _shape_plan(shape):
+    """Get the compiled MorphPlan for a shape, building it when missing or stale.
+
+    Args:
+        shape: (Shape | ShapeUnion | ShapeCollection) The morph target
+
+    Returns:
+        (MorphPlan) The plan stored on the shape
+    """
+    plan = shape.plan
+    if plan is not None:
+        if isinstance(shape, comp.ShapeCollection):
+            if plan.source is shape.element:
+                return plan
+        else:
+            source = shape.shapes if isinstance(shape, comp.ShapeUnion) else shape.fields
+            if plan.source is source and plan.count == len(source):
+                return plan
+    plan = MorphPlan(shape)
+    shape.plan = plan
+    return plan
+
+
+def _limit_calls(limits):
+    """Pair each limit function with its prebuilt argument struct.
+
+    Args:
+        limits: (list | None) (func_val, param_val_or_None) limit tuples
+
+    Returns:
+        (tuple) (func_val, args_val) pairs, skipping unresolved functions
+    """
+    if not limits:
+        return ()
+    _empty_args = comp.value_empty
+    calls = []
+    for func_val, param_val in limits:
+        if func_val is None:
+            continue
+        args = comp.Value({comp.Unnamed(): param_val}) if param_val is not None else _empty_args
+        calls.append((func_val, args))
+    return tuple(calls)
+
+
+def _run_limits(calls, value, frame):
+    """Invoke prebuilt limit calls on a matched value.
+
+    Args:
+        calls: (tuple) (func_val, args_val) pairs from _limit_calls
+        value: (Value) The matched value to validate
+        frame: (ExecutionFrame) The current interpreter frame
+
+    Returns:
+        (Value | None) The original fail Value if a limit fails, None if all pass
+    """
+    for func_val, args in calls:
+        try:
+            frame.invoke_block(func_val, args, piped=value)
+        except comp.CompFail as exc:
+            return exc.value
+    return None
+
+
 def _unit_match_score(val_unit, shape_unit):
     """Score unit compatibility between a value's unit and a shape field's unit.
 
@@ -276,8 +449,7 @@ def _invoke_limits(field, value, frame):
 
     Limit functions are pre-resolved at codegen time and stored on the ShapeField
     as (func_val, param_val_or_None) tuples — no runtime name lookup needed.
-
-    Also used for shape-level limits stored on Shape objects.
+    Morphs against a compiled MorphPlan use its prebuilt limit calls instead.
 
     Args:
         field: (ShapeField | Shape) Object with a .limits list to check
@@ -289,21 +461,7 @@ def _invoke_limits(field, value, frame):
     """
     if not field.limits:
         return None
-
-    _empty_args = comp.Value({})
-
-    for func_val, param_val in field.limits:
-        if func_val is None:
-            continue
-
-        args = comp.Value({comp.Unnamed(): param_val}) if param_val is not None else _empty_args
-
-        try:
-            frame.invoke_block(func_val, args, piped=value)
-        except comp.CompFail as exc:
-            return exc.value
-
-    return None
+    return _run_limits(_limit_calls(field.limits), value, frame)
 
 
 def _eval_default(default_val, frame):
@@ -482,7 +640,9 @@ def _morph_collection(value, shape, frame):
             f"Collection allows at most {shape.max_count} element(s), got {count}"
         )
 
-    constraint = _resolve_shape_field(shape.element, frame)
+    plan = _shape_plan(shape)
+    constraint = plan.constraint(0, frame)
+    limits = plan.limits[0]
     unit_score_total = 0
     result_data = {}
 
@@ -492,7 +652,7 @@ def _morph_collection(value, shape, frame):
         us = _unit_match_score(elem.unit, shape.element.unit)
         if us == -1:
             return MorphResult.failed(f"Element {i} has incompatible unit for collection")
-        limit_fail = _invoke_limits(shape.element, elem, frame)
+        limit_fail = _run_limits(limits, elem, frame)
         if limit_fail is not None:
             return MorphResult.failed(_extract_fail_message(limit_fail), failure_value=limit_fail)
         unit_score_total += us
@@ -541,11 +701,19 @@ def morph(value, shape, frame):
     Returns:
         MorphResult: Result with morphed value and match score
     """
-    result = _morph_core(value, shape, frame)
+    if isinstance(shape, comp.Shape):
+        plan = _shape_plan(shape)
+        result = _morph_core(value, shape, frame, plan)
+        if plan.shape_limits and not result.failure_reason:
+            limit_fail = _run_limits(plan.shape_limits, result.value, frame)
+            if limit_fail is not None:
+                return MorphResult.failed(_extract_fail_message(limit_fail), failure_value=limit_fail)
+        return result
+    result = _morph_core(value, shape, frame, None)
     return _apply_shape_limits(result, shape, frame)
 
 
-def _morph_core(value, shape, frame):
+def _morph_core(value, shape, frame, plan):
     # Handle collection shapes
     if isinstance(shape, comp.ShapeCollection):
         return _morph_collection(value, shape, frame)
@@ -553,7 +721,7 @@ def _morph_core(value, shape, frame):
     # Handle union shapes - try each member and return best scoring match
     if isinstance(shape, comp.ShapeUnion):
         best_result = None
-        for member_shape in shape.shapes:
+        for member_shape in _shape_plan(shape).source:
             result = morph(value, member_shape, frame)
             if result.failure_reason:
                 continue  # This member didn't match; failures (including limits) are discarded
@@ -569,14 +737,14 @@ def _morph_core(value, shape, frame):
     # ~nil is a universal sink: any value morphed to ~nil produces nil
     # Score is as low as possible so any specific shape match wins.
     if isinstance(shape, comp.Tag) and shape is comp.tag_nil:
-        nil_val = comp.Value(comp.tag_nil)
+        nil_val = comp.value_nil
         # If the value is already nil, it's an exact match — normal score
         if isinstance(value.data, comp.Tag) and value.data is comp.tag_nil:
             return MorphResult(nil_val, 0, 0, 4, 1)
         return MorphResult(nil_val, -1, 0, 0, 0)
 
     # Get shape fields (Tags have no fields, they just act as type constraints)
-    shape_fields = getattr(shape, "fields", None) or []
+    shape_fields = plan.fields if plan is not None else []
 
     # Handle non-struct values by promoting to single-element struct
     if not isinstance(value.data, dict):
@@ -623,12 +791,22 @@ def _morph_core(value, shape, frame):
                 return MorphResult(inner_val, 0, 0, us, 1)
             return MorphResult.failed(f"Cannot morph struct to scalar shape {_shape_name(shape)}")
 
+    # Values already laid out like the shape need no field matching
+    if plan.exact:
+        result = _morph_exact(value, plan, frame)
+        if result is not None:
+            return result
+
     # Build list of input fields
     input_fields = []
+    by_name = {}
     for key, val in value.data.items():  # type: ignore[union-attr]
         name = _get_field_key(key)
         tag = _get_value_tag(val)
-        input_fields.append({"key": key, "name": name, "tag": tag, "value": val, "matched": False})
+        inp = {"key": key, "name": name, "tag": tag, "value": val, "matched": False}
+        input_fields.append(inp)
+        if name is not None and name in plan.index:
+            by_name.setdefault(name, inp)
 
     # Track which shape fields are satisfied
     shape_matches = {}  # shape_field_index -> input_field
@@ -642,39 +820,35 @@ def _morph_core(value, shape, frame):
         if shape_field.name is None:
             continue  # Skip positional shape fields in named phase
 
-        for inp in input_fields:
-            if inp["matched"]:
-                continue
-            if inp["name"] == shape_field.name:
-                # Resolve shape constraint
-                constraint = _resolve_shape_field(shape_field, frame)
-                # Validate type
-                if not _check_type(inp["value"], constraint, frame):
-                    return MorphResult.failed(
-                        f"Field '{shape_field.name}' has wrong type"
-                    )
-                # Validate unit compatibility
-                us = _unit_match_score(inp["value"].unit, shape_field.unit)
-                if us == -1:
-                    return MorphResult.failed(
-                        f"Field '{shape_field.name}' has incompatible unit"
-                    )
-                shape_matches[i] = inp
-                inp["matched"] = True
-                named_matches += 1
-                unit_score_total += us
-                # Invoke limits on the matched value
-                limit_fail_val = _invoke_limits(shape_field, inp["value"], frame)
-                if limit_fail_val is not None:
-                    return MorphResult.failed(_extract_fail_message(limit_fail_val), failure_value=limit_fail_val)
-                break
+        inp = by_name.get(shape_field.name)
+        if inp is None or inp["matched"]:
+            continue
+        # Validate type
+        if not _check_type(inp["value"], plan.constraint(i, frame), frame):
+            return MorphResult.failed(
+                f"Field '{shape_field.name}' has wrong type"
+            )
+        # Validate unit compatibility
+        us = _unit_match_score(inp["value"].unit, shape_field.unit)
+        if us == -1:
+            return MorphResult.failed(
+                f"Field '{shape_field.name}' has incompatible unit"
+            )
+        shape_matches[i] = inp
+        inp["matched"] = True
+        named_matches += 1
+        unit_score_total += us
+        # Invoke limits on the matched value
+        limit_fail_val = _run_limits(plan.limits[i], inp["value"], frame)
+        if limit_fail_val is not None:
+            return MorphResult.failed(_extract_fail_message(limit_fail_val), failure_value=limit_fail_val)
 
     # Phase 2: Tag matching
     for i, shape_field in enumerate(shape_fields):
         if i in shape_matches:
             continue  # Already matched
 
-        constraint = _resolve_shape_field(shape_field, frame)
+        constraint = plan.constraint(i, frame)
         if not isinstance(constraint, comp.Tag):
             continue  # Only tag constraints participate in tag matching
 
@@ -704,7 +878,7 @@ def _morph_core(value, shape, frame):
             tag_depth_total += best_depth
             unit_score_total += best_us
             # Invoke limits on the matched value
-            limit_fail_val = _invoke_limits(shape_field, best_match["value"], frame)
+            limit_fail_val = _run_limits(plan.limits[i], best_match["value"], frame)
             if limit_fail_val is not None:
                 return MorphResult.failed(_extract_fail_message(limit_fail_val), failure_value=limit_fail_val)
             continue
@@ -750,7 +924,7 @@ def _morph_core(value, shape, frame):
             promoted_match["matched"] = True
             tag_depth_total += promoted_depth
             unit_score_total += promoted_us
-            limit_fail_val = _invoke_limits(shape_field, promoted_value, frame)
+            limit_fail_val = _run_limits(plan.limits[i], promoted_value, frame)
             if limit_fail_val is not None:
                 return MorphResult.failed(_extract_fail_message(limit_fail_val), failure_value=limit_fail_val)
 
@@ -769,7 +943,7 @@ def _morph_core(value, shape, frame):
             unmatched_input_idx += 1
 
             # Validate type
-            constraint = _resolve_shape_field(shape_field, frame)
+            constraint = plan.constraint(i, frame)
             if _check_type(inp["value"], constraint, frame):
                 # Validate unit compatibility
                 us = _unit_match_score(inp["value"].unit, shape_field.unit)
@@ -782,7 +956,7 @@ def _morph_core(value, shape, frame):
                 positional_matches += 1
                 unit_score_total += us
                 # Invoke limits on the matched value
-                limit_fail_val = _invoke_limits(shape_field, inp["value"], frame)
+                limit_fail_val = _run_limits(plan.limits[i], inp["value"], frame)
                 if limit_fail_val is not None:
                     return MorphResult.failed(_extract_fail_message(limit_fail_val), failure_value=limit_fail_val)
                 break
@@ -800,7 +974,7 @@ def _morph_core(value, shape, frame):
                     inp["matched"] = True
                     positional_matches += 1
                     unit_score_total += us
-                    limit_fail_val = _invoke_limits(shape_field, coerced, frame)
+                    limit_fail_val = _run_limits(plan.limits[i], coerced, frame)
                     if limit_fail_val is not None:
                         return MorphResult.failed(_extract_fail_message(limit_fail_val), failure_value=limit_fail_val)
                     break
@@ -820,7 +994,7 @@ def _morph_core(value, shape, frame):
         else:
             # No explicit default — check if the field's type is a ShapeUnion
             # with its own default (e.g. ~tree | nil = nil)
-            constraint = _resolve_shape_field(shape_field, frame)
+            constraint = plan.constraint(i, frame)
             if isinstance(constraint, comp.ShapeUnion) and constraint.default is not None:
                 shape_matches[i] = {"value": constraint.default, "name": shape_field.name}
             else:
@@ -836,9 +1010,8 @@ def _morph_core(value, shape, frame):
         if i not in shape_matches:
             continue
         inp = shape_matches[i]
-        if shape_field.name:
-            key = comp.Value.from_python(shape_field.name)
-        else:
+        key = plan.keys[i]
+        if key is None:
             key = comp.Unnamed()
         result_data[key] = inp["value"]
 
@@ -853,6 +1026,80 @@ def _morph_core(value, shape, frame):
     return MorphResult(result_value, named_matches, tag_depth_total, unit_score_total, positional_matches)
 
 
+def _exact_layout(data, plan, frame):
+    """Check that a struct's keys and value types line up with a plan's fields.
+
+    The struct conforms when it has one field per shape field, in order,
+    with each named shape field matched by a field of the same name and
+    each positional shape field by an unnamed field whose value passes the
+    type check.
+
+    Args:
+        data: (dict) Struct data to check
+        plan: (MorphPlan) Compiled plan for the target shape
+        frame: (ExecutionFrame) Frame for type checks
+
+    Returns:
+        (bool) True if the layout conforms
+    """
+    if len(data) != plan.count:
+        return False
+    for (key, val), name, constraint in zip(data.items(), plan.names, plan.constraints):
+        if name is None:
+            if not isinstance(key, comp.Unnamed):
+                return False
+        elif isinstance(key, comp.Unnamed) or key.data != name:
+            return False
+        if not _check_type(val, constraint, frame):
+            return False
+    return True
+
+
+def _morph_exact(value, plan, frame):
+    """Morph a struct that already has the shape's layout.
+
+    Produces the same result and score as the full matching phases would,
+    but without building match tables.  Returns None whenever the value
+    does not conform or a unit is incompatible, leaving the full matching
+    path to produce the result and any failure message.
+
+    Args:
+        value: (Value) Struct value to morph
+        plan: (MorphPlan) Compiled plan for the target shape
+        frame: (ExecutionFrame) Frame for type checks and limits
+
+    Returns:
+        (MorphResult | None) The morph result, or None to use the full path
+    """
+    data = value.data
+    if not _exact_layout(data, plan, frame):
+        return None
+    unit_score_total = 0
+    for val, unit in zip(data.values(), plan.units):
+        us = _unit_match_score(val.unit, unit)
+        if us == -1:
+            return None
+        unit_score_total += us
+
+    # Limits run in the same order the matching phases would run them
+    named_matches = 0
+    values = list(data.values())
+    for i, name in enumerate(plan.names):
+        if name is not None:
+            named_matches += 1
+            limit_fail_val = _run_limits(plan.limits[i], values[i], frame)
+            if limit_fail_val is not None:
+                return MorphResult.failed(_extract_fail_message(limit_fail_val), failure_value=limit_fail_val)
+    for i, name in enumerate(plan.names):
+        if name is None:
+            limit_fail_val = _run_limits(plan.limits[i], values[i], frame)
+            if limit_fail_val is not None:
+                return MorphResult.failed(_extract_fail_message(limit_fail_val), failure_value=limit_fail_val)
+
+    positional_matches = plan.count - named_matches
+    return MorphResult(comp.Value(dict(data)), named_matches, 0, unit_score_total, positional_matches)
+
+
 def mask(value, shape, frame):
     """Mask a value to match a shape, dropping extra fields.
 
@@ -875,7 +1122,7 @@ def mask(value, shape, frame):
 
     # Handle union shapes - try each member, return first successful match
     if isinstance(shape, comp.ShapeUnion):
-        for member_shape in shape.shapes:
+        for member_shape in _shape_plan(shape).source:
             result_val, error = mask(value, member_shape, frame)
             if error is None:
                 return result_val, None
@@ -883,10 +1130,11 @@ def mask(value, shape, frame):
 
     # ~nil is a universal sink: any value masked to ~nil produces nil
     if isinstance(shape, comp.Tag) and shape is comp.tag_nil:
-        return comp.Value(comp.tag_nil), None
+        return comp.value_nil, None
 
     # Get shape fields (Tags have no fields, they just act as type constraints)
-    shape_fields = getattr(shape, "fields", None) or []
+    plan = _shape_plan(shape) if isinstance(shape, comp.Shape) else None
+    shape_fields = plan.fields if plan is not None else []
 
     # Handle non-struct values by promoting to single-element struct
     if not isinstance(value.data, dict):
@@ -915,12 +1163,20 @@ def mask(value, shape, frame):
                 return inner_val, None
             return None, f"Cannot mask struct to scalar shape {_shape_name(shape)}"
 
+    # Values already laid out like the shape have nothing to drop or match
+    if plan.exact and _exact_layout(value.data, plan, frame):
+        return comp.Value(dict(value.data)), None
+
     # Build list of input fields
     input_fields = []
+    by_name = {}
     for key, val in value.data.items():  # type: ignore[union-attr]
         name = _get_field_key(key)
         tag = _get_value_tag(val)
-        input_fields.append({"key": key, "name": name, "tag": tag, "value": val, "matched": False})
+        inp = {"key": key, "name": name, "tag": tag, "value": val, "matched": False}
+        input_fields.append(inp)
+        if name is not None and name in plan.index:
+            by_name.setdefault(name, inp)
 
     # Track which shape fields are satisfied
     shape_matches = {}
@@ -930,24 +1186,21 @@ def mask(value, shape, frame):
         if shape_field.name is None:
             continue
 
-        for inp in input_fields:
-            if inp["matched"]:
-                continue
-            if inp["name"] == shape_field.name:
-                # Validate type
-                constraint = _resolve_shape_field(shape_field, frame)
-                if not _check_type(inp["value"], constraint, frame):
-                    return None, f"Field '{shape_field.name}' has wrong type"
-                shape_matches[i] = inp
-                inp["matched"] = True
-                break
+        inp = by_name.get(shape_field.name)
+        if inp is None or inp["matched"]:
+            continue
+        # Validate type
+        if not _check_type(inp["value"], plan.constraint(i, frame), frame):
+            return None, f"Field '{shape_field.name}' has wrong type"
+        shape_matches[i] = inp
+        inp["matched"] = True
 
     # Phase 2: Tag matching
     for i, shape_field in enumerate(shape_fields):
         if i in shape_matches:
             continue
 
-        constraint = _resolve_shape_field(shape_field, frame)
+        constraint = plan.constraint(i, frame)
         if not isinstance(constraint, comp.Tag):
             continue
 
@@ -984,7 +1237,7 @@ def mask(value, shape, frame):
             unmatched_input_idx += 1
 
             # Validate type
-            constraint = _resolve_shape_field(shape_field, frame)
+            constraint = plan.constraint(i, frame)
             if not _check_type(inp["value"], constraint, frame):
                 # Try recursive coercion (e.g. RawTag → Tag via sub-shape)
                 sub_result = morph(inp["value"], constraint, frame)
@@ -1015,9 +1268,8 @@ def mask(value, shape, frame):
         if i not in shape_matches:
             continue
         inp = shape_matches[i]
-        if shape_field.name:
-            key = comp.Value.from_python(shape_field.name)
-        else:
+        key = plan.keys[i]
+        if key is None:
             key = comp.Unnamed()
         result_data[key] = inp["value"]
 
@@ -92,6 +92,9 @@ def num_from_decimal_str(s):
 
 # ---------------------------------------------------------------------------
 # Arithmetic  (always produce a new reduced tuple)
+#
+# Whole numbers (d == 1) are by far the most common operands, so each
+# operation checks for them first and skips the gcd reduction entirely.
 # ---------------------------------------------------------------------------
 
 def num_add(a, b):
@@ -106,9 +109,11 @@ def num_add(a, b):
     """
     an, ad, adp = a
     bn, bd, bdp = b
+    dp = adp if adp > bdp else bdp
+    if ad == 1 and bd == 1:
+        return (an + bn, 1, dp)
     n = an * bd + bn * ad
     d = ad * bd
-    dp = adp if adp > bdp else bdp
     g = math.gcd(n if n >= 0 else -n, d)
     return (n // g, d // g, dp)
 
@@ -125,9 +130,11 @@ def num_sub(a, b):
     """
     an, ad, adp = a
     bn, bd, bdp = b
+    dp = adp if adp > bdp else bdp
+    if ad == 1 and bd == 1:
+        return (an - bn, 1, dp)
     n = an * bd - bn * ad
     d = ad * bd
-    dp = adp if adp > bdp else bdp
     g = math.gcd(n if n >= 0 else -n, d)
     return (n // g, d // g, dp)
 
@@ -144,9 +151,11 @@ def num_mul(a, b):
     """
     an, ad, adp = a
     bn, bd, bdp = b
+    dp = adp if adp > bdp else bdp
+    if ad == 1 and bd == 1:
+        return (an * bn, 1, dp)
     n = an * bn
     d = ad * bd
-    dp = adp if adp > bdp else bdp
     g = math.gcd(n if n >= 0 else -n, d)
     return (n // g, d // g, dp)
 
@@ -168,11 +177,13 @@ def num_div(a, b):
     bn, bd, bdp = b
     if bn == 0:
         raise ZeroDivisionError("division by zero")
+    dp = adp if adp > bdp else bdp
+    if ad == 1 and bd == 1 and an % bn == 0:
+        return (an // bn, 1, dp)
     n = an * bd
     d = ad * bn
     if d < 0:
         n, d = -n, -d
-    dp = adp if adp > bdp else bdp
     g = math.gcd(n if n >= 0 else -n, d)
     return (n // g, d // g, dp)
 
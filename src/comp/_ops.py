@@ -18,6 +18,9 @@ import comp
 import math
 
 
+_WHOLE_OPS = frozenset(("+", "-", "*"))
+
+
 def math_binary(op, left, right):
     """Math binary operation.
 
@@ -35,14 +38,16 @@ def math_binary(op, left, right):
         TypeError: If operands are not numeric
         ZeroDivisionError: If dividing by zero
     """
-    # Unwrap single-field structs (e.g., from parenthesized expressions)
-    left = left.as_scalar()
-    right = right.as_scalar()
+    # Number data is always a tuple; anything else needs unwrapping and checks
+    if type(left.data) is not tuple or type(right.data) is not tuple:
+        # Unwrap single-field structs (e.g., from parenthesized expressions)
+        left = left.as_scalar()
+        right = right.as_scalar()
 
-    if left.shape != comp.shape_num:
-        raise TypeError(f"Left operand is not a number: {left.format()}")
-    if right.shape != comp.shape_num:
-        raise TypeError(f"Right operand is not a number: {right.format()}")
+        if left.shape != comp.shape_num:
+            raise TypeError(f"Left operand is not a number: {left.format()}")
+        if right.shape != comp.shape_num:
+            raise TypeError(f"Right operand is not a number: {right.format()}")
 
     ln, ld, ldp = left.data
     rn, rd, rdp = right.data
@@ -53,6 +58,21 @@ def math_binary(op, left, right):
             import comp._unit_conv as _uc
             rn, rd = _uc.convert_rational(rn, rd, right.unit, left.unit)
 
+    # Whole numbers need no denominator math or gcd reduction
+    if ld == 1 and rd == 1 and op in _WHOLE_OPS:
+        if op == "+":
+            n = ln + rn
+        elif op == "-":
+            n = ln - rn
+        else:
+            n = ln * rn
+        dp = ldp if ldp > rdp else rdp
+        if left.unit is not None:
+            return comp.Value((n, 1, dp)).with_unit(left.unit)
+        if dp == 0:
+            return comp.int_value(n)
+        return comp.Value((n, 1, dp))
+
     if op == "+":
         n = ln * rd + rn * ld
         d = ld * rd
@@ -77,6 +97,10 @@ def math_binary(op, left, right):
         raise ValueError(f"Unknown math binary operator: {op}")
 
     g = math.gcd(n if n >= 0 else -n, d)
+    if left.unit is None:
+        if d == g and dp == 0:
+            return comp.int_value(n // g)
+        return comp.Value((n // g, d // g, dp))
     return comp.Value((n // g, d // g, dp)).with_unit(left.unit)
 
 
@@ -213,8 +237,31 @@ def compare(op, left, right):
             raise ValueError(f"Unknown comparison operator: {op}")
 
     if result:
-        return comp.Value(comp.tag_true)
-    return comp.Value(comp.tag_false)
+        return comp.value_true
+    return comp.value_false
+
+
+def _compare_num(lval, rval):
+    """Order two number tuples by value, then by display hint.
+
+    Args:
+        lval: (tuple) Left (n, d, dp)
+        rval: (tuple) Right (n, d, dp)
+
+    Returns:
+        (int) -1, 0 or 1
+    """
+    ln, ld, ldp = lval
+    rn, rd, rdp = rval
+    if ld != 1 or rd != 1:
+        # Cross multiply; denominators are always positive
+        ln, rn = ln * rd, rn * ld
+    if ln != rn:
+        return -1 if ln < rn else 1
+    # Same value written differently (2 and 2.0) is still distinct data
+    if ldp != rdp:
+        return -1 if ldp < rdp else 1
+    return 0
 
 
 def _compare(left, right):
@@ -257,11 +304,7 @@ def _compare(left, right):
                     rval = (rn, rd, rval[2])
                 except comp.EvalError:
                     pass  # Different families: fall through to raw comparison
-        if lval < rval:
-            return -1
-        if lval > rval:
-            return 1
-        return 0
+        return _compare_num(lval, rval)
 
     if lshape is comp.shape_text:
         if lval < rval:
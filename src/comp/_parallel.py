@@ -0,0 +1,136 @@
+"""Parse module statements in worker processes.
+
+Parsing every definition body (lark_parse + lark_to_cop) is the largest
+part of ``build_namespaces`` on a cold start, and it is pure CPU work
+that needs no Module state.  A ParsePool hands the bodies of all modules
+that have not built their definitions yet to a ProcessPoolExecutor in
+batches.  Workers encode COP trees the same way the BuildCache stores
+them and send each batch back as one marshal blob; both ends run the
+same Python, and marshal loads these nested lists many times faster than
+cbor2, which matters because decoding is the part that stays serial.
+Results are left on the module for ``Module.definitions()`` to pick up
+in place of parsing.
+
+Anything a worker cannot parse or encode is simply left out, and the
+module parses it itself, so errors are raised and reported exactly as
+in a serial build.
+"""
+
+__all__ = [
+]
+
+import concurrent.futures
+import marshal
+import os
+
+import comp
+
+
+class ParsePool:
+    """Pool of worker processes for parsing statement bodies.
+
+    Assign an instance to ``Interp.parse_pool`` before building.  The
+    processes start on first use and live until ``close()``, which
+    ``Interp.build_namespaces()`` calls once it has prefetched.  A later
+    ``prefetch()`` starts them again.
+
+    Args:
+        workers: (int | None) Number of processes; None uses os.cpu_count()
+
+    Attributes:
+        workers: (int) Number of processes
+        parsed: (int) Statements parsed by workers so far
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.parsed = 0
+        self._executor = None
+        self._codec = comp._cache.CopCodec()
+
+    def __repr__(self):
+        return f"ParsePool<{self.workers} workers>"
+
+    def prefetch(self, modules, cache=None):
+        """Parse the definition statements of modules ahead of time.
+
+        Modules that already built (or failed to build) their definitions
+        are skipped, as are statements the build cache already holds.
+
+        Args:
+            modules: (list) Modules about to build their definitions
+            cache: (BuildCache | None) Cache consulted for existing parses
+
+        Returns:
+            (int) Number of statements parsed
+        """
+        jobs = []
+        for mod in modules:
+            if mod._definitions is not None or mod._definitions_error is not None:
+                continue
+            try:
+                statements = mod.statements()
+            except Exception:
+                continue
+            for stmt in statements:
+                if stmt.operator not in comp._compiler.START_RULES:
+                    continue
+                if cache is not None and cache.has_parsed(mod, cache.statement_key(stmt)):
+                    continue
+                jobs.append((mod, stmt))
+        if not jobs:
+            return 0
+
+        # A few batches per worker keeps them busy when modules differ in size
+        size = max(1, -(-len(jobs) // (self.workers * 4)))
+        batches = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        payloads = [
+            [(stmt.operator, stmt.name, stmt.pos, stmt.body, stmt.body_col) for _mod, stmt in batch]
+            for batch in batches
+        ]
+        count = 0
+        for batch, blob in zip(batches, self._start().map(_parse_batch, payloads)):
+            for (mod, stmt), encoded in zip(batch, marshal.loads(blob)):
+                if encoded is None:
+                    continue
+                cop = self._codec.decode(encoded)
+                if cop is None:
+                    continue
+                if mod._parsed_cops is None:
+                    mod._parsed_cops = {}
+                mod._parsed_cops[id(stmt)] = cop
+                count += 1
+        self.parsed += count
+        return count
+
+    def close(self):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _start(self):
+        if self._executor is None:
+            # Load the grammars first so forked workers inherit them
+            for rule in set(comp._compiler.START_RULES.values()):
+                comp._parse._parser("comp", rule)
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+
+def _parse_batch(payload):
+    """Worker: parse statement bodies, returning their encoded COPs marshalled.
+
+    Statements that fail to parse or encode come back as None.
+    """
+    codec = comp._cache.CopCodec()
+    results = []
+    for operator, name, pos, body, body_col in payload:
+        stmt = comp._scan.Statement(operator, name, tuple(pos), body, body_col)
+        try:
+            cop = comp._compiler.parse_statement(stmt)
+        except (comp.ParseError, comp.CodeError):
+            results.append(None)
+            continue
+        results.append(codec.encode(cop))
+    return marshal.dumps(results)
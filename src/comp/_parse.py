@@ -59,9 +59,25 @@ def lark_parse(text, grammar, rule=None, line_offset=1, col_offset=0):
         comp.ParseError: When the source text cannot be parsed, with
             user-friendly context showing the offending line and position.
     """
+    global _time_parse
+    parser = _parser(grammar, rule)
+
+    padded = "\n" * (line_offset - 1) + " " * col_offset + text
+    _p0 = _time.perf_counter()
+    try:
+        tree = parser.parse(padded)
+    except lark.exceptions.UnexpectedInput as e:
+        raise _format_lark_error(e, text, line_offset) from None
+    finally:
+        _time_parse += _time.perf_counter() - _p0
+    return tree
+
+
+def _parser(grammar, rule=None):
+    """Get the Lark parser for a grammar and start rule, loading it once."""
     # If start is specified, create a unique key for caching
     cache_key = f"{grammar}:{rule}" if rule else grammar
-    global _time_grammar_init, _time_parse
+    global _time_grammar_init
     parser = _parsers.get(cache_key)
     if parser is None:
         path = f"lark/{grammar}.lark"
@@ -80,17 +96,7 @@ def lark_parse(text, grammar, rule=None, line_offset=1, col_offset=0):
         parser = lark.Lark.open(path, rel_to=__file__, **parser_kwargs)
         _time_grammar_init += _time.perf_counter() - _gi0
         _parsers[cache_key] = parser
-
-
-    padded = "\n" * (line_offset - 1) + " " * col_offset + text
-    _p0 = _time.perf_counter()
-    try:
-        tree = parser.parse(padded)
-    except lark.exceptions.UnexpectedInput as e:
-        raise _format_lark_error(e, text, line_offset) from None
-    finally:
-        _time_parse += _time.perf_counter() - _p0
-    return tree
+    return parser
 
 
 def _format_lark_error(exc, source_text, line_offset):
@@ -0,0 +1,390 @@
+"""Persistent struct storage with structural sharing.
+
+Struct data is normally a dict, and every update copies it.  For large
+structs that are updated one field at a time (deep assignment, merge of
+a small struct over a big one, the @update wrapper) that copy dominates.
+PersistentStruct stores the fields in a persistent vector of (key, value)
+entries plus a hash array mapped trie from key to position.  Setting or
+appending a field returns a new struct that shares all untouched nodes
+with the original, so each update costs O(log n).
+
+PersistentStruct is a dict subclass that answers every read from its
+persistent storage, so code that treats struct data as a mapping works
+unchanged.  Its own dict storage stays empty; ``to_struct()`` gives a
+plain Struct when real dict storage is wanted.
+"""
+
+__all__ = ["PersistentStruct", "struct_assoc", "struct_update", "PERSISTENT_THRESHOLD"]
+
+import comp
+
+
+# Structs with at least this many fields switch to persistent storage
+# when they are updated.  Smaller structs are cheaper to copy.
+PERSISTENT_THRESHOLD = 32
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+_HASH_MASK = (1 << 64) - 1
+_MAX_SHIFT = 60
+_MISSING = object()
+
+
+# ---------------------------------------------------------------------------
+# Hash array mapped trie (key -> position)
+# ---------------------------------------------------------------------------
+
+class _Node:
+    """Bitmap indexed trie node.
+
+    Each array entry is either a (key, position) leaf tuple, a child _Node,
+    or a _Collision for keys whose full hashes are equal.
+    """
+
+    __slots__ = ("bitmap", "array")
+
+    def __init__(self, bitmap, array):
+        self.bitmap = bitmap
+        self.array = array
+
+
+class _Collision:
+    """Leaf holding several keys that share the same full hash."""
+
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, hash_, entries):
+        self.hash = hash_
+        self.entries = entries
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+def _hash(key):
+    return hash(key) & _HASH_MASK
+
+
+def _same_key(a, b):
+    return a is b or a == b
+
+
+def _trie_get(node, h, key):
+    shift = 0
+    while True:
+        bit = 1 << ((h >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return _MISSING
+        entry = node.array[(node.bitmap & (bit - 1)).bit_count()]
+        if type(entry) is tuple:
+            return entry[1] if _same_key(entry[0], key) else _MISSING
+        if type(entry) is _Collision:
+            for k, pos in entry.entries:
+                if _same_key(k, key):
+                    return pos
+            return _MISSING
+        node = entry
+        shift += _BITS
+
+
+def _trie_set(node, shift, h, key, pos):
+    """Return a new node with key mapped to pos."""
+    bit = 1 << ((h >> shift) & _MASK)
+    idx = (node.bitmap & (bit - 1)).bit_count()
+    array = node.array
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, array[:idx] + ((key, pos),) + array[idx:])
+    entry = array[idx]
+    if type(entry) is tuple:
+        if _same_key(entry[0], key):
+            replacement = (key, pos)
+        else:
+            replacement = _trie_split(entry, _hash(entry[0]), shift + _BITS, h, key, pos)
+    elif type(entry) is _Collision:
+        entries = [e for e in entry.entries if not _same_key(e[0], key)]
+        entries.append((key, pos))
+        replacement = _Collision(entry.hash, tuple(entries))
+    else:
+        replacement = _trie_set(entry, shift + _BITS, h, key, pos)
+    return _Node(node.bitmap, array[:idx] + (replacement,) + array[idx + 1:])
+
+
+def _trie_split(leaf, leaf_hash, shift, h, key, pos):
+    """Build the subtree holding an existing leaf and a new key."""
+    if leaf_hash == h or shift > _MAX_SHIFT:
+        return _Collision(h, (leaf, (key, pos)))
+    node = _trie_set(_EMPTY_NODE, shift, leaf_hash, leaf[0], leaf[1])
+    return _trie_set(node, shift, h, key, pos)
+
+
+# ---------------------------------------------------------------------------
+# Persistent vector (position -> (key, value))
+# ---------------------------------------------------------------------------
+
+def _vec_get(root, shift, tail, tail_start, index):
+    if index >= tail_start:
+        return tail[index - tail_start]
+    node = root
+    while shift > 0:
+        node = node[(index >> shift) & _MASK]
+        shift -= _BITS
+    return node[index & _MASK]
+
+
+def _vec_set(node, shift, index, item):
+    """Return a copy of the path to index with item stored there."""
+    slot = (index >> shift) & _MASK
+    if shift == 0:
+        return node[:slot] + (item,) + node[slot + 1:]
+    child = _vec_set(node[slot], shift - _BITS, index, item)
+    return node[:slot] + (child,) + node[slot + 1:]
+
+
+def _vec_push_leaf(node, shift, index, leaf):
+    """Return a copy of node with a full leaf block added at index."""
+    slot = (index >> shift) & _MASK
+    if shift == _BITS:
+        return node + (leaf,)
+    if slot < len(node):
+        child = _vec_push_leaf(node[slot], shift - _BITS, index, leaf)
+        return node[:slot] + (child,)
+    return node + (_vec_path(shift - _BITS, leaf),)
+
+
+def _vec_path(shift, leaf):
+    """Wrap a leaf block in single-child nodes down from shift."""
+    node = leaf
+    while shift > 0:
+        node = (node,)
+        shift -= _BITS
+    return node
+
+
+def _vec_leaves(node, shift):
+    if shift == 0:
+        yield node
+        return
+    for child in node:
+        yield from _vec_leaves(child, shift - _BITS)
+
+
+# ---------------------------------------------------------------------------
+# PersistentStruct
+# ---------------------------------------------------------------------------
+
+class PersistentStruct(comp.Struct):
+    """Immutable struct data with O(log n) field updates.
+
+    Created from existing struct data with ``from_struct()`` and derived
+    with ``assoc()``.  Reads go through the usual mapping methods; the
+    inherited dict storage is never filled.
+
+    Attributes:
+        count: (int) Number of fields
+        handles: (bool) True if any field value may contain handles
+    """
+
+    __slots__ = ("count", "handles", "_trie", "_root", "_shift", "_tail")
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self.handles = False
+        self._trie = _EMPTY_NODE
+        self._root = ()
+        self._shift = _BITS
+        self._tail = ()
+
+    @classmethod
+    def from_struct(cls, data):
+        """Build persistent storage holding the fields of struct data.
+
+        Args:
+            data: (dict) Struct data to copy
+
+        Returns:
+            (PersistentStruct) Struct with the same fields in the same order
+        """
+        if isinstance(data, PersistentStruct):
+            return data
+        result = cls()
+        for key, value in data.items():
+            result = result._append(key, value)
+        return result
+
+    def to_struct(self):
+        """Copy the fields into a plain dict-backed Struct.
+
+        Returns:
+            (Struct) Struct with the same fields in the same order
+        """
+        return comp.Struct(self.items())
+
+    def assoc(self, key, value):
+        """Return a new struct with one field replaced or appended.
+
+        Args:
+            key: (Value | Unnamed) Field key
+            value: (Value) Field value
+
+        Returns:
+            (PersistentStruct) Updated struct sharing storage with this one
+        """
+        pos = _trie_get(self._trie, _hash(key), key)
+        if pos is _MISSING:
+            return self._append(key, value)
+        result = self._copy()
+        tail_start = self._tail_start()
+        if pos >= tail_start:
+            offset = pos - tail_start
+            result._tail = self._tail[:offset] + ((key, value),) + self._tail[offset + 1:]
+        else:
+            result._root = _vec_set(self._root, self._shift, pos, (key, value))
+        result.handles = self.handles or bool(value.handles)
+        return result
+
+    def _append(self, key, value):
+        result = self._copy()
+        result._trie = _trie_set(self._trie, 0, _hash(key), key, self.count)
+        if len(self._tail) < _WIDTH:
+            result._tail = self._tail + ((key, value),)
+        else:
+            # Tail is full: push it into the trie and start a new one
+            tail_start = self._tail_start()
+            if (tail_start >> _BITS) >= (1 << self._shift):
+                result._root = (self._root, _vec_path(self._shift, self._tail))
+                result._shift = self._shift + _BITS
+            else:
+                result._root = _vec_push_leaf(self._root, self._shift, tail_start, self._tail)
+            result._tail = ((key, value),)
+        result.count = self.count + 1
+        result.handles = self.handles or bool(value.handles)
+        return result
+
+    def _copy(self):
+        result = PersistentStruct.__new__(PersistentStruct)
+        result.count = self.count
+        result.handles = self.handles
+        result._trie = self._trie
+        result._root = self._root
+        result._shift = self._shift
+        result._tail = self._tail
+        result._items = None
+        return result
+
+    def _tail_start(self):
+        return self.count - len(self._tail)
+
+    def item_at(self, index):
+        return _vec_get(self._root, self._shift, self._tail, self._tail_start(), index)
+
+    def items(self):
+        result = []
+        if self._root:
+            for leaf in _vec_leaves(self._root, self._shift):
+                result.extend(leaf)
+        result.extend(self._tail)
+        return result
+
+    def keys(self):
+        return [key for key, _ in self.items()]
+
+    def values(self):
+        return [value for _, value in self.items()]
+
+    def get(self, key, default=None):
+        pos = _trie_get(self._trie, _hash(key), key)
+        if pos is _MISSING:
+            return default
+        return self.item_at(pos)[1]
+
+    def copy(self):
+        return self.to_struct()
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return _trie_get(self._trie, _hash(key), key) is not _MISSING
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __reversed__(self):
+        return reversed(self.keys())
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __eq__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            key in other and other[key] == value for key, value in self.items()
+        )
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"PersistentStruct({dict(self.items())!r})"
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("PersistentStruct is immutable, use assoc()")
+
+    __setitem__ = __delitem__ = _readonly
+    update = pop = popitem = setdefault = clear = _readonly
+
+
+def struct_assoc(data, key, value):
+    """Return new struct data with one field set.
+
+    Large structs are moved to persistent storage so repeated updates
+    share structure instead of copying every field.
+
+    Args:
+        data: (dict) Existing struct data, left unmodified
+        key: (Value | Unnamed) Field key to replace or append
+        value: (Value) New field value
+
+    Returns:
+        (dict) New struct data
+    """
+    if isinstance(data, PersistentStruct):
+        return data.assoc(key, value)
+    if len(data) >= PERSISTENT_THRESHOLD:
+        return PersistentStruct.from_struct(data).assoc(key, value)
+    result = comp.Struct(data)
+    result[key] = value
+    return result
+
+
+def struct_update(data, fields):
+    """Return new struct data with several fields set in order.
+
+    Args:
+        data: (dict) Existing struct data, left unmodified
+        fields: (iterable) (key, value) pairs to replace or append
+
+    Returns:
+        (dict) New struct data
+    """
+    if isinstance(data, PersistentStruct) or len(data) >= PERSISTENT_THRESHOLD:
+        result = PersistentStruct.from_struct(data)
+        for key, value in fields:
+            result = result.assoc(key, value)
+        return result
+    result = comp.Struct(data)
+    for key, value in fields:
+        result[key] = value
+    return result
@@ -270,7 +270,7 @@ def _try_eval_binding(cop, kids, namespace, interp):
     if not _args_are_pure(args_const):
         return None
 
-    nil_val = comp.Value.from_python(comp.tag_nil)
+    nil_val = comp.value_nil
     block = _resolve_pure_callable(qualified, namespace, nil_val)
     if block is None:
         return None
@@ -334,7 +334,7 @@ def _eval_pure_pipeline(cop, namespace, interp):
 
         # Fold args for this stage (including all-constant structs)
         stage_evaled = _eval_pure_in_cop(args_cop, namespace, interp) if args_cop is not None else None
-        args_value = _eval_const_cop(stage_evaled, interp) if stage_evaled is not None else comp.Value.from_python({})
+        args_value = _eval_const_cop(stage_evaled, interp) if stage_evaled is not None else comp.value_empty
         if args_cop is not None and args_value is None:
             break  # Args not constant
 
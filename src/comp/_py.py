@@ -209,7 +209,7 @@ def _python_to_comp(obj):
     if isinstance(obj, comp.Value):
         return obj
     if obj is None:
-        return comp.Value(comp.tag_nil)
+        return comp.value_nil
     if isinstance(obj, bool):
         return comp.Value(comp.tag_true if obj else comp.tag_false)
     if isinstance(obj, int):
@@ -540,7 +540,7 @@ def _create_py_module(module):
         if isinstance(obj, str):
             return comp.Value(obj)
         if obj is None:
-            return comp.Value(comp.tag_nil)
+            return comp.value_nil
         raise comp.CodeError(
             f"load-const: {type(obj).__name__!r} is not a scalar constant; "
             f"use py.lookup + py.load for complex values"
@@ -615,7 +615,7 @@ def _create_py_module(module):
         inst = input_val.data
         if isinstance(inst, comp.HandleInstance) and not inst.released:
             inst.released = True
-        return comp.Value(comp.tag_nil)
+        return comp.value_nil
 
     def _typeof(input_val, args_val, frame):
         """Return the Python type name of a @py object as a string.
@@ -4,20 +4,120 @@ __all__ = [
 ]
 
 import hashlib
-import lark
 import comp
 
 
+class ScanResult:
+    """Statements and comments found by ``scan()``.
+
+    Kept as plain Python objects so the module pipeline can read them
+    directly.  ``to_value()`` builds the equivalent Value struct, once,
+    for code that wants one.
+
+    Attributes:
+        statements: (list) Statement objects in source order
+        docs: (list) Comment objects in source order
+    """
+
+    __slots__ = ("statements", "docs", "_value")
+
+    def __init__(self, statements, docs):
+        self.statements = statements
+        self.docs = docs
+        self._value = None
+
+    def to_value(self):
+        """Struct Value with "statements" and "docs" lists of field structs."""
+        if self._value is None:
+            self._value = comp.Value.from_python({
+                "statements": [stmt.to_python() for stmt in self.statements],
+                "docs": [doc.to_python() for doc in self.docs],
+            })
+        return self._value
+
+
+class _Record:
+    """Fixed set of named fields, read as attributes."""
+
+    __slots__ = ()
+    _fields = ()
+
+    def to_python(self):
+        """Fields as a dict."""
+        return {key: getattr(self, key) for key in self._fields}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_python()!r})"
+
+
+class Statement(_Record):
+    """A module-level ``!operator name body`` statement.
+
+    Attributes:
+        operator: (str) Operator without the ``!`` (e.g. "import", "func")
+        name: (str) Definition name, empty for nameless operators
+        pos: (tuple) (line, col, end_line, end_col)
+        body: (str) Raw source text after the name
+        body_col: (int) Column where the body starts
+        hash: (str) Blake2s digest of the body, for change detection
+    """
+
+    __slots__ = ("operator", "name", "pos", "body", "body_col", "_hash")
+    _fields = ("operator", "name", "pos", "body", "body_col", "hash")
+
+    def __init__(self, operator, name, pos, body="", body_col=0, hash=None):
+        self.operator = operator
+        self.name = name
+        self.pos = pos
+        self.body = body
+        self.body_col = body_col
+        self._hash = hash
+
+    @property
+    def hash(self):
+        # Only the build cache and tooling read it, so digest on first use
+        if self._hash is None:
+            self._hash = hashlib.blake2s(self.body.encode('utf-8'), digest_size=8).hexdigest()
+        return self._hash
+
+    @property
+    def key(self):
+        """(str) Operator, name, body hash and position, for matching
+        the same statement across scans of edited source."""
+        line = self.pos[0] if self.pos else 1
+        return f"{self.operator}:{self.name}:{self.hash}:{line}:{self.body_col}"
+
+
+class Comment(_Record):
+    """A doc, line or block comment.
+
+    Attributes:
+        content: (str) Comment text without delimiters
+        pos: (tuple | None) (line, col, end_line, end_col)
+        type: (str | None) "doc", "line" or "block"
+    """
+
+    __slots__ = ("content", "pos", "type")
+    _fields = ("content", "pos", "type")
+
+    def __init__(self, content, pos=None, type=None):
+        self.content = content
+        self.pos = pos
+        self.type = type
+
+
 def scan(source):
-    """Scan source and extract module metadata as a Value.
+    """Scan source and extract module metadata.
 
-    Returns a Value struct containing:
-    - statements: list of (operator, name, pos, body) for all module statements
-    - docs: list of (content, pos) for comments (found anywhere in the tree)
+    Returns a ScanResult containing:
+    - statements: Statement (operator, name, pos, body) for all module statements
+    - docs: Comment (content, pos, type) for comments (found anywhere in the tree)
 
     Uses the scan.lark grammar which is error-resilient.
     """
+    import lark
     tree = comp._parse.lark_parse(source, "scan")
+    source_lines = source.split('\n')
 
     statement_list = []
     doc_list = []
@@ -33,7 +133,7 @@ def scan(source):
 
         if node.data == "mod_statement":
             # !operator name ...
-            stmt = _scan_mod_statement(node, source)
+            stmt = _scan_mod_statement(node, source_lines)
             if stmt:
                 statement_list.append(stmt)
         elif node.data == "doc_comment":
@@ -58,20 +158,15 @@ def scan(source):
 
     walk(tree)
 
-    # Create Value struct with the results
-    result = {
-        "statements": comp.Value.from_python(statement_list),
-        "docs": comp.Value.from_python(doc_list),
-    }
-    return comp.Value.from_python(result)
+    return ScanResult(statement_list, doc_list)
 
 
-
-def _scan_mod_statement(node, source):
+def _scan_mod_statement(node, source_lines):
     """Extract module definition info from mod_statement node.
 
-    Returns dict or None: (operator~str name~str pos~(num num num num) body~str)
+    Returns Statement or None
     """
+    import lark
     if len(node.children) < 1:
         return None
 
@@ -85,8 +180,7 @@ def _scan_mod_statement(node, source):
 
     # Extract name - can be dotted like "util.helper.format"
     # A trailing & marks the declaration as private (e.g. "resource&").
-    # The & is kept in the name string so it survives Value serialization;
-    # _module.py detects and strips it.
+    # The & is kept in the name string; _module.py detects and strips it.
     name_parts = []
     name_end_line = None
     name_end_col = None
@@ -136,7 +230,7 @@ def _scan_mod_statement(node, source):
         pos = (operator_token.line, operator_token.column,
                operator_token.end_line or operator_token.line,
                operator_token.end_column or operator_token.column)
-        return {"operator": operator, "name": "", "pos": pos, "body": "", "body_col": 0, "hash": ""}
+        return Statement(operator, "", pos, hash="")
 
     name = ".".join(name_parts)
 
@@ -166,7 +260,6 @@ def _scan_mod_statement(node, source):
     body = ""
     if name_end_line and name_end_col:
         # Convert to 0-indexed
-        source_lines = source.split('\n')
         body_start_line = name_end_line - 1
         body_start_col = name_end_col
         body_end_line = pos[2] - 1  # pos is (line, col, end_line, end_col)
@@ -185,58 +278,44 @@ def _scan_mod_statement(node, source):
                 lines.append(source_lines[body_end_line][:body_end_col])
             body = '\n'.join(lines)
 
-    # Compute content hash for change detection
-    body_hash = hashlib.blake2s(body.encode('utf-8'), digest_size=8).hexdigest()
-
-    return {
-        "operator": operator,
-        "name": name,
-        "pos": pos,
-        "body": body,
-        "body_col": body_start_col if (name_end_line and name_end_col) else 0,
-        "hash": body_hash,
-    }
+    return Statement(operator, name, pos, body,
+                     body_start_col if (name_end_line and name_end_col) else 0)
 
 
 def _scan_doc_comment(node):
     """Extract doc comment from doc_comment node (/// line).
 
-    Returns dict or None: (content~str pos~(num num num num))
+    Returns Comment or None
     """
+    import lark
     for child in node.children:
         if isinstance(child, lark.Token) and child.type == "LINE_CONTENT":
             content = child.value.strip()
             pos = _pos_from_lark(node)
-            return {
-                "content": content,
-                "pos": pos,
-                "type": "doc",
-            }
+            return Comment(content, pos, "doc")
     return None
 
 
 def _scan_line_comment(node):
     """Extract line comment from line_comment node (// line).
 
-    Returns dict or None: (content~str pos~(num num num num))
+    Returns Comment or None
     """
+    import lark
     for child in node.children:
         if isinstance(child, lark.Token) and child.type == "LINE_CONTENT":
             content = child.value.strip()
             pos = _pos_from_lark(node)
-            return {
-                "content": content,
-                "pos": pos,
-                "type": "line",
-            }
+            return Comment(content, pos, "line")
     return None
 
 
 def _scan_block_comment(node):
     """Extract block comment from block_comment node (/* block */).
 
-    Returns dict or None: (content~str pos~(num num num num))
+    Returns Comment or None
     """
+    import lark
     for child in node.children:
         if isinstance(child, lark.Token) and child.type == "BLOCK_COMMENT":
             # Remove /* and */ delimiters
@@ -247,16 +326,13 @@ def _scan_block_comment(node):
                 content = content[1:].lstrip()
 
             pos = _pos_from_lark(node)
-            return {
-                "content": content,
-                "pos": pos,
-                "type": "block",
-            }
+            return Comment(content, pos, "block")
     return None
 
 
 def _extract_text_from_tree(tree):
     """Recursively extract all text content from a lark Tree."""
+    import lark
     if isinstance(tree, lark.Token):
         return tree.value
     elif isinstance(tree, lark.Tree):
@@ -269,6 +345,7 @@ def _extract_text_from_tree(tree):
 
 def _pos_from_lark(treetoken):
     """Create the position tuple from a lark Tree or Token value."""
+    import lark
     if isinstance(treetoken, lark.Token):
         token = treetoken
         return (
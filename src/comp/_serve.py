@@ -0,0 +1,275 @@
+"""Run programs from a long-lived interpreter with the stdlib prebuilt.
+
+A cold ``comp --eval`` spends most of its time building the stdlib
+modules every program imports.  ``comp serve`` builds them once into a
+warm Interp and listens on a Unix socket.  Each request forks a child
+that inherits the built state, loads the requested module on top of it
+(``build_instructions()`` builds only the modules added since the warm
+build) and runs the command line as usual.
+
+Clients pass their stdin, stdout and stderr over the socket (SCM_RIGHTS)
+along with the argv, working directory and environment, so the child
+writes straight to the client's terminal or pipes.  The child replies
+with one JSON line holding its pid, so the client can forward Ctrl-C,
+and one holding the exit status.
+
+A request runs any program as the server's user, so the socket is only
+accessible to that user and connections from other uids are refused.
+
+Stdlib modules that fail to build are left out of the warm state, along
+with the modules importing them.  A run that imports them builds them
+itself and reports their errors like a cold run does.
+"""
+
+__all__ = [
+]
+
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import traceback
+
+import comp
+
+
+# Seconds a client has to send its request once connected.  Requests are
+# read before forking, so a client that sends nothing stalls the server.
+_RECEIVE_TIMEOUT = 5.0
+
+
+def warm_interp(build_cache=None):
+    """Interp with every stdlib module built to phase 2.
+
+    Args:
+        build_cache: (BuildCache | None) Cache used for the build
+
+    Returns:
+        (Interp, list) The interpreter and (Module, Exception) errors from
+        modules every program loads, which could not be left out
+    """
+    skip = set()
+    while True:
+        interp = comp.Interp()
+        interp.build_cache = build_cache
+        names = [name for name in _stdlib_names(interp) if name not in skip]
+        for name in names:
+            try:
+                interp.module(name)
+            except (comp.ModuleNotFoundError, comp.ParseError, comp.CodeError):
+                skip.add(name)
+        errors = interp.build_instructions()
+        failed = _failed_names(interp, names, errors)
+        if not failed:
+            return interp, errors
+        skip.update(failed)
+
+
+def serve(interp, path, run):
+    """Answer client requests until interrupted.
+
+    Args:
+        interp: (Interp) Warm interpreter each child starts from
+        path: (str) Unix socket to listen on
+        run: (callable) Called in the child as ``run(argv, interp)``;
+            returns the exit status
+    """
+    listener = _listen(path)
+    # Children are never waited on
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    try:
+        while True:
+            conn, _addr = listener.accept()
+            if not _same_user(conn):
+                conn.close()
+                continue
+            conn.settimeout(_RECEIVE_TIMEOUT)
+            try:
+                request, fds = _receive(conn)
+            except (OSError, ValueError):  # Includes TimeoutError
+                conn.close()
+                continue
+            conn.settimeout(None)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            if os.fork() == 0:
+                listener.close()
+                _run_child(conn, request, fds, interp, run)
+            conn.close()
+            for fd in fds:
+                os.close(fd)
+    finally:
+        listener.close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def run_client(path, argv):
+    """Run a command line on the server listening at path.
+
+    Args:
+        path: (str) Unix socket of a ``comp serve`` process
+        argv: (list) Command line arguments, without the program name
+
+    Returns:
+        (int) Exit status of the run
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError as e:
+        print(f"comp: no server at {path} ({e.strerror}); start one with 'comp serve'",
+              file=sys.stderr)
+        return 1
+    request = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+    payload = json.dumps(request).encode("utf-8") + b"\n"
+    sys.stdout.flush()
+    sys.stderr.flush()
+    sent = socket.send_fds(sock, [payload], [0, 1, 2])
+    sock.sendall(payload[sent:])
+
+    reader = sock.makefile("rb")
+    pid = None
+    status = 1
+    while True:
+        try:
+            line = reader.readline()
+        except KeyboardInterrupt:
+            if pid is not None:
+                os.kill(pid, signal.SIGINT)
+            continue
+        if not line:
+            break  # Child died without reporting a status
+        reply = json.loads(line)
+        pid = reply.get("pid", pid)
+        if "exit" in reply:
+            status = reply["exit"]
+            break
+    sock.close()
+    return status
+
+
+def _stdlib_names(interp):
+    """Module names of the .comp files in the stdlib search paths."""
+    names = set()
+    for directory in interp.search_paths[:2]:
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            continue
+        names.update(entry[:-5] for entry in entries if entry.endswith(".comp"))
+    return sorted(names)
+
+
+def _failed_names(interp, names, errors):
+    """Names among the requested modules that failed or import a failure."""
+    failed = {id(mod) for mod, _exc in errors}
+    if not failed:
+        return set()
+    grown = True
+    while grown:
+        grown = False
+        for mod in interp._all_modules():
+            if id(mod) in failed:
+                continue
+            for child, _err in (mod._imports or {}).values():
+                if child is not None and id(child) in failed:
+                    failed.add(id(mod))
+                    grown = True
+                    break
+    return {name for name in names
+            if id(interp.module_cache.get(name)) in failed}
+
+
+def _listen(path):
+    """Bind a listening Unix socket, replacing a stale one at path."""
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+        else:
+            probe.close()
+            raise OSError(f"A server is already listening on {path}")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    # Before listen(), so nobody connects while the umask's mode applies
+    os.chmod(path, 0o600)
+    listener.listen()
+    return listener
+
+
+def _same_user(conn):
+    """Whether the peer of a Unix socket runs as this process's user.
+
+    Platforms without SO_PEERCRED rely on the socket's permissions.
+    """
+    option = getattr(socket, "SO_PEERCRED", None)
+    if option is None:
+        return True
+    fmt = "3i"  # struct ucred: pid, uid, gid
+    creds = conn.getsockopt(socket.SOL_SOCKET, option, struct.calcsize(fmt))
+    _pid, uid, _gid = struct.unpack(fmt, creds)
+    return uid == os.getuid()
+
+
+def _receive(conn):
+    """Read a request line and the three stdio descriptors sent with it."""
+    data, fds, _flags, _addr = socket.recv_fds(conn, 65536, 3)
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    if len(fds) != 3 or not data.endswith(b"\n"):
+        for fd in fds:
+            os.close(fd)
+        raise ValueError("Incomplete request")
+    return json.loads(data), fds
+
+
+def _run_child(conn, request, fds, interp, run):
+    """Forked child: adopt the client's stdio and environment, then run."""
+    status = 1
+    try:
+        conn.sendall(json.dumps({"pid": os.getpid()}).encode("utf-8") + b"\n")
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdout.reconfigure(line_buffering=os.isatty(1))
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        interp._set_working_dir(request["cwd"])
+        # --time reports this run only
+        interp.timings = {}
+        interp.dispatch_cache.hits = interp.dispatch_cache.misses = 0
+        comp._parse._time_grammar_init = comp._parse._time_parse = 0.0
+        try:
+            status = run(request["argv"], interp)
+        except SystemExit as e:
+            status = e.code
+        if status is None:
+            status = 0
+        elif not isinstance(status, int):
+            print(status, file=sys.stderr)
+            status = 1
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            conn.sendall(json.dumps({"exit": status}).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+        os._exit(status)
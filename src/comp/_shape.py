@@ -39,9 +39,12 @@ class Shape:
         module: (Module | None) The module that defined this shape
         fields: (list[ShapeField]) Field definitions for structure shapes
         limits: (list) Shape-level limit functions [(func_val, param_val_or_None)]
+        plan: (MorphPlan | None) Compiled morph tables, built on first morph
+        context_plan: (ContextPlan | None) Context injection tables, built
+            the first time the shape is used as an argument shape
     """
 
-    __slots__ = ("qualified", "private", "module", "fields", "limits")
+    __slots__ = ("qualified", "private", "module", "fields", "limits", "plan", "context_plan")
 
     def __init__(self, qualified, private):
         self.qualified = qualified
@@ -49,6 +52,8 @@ class Shape:
         self.private = private
         self.fields = []
         self.limits = []
+        self.plan = None
+        self.context_plan = None
 
     def __repr__(self):
         return f"Shape<{self.qualified}>"
@@ -86,13 +91,15 @@ class ShapeUnion:
     Attributes:
         shapes: (list) List of shape COPs or Shape objects in the union
         default: (Value | None) Default value for the union
+        plan: (MorphPlan | None) Compiled morph tables, built on first morph
     """
 
-    __slots__ = ("shapes", "default")
+    __slots__ = ("shapes", "default", "plan")
 
     def __init__(self, shapes, default=None):
         self.shapes = list(shapes)
         self.default = default
+        self.plan = None
 
     def __repr__(self):
         return f"ShapeUnion<{self.format()}>"
@@ -191,14 +198,16 @@ class ShapeCollection:
         element: (ShapeField) Element type + limits (no name or default)
         min_count: (int) Minimum number of elements (0 for unbounded lower end)
         max_count: (int | None) Maximum elements; None means no upper bound
+        plan: (MorphPlan | None) Compiled morph tables, built on first morph
     """
 
-    __slots__ = ("element", "min_count", "max_count")
+    __slots__ = ("element", "min_count", "max_count", "plan")
 
     def __init__(self, element, min_count=0, max_count=None):
         self.element = element
         self.min_count = min_count
         self.max_count = max_count
+        self.plan = None
 
     def __repr__(self):
         return f"ShapeCollection<{self.format()}>"
@@ -240,19 +249,20 @@ shape_union = Shape("union", False)
 shape_tag = Shape("tag", True)
 
 # Failure shape — defined here so it's available early; fields are set by
-# _init_shape_failure() which is called from __init__.py after all modules
-# are loaded.  The cause field is self-referential: shape_failure is created
-# before its fields so the ShapeUnion can safely reference it.
+# _init_shape_failure() which __init__.py calls once this module's other
+# names are in the comp namespace.  The cause field is self-referential:
+# shape_failure is created before its fields so the ShapeUnion can safely
+# reference it.
 shape_failure = Shape("failure", False)
 
 
 def _init_shape_failure():
     """Initialize shape_failure fields.
 
-    Called from __init__.py after all modules are fully loaded so that
-    Value.from_python can safely reference comp.Shape, comp.Block, etc.
+    Called from __init__.py once this module's other names are exported,
+    so that Value.from_python can reference comp.Shape, comp.Block, etc.
     """
-    nil_default = comp.Value.from_python(comp.tag_nil)
+    nil_default = comp.value_nil
     shape_failure.fields = [
         ShapeField(name="fail"),
         ShapeField(name="message", shape=shape_text, default=comp.Value.from_python("")),
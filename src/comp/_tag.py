@@ -13,6 +13,7 @@ __all__ = [
     "tag_fail_invoke",
     "tag_flow", "tag_flow_skip", "tag_flow_stop",
     "tag_less", "tag_equal", "tag_greater",
+    "value_nil", "value_true", "value_false",
     "create_tagdef",
     "HandleInstance",
     "grab_handle", "drop_handle", "pull_handle", "push_handle",
@@ -109,6 +110,11 @@ tag_less = Tag("ord.less", False)
 tag_equal = Tag("ord.equal", False)
 tag_greater = Tag("ord.greater", False)
 
+# Shared Values for the constant tags, used instead of wrapping them anew
+value_nil = comp._value._constant(tag_nil)
+value_true = comp._value._constant(tag_true)
+value_false = comp._value._constant(tag_false)
+
 
 def create_tagdef(qualified_name, private, cop_node, parent_tag=None):
     """Create a Tag from a value.tag COP node and wrap in a Value.
@@ -361,10 +367,10 @@ def drop_handle(handle_value, frame):
 
     # Re-dropping an already-released handle is a safe no-op
     if handle.released:
-        return comp.Value(tag_nil)
+        return value_nil
 
     handle.released = True
-    return comp.Value(tag_nil)
+    return value_nil
 
 
 def pull_handle(handle_value, frame):
@@ -395,7 +401,7 @@ def pull_handle(handle_value, frame):
         raise comp.EvalError(f"Cannot !pull from released handle {handle.format()}")
 
     if handle.private_data is None:
-        return comp.Value(tag_nil)
+        return value_nil
     return handle.private_data
 
 
@@ -428,4 +434,4 @@ def push_handle(handle_value, data_value, frame):
         raise comp.EvalError(f"Cannot !push to released handle {handle.format()}")
 
     handle.private_data = data_value
-    return comp.Value(tag_nil)
+    return value_nil
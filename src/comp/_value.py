@@ -1,9 +1,13 @@
 """Runtime values for the generator-based engine."""
 
-__all__ = ["Value", "Unnamed", "materialize_handles"]
+__all__ = [
+    "Value", "LazyValue", "Unnamed", "Struct", "struct_item", "text_key",
+    "materialize_handles", "value_empty", "int_value",
+]
 
 import decimal
 import fractions
+import itertools
 import re
 
 import comp
@@ -50,7 +54,7 @@ class Value:
             frozenset -- materialised set of HandleInstance objects, never empty
     """
 
-    __slots__ = ("data", "cop", "stash", "handles", "unit")
+    __slots__ = ("data", "cop", "stash", "handles", "unit", "_hash")
     _shapemap = None
     _shapetypes = None
 
@@ -76,6 +80,9 @@ class Value:
         # Three-state handle tracker (see class docstring for states).
         self.handles = None
 
+        # Structural hash of data, computed on first use (see __hash__)
+        self._hash = None
+
         # Data may not be valid for a Comp Value here, but accept it as-is in
         # the name of efficiency. The `validate_value` method can be used for
         # stricter checking.
@@ -87,6 +94,10 @@ class Value:
             # ~handle[file] constraints work via the existing _unit_match_score
             # path, exactly like ~num[time.second] works for numeric units.
             self.unit = data.tag
+        elif isinstance(data, comp.PersistentStruct):
+            # Persistent structs track handles as their fields are set
+            if data.handles:
+                self.handles = True
         elif isinstance(data, dict):
             # Cheap bloom check: any field containing handles taints this struct.
             if any(v.handles for v in data.values()):
@@ -100,6 +111,8 @@ class Value:
                 tuple: comp.shape_num,
                 str: comp.shape_text,
                 dict: comp.shape_struct,
+                Struct: comp.shape_struct,
+                comp.PersistentStruct: comp.shape_struct,
                 comp.Tag: comp.shape_tag,
                 comp.Callable: comp.shape_block,
                 comp.HandleInstance: comp.shape_handle,
@@ -131,6 +144,7 @@ class Value:
         new_val.stash = self.stash
         new_val.handles = self.handles
         new_val.unit = unit
+        new_val._hash = self._hash
         return new_val
 
     def format(self):
@@ -244,9 +258,9 @@ class Value:
                 raise TypeError(f"Cannot access field on non-struct value")
             if isinstance(field, int):
                 # Access by position
-                for i, (k, v) in enumerate(self.data.items()):
-                    if i == field:
-                        return v.to_python(rich_numbers=rich_numbers)
+                if 0 <= field < len(self.data):
+                    _, v = struct_item(self.data, field)
+                    return v.to_python(rich_numbers=rich_numbers)
                 raise IndexError(f"Struct field index {field} out of range")
             else:
                 # Access by name
@@ -323,14 +337,14 @@ class Value:
             return cls(value)
 
         if value is None:
-            return cls(comp.tag_nil)
+            return comp.value_nil
         if value is True:
-            return cls(comp.tag_true)
+            return comp.value_true
         if value is False:
-            return cls(comp.tag_false)
+            return comp.value_false
 
         if isinstance(value, int):
-            return cls((value, 1, 0))
+            return int_value(value)
         if isinstance(value, float):
             return cls(comp._num.num_from_decimal_str(str(value)))
         if isinstance(value, decimal.Decimal):
@@ -341,20 +355,30 @@ class Value:
             return cls((value.numerator // g, value.denominator // g, 0))
 
         if isinstance(value, dict):
-            struct = {}
+            if not value:
+                return value_empty
+            struct = Struct()
             for k, v in value.items():
-                if not isinstance(k, Unnamed):
+                if type(k) is str:
+                    k = text_key(k)
+                elif not isinstance(k, Unnamed):
                     k = cls.from_python(k)
                 struct[k] = cls.from_python(v)
             return cls(struct)
 
         if isinstance(value, (tuple, list)):
-            struct = {}
+            struct = Struct()
             for item in value:
                 struct[Unnamed()] = cls.from_python(item)
             return cls(struct)
 
         # Allow Tag, RawTag, Shape, ShapeUnion, Callable objects to be wrapped in Values
+        if value is comp.tag_nil:
+            return comp.value_nil
+        if value is comp.tag_true:
+            return comp.value_true
+        if value is comp.tag_false:
+            return comp.value_false
         if isinstance(value, (comp.Tag, comp.RawTag, comp.Shape, comp.ShapeUnion, comp.Callable)):
             return cls(value)
 
@@ -373,7 +397,7 @@ class Value:
                 f"Cannot access named field on non-struct value, {self.format()}"
             )
         if not isinstance(name, Value):
-            name = Value.from_python(name)
+            name = text_key(name)
         value = self.data.get(name)
         if value is None:
             raise KeyError(f"Struct field '{name.format()}' not found in value")
@@ -391,14 +415,14 @@ class Value:
             raise IndexError(
                 f"Positional index {index} out of range for struct with {len(self.data)} fields"
             )
-        for i, (k, v) in enumerate(self.data.items()):
-            if i == index:
-                return v
+        return struct_item(self.data, index)[1]
 
     def __repr__(self):
         return f"Value({self.format()})"
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Value):
             return False
         if self.unit is not other.unit:
@@ -429,12 +453,17 @@ class Value:
         return comp._ops._compare(self, other) >= 0
 
     def __hash__(self):
-        """Make Value hashable so it can be used as dict keys."""
-        if isinstance(self.data, dict):
-            # Dicts aren't hashable, use tuple of items
-            data_hash = hash(tuple(sorted(self.data.items())))
-        else:
-            data_hash = hash(self.data)
+        """Make Value hashable so it can be used as dict keys.
+
+        The structural hash of the data is computed once and kept on the
+        value, which is safe because values are immutable.  The unit is
+        mixed in afterwards since nested fields compare without units.
+        """
+        data_hash = self._hash
+        if data_hash is None:
+            data_hash = self._hash = _data_hash(self.data)
+        if self.unit is None:
+            return data_hash
         return hash((data_hash, self.unit))
 
 
@@ -476,6 +505,213 @@ class Value:
 #     return result
 
 
+class Struct(dict):
+    """Struct field storage with positional access.
+
+    A dict keyed by field name Values and Unnamed markers, in field order,
+    that can also fetch a field by position.  The position index is built
+    the first time it is needed and kept with the struct, so repeated
+    ``.#(idx)`` and ``item-at`` lookups are constant time.
+
+    Like any struct data, a Struct must not be modified once it is wrapped
+    in a Value.  Plain dicts remain valid struct data; they just fall back
+    to a linear scan for positional lookups.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._items = None
+
+    def item_at(self, index):
+        """Get the (key, value) pair at a position.
+
+        Args:
+            index: (int) Zero-based field position
+
+        Returns:
+            (tuple) The key and value at that position
+        """
+        items = self._items
+        if items is None or len(items) != len(self):
+            items = self._items = list(self.items())
+        return items[index]
+
+
+# The slot descriptor behind Value.data, which LazyValue wraps in a property
+_data_slot = Value.__dict__["data"]
+
+
+class LazyValue(Value):
+    """Struct Value whose fields are built by a function when first read.
+
+    Used for struct fields that are expensive to build and usually never
+    looked at, like the locals and context of invoke-data.  Everything
+    except ``data`` is set up front, so the caller must know whether the
+    struct will hold handles and how many fields it has without building
+    it.  The shape is always struct, so type checks and dispatch
+    signatures do not build it either.
+
+    Args:
+        build: (callable) Function returning the struct dict
+        size: (int) Number of fields the struct will have
+        handles: (None | True) Handle tracker state for the built struct
+    """
+
+    __slots__ = ("_build", "size")
+
+    def __init__(self, build, size, handles=None):
+        self._build = build
+        self.size = size
+        self.cop = None
+        self.unit = None
+        self.stash = None
+        self.handles = handles
+        self._hash = None
+
+    @property
+    def data(self):
+        build = self._build
+        if build is not None:
+            self._build = None
+            _data_slot.__set__(self, build())
+        return _data_slot.__get__(self)
+
+    @data.setter
+    def data(self, data):
+        self._build = None
+        _data_slot.__set__(self, data)
+
+    @property
+    def shape(self):
+        """(Shape) Always the struct shape."""
+        if self._build is not None:
+            return comp.shape_struct
+        return Value.shape.fget(self)
+
+
+def _constant(data):
+    """Build a shared Value for constant data that holds no handles.
+
+    Shared constants skip Value.__init__ so they can be created while the
+    package is still importing.  Their ids are recorded so code that
+    attaches a stash can avoid modifying a value everyone shares.
+    """
+    val = Value.__new__(Value)
+    val.data = data
+    val.cop = None
+    val.stash = None
+    val.handles = None
+    val.unit = None
+    val._hash = None
+    _constant_ids.add(id(val))
+    return val
+
+
+_constant_ids = set()
+
+# Shared empty struct, returned for every empty struct built from Python
+value_empty = _constant(Struct())
+
+# Shared Values for small whole numbers, the most common arithmetic results
+_SMALL_INT_MIN = -128
+_SMALL_INT_MAX = 1024
+_small_ints = tuple(_constant((n, 1, 0)) for n in range(_SMALL_INT_MIN, _SMALL_INT_MAX + 1))
+
+
+def int_value(n):
+    """Get a number Value for a Python integer.
+
+    Small integers come from a preallocated table instead of a new Value.
+
+    Args:
+        n: (int) Whole number
+
+    Returns:
+        (Value) Number value, possibly shared
+    """
+    if _SMALL_INT_MIN <= n <= _SMALL_INT_MAX:
+        return _small_ints[n - _SMALL_INT_MIN]
+    return Value((n, 1, 0))
+
+
+# Interned field key Values by name.  Bounded so runaway dynamic names
+# cannot grow it forever; past the limit keys are still built with a
+# precomputed hash, just not shared.
+_text_keys = {}
+_TEXT_KEY_LIMIT = 1 << 16
+
+
+def text_key(name):
+    """Get the shared text Value used as a struct key for a field name.
+
+    Field names from code and builtins repeat constantly.  Sharing one
+    Value per name avoids an allocation per lookup, and lets dict probes
+    match on identity and a precomputed hash instead of comparing values.
+
+    Args:
+        name: (str) Field name
+
+    Returns:
+        (Value) Text value for the name, shared between callers
+    """
+    key = _text_keys.get(name)
+    if key is None:
+        key = Value(name)
+        key._hash = hash(name)
+        if len(_text_keys) < _TEXT_KEY_LIMIT:
+            _text_keys[name] = key
+    return key
+
+
+def _data_hash(data):
+    """Hash value data consistently with _ops._equal.
+
+    Named struct fields compare regardless of order, so their hashes are
+    combined with a sum instead of sorting.  Unnamed fields compare by
+    position and are hashed in order.  Field hashes are cached on the
+    field values, so hashing a struct never rehashes its nested structs.
+
+    Args:
+        data: Value data of any type
+
+    Returns:
+        (int) Hash of the data, ignoring any unit
+    """
+    if not isinstance(data, dict):
+        return hash(data)
+    named = 0
+    unnamed = []
+    for key, value in data.items():
+        value_hash = value._hash
+        if value_hash is None:
+            value_hash = value._hash = _data_hash(value.data)
+        if isinstance(key, Unnamed):
+            unnamed.append(value_hash)
+        else:
+            named += hash((key.data, value_hash))
+    return hash((named & _HASH_MASK, tuple(unnamed)))
+
+
+_HASH_MASK = (1 << 64) - 1
+
+
+def struct_item(data, index):
+    """Get the (key, value) pair at a position in any struct data.
+
+    Args:
+        data: (dict) Struct data, a Struct or a plain dict
+        index: (int) Zero-based field position, already range checked
+
+    Returns:
+        (tuple) The key and value at that position
+    """
+    if isinstance(data, Struct):
+        return data.item_at(index)
+    return next(itertools.islice(data.items(), index, None))
+
+
 class Unnamed:
     """Marker for unnamed/positional fields in structures.
 
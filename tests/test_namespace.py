@@ -0,0 +1,63 @@
+"""The lazily loaded comp namespace."""
+
+import importlib
+import os
+import subprocess
+import sys
+
+import comp
+
+
+def _run(code):
+    """Run code in a fresh interpreter, where no submodule is loaded yet."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(comp.__file__))
+    result = subprocess.run([sys.executable, "-c", code], env=env,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_submodule_names_match_their_all():
+    for name, names in comp._SUBMODULES.items():
+        module = importlib.import_module(f"comp.{name}")
+        assert list(names) == list(module.__all__), name
+
+
+def test_star_import():
+    output = _run("from comp import *\n"
+                  "print(Value.__name__, Interp.__name__, runtime.__name__)")
+    assert output.split() == ["Value", "Interp", "comp.runtime"]
+
+
+def test_unknown_name():
+    output = _run("import comp\n"
+                  "print(hasattr(comp, 'nope'), hasattr(comp, 'Shape'))")
+    assert output.split() == ["False", "True"]
+
+
+def test_first_use_from_threads():
+    output = _run("""
+import threading
+import comp
+
+names = ["Interp", "value_nil", "Value", "Shape", "shape_failure", "Block",
+         "cop_tag", "lark_parse", "Callout", "morph", "PersistentStruct", "Const"]
+barrier = threading.Barrier(len(names))
+errors = []
+
+def read(name):
+    barrier.wait()
+    try:
+        getattr(comp, name)
+    except Exception as e:
+        errors.append(repr(e))
+
+threads = [threading.Thread(target=read, args=(name,)) for name in names]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(errors, len(comp.shape_failure.fields))
+""")
+    assert output.strip() == "[] 4"
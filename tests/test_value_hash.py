@@ -0,0 +1,43 @@
+"""Structural hashing of Values."""
+
+import types
+
+import comp
+import comp._interp
+
+
+def test_reordered_named_fields_hash_equal():
+    a = comp.Value.from_python({"x": 1, "y": "two", "z": {"n": 3}})
+    b = comp.Value.from_python({"z": {"n": 3}, "y": "two", "x": 1})
+    assert a == b
+    assert hash(a) == hash(b)
+
+
+def test_persistent_struct_hashes_like_plain_struct():
+    plain = comp.Value.from_python({f"f{i}": i for i in range(50)})
+    persistent = comp.Value(comp.PersistentStruct.from_struct(plain.data))
+    assert plain == persistent
+    assert hash(plain) == hash(persistent)
+
+
+def test_reordered_unnamed_fields_differ():
+    a = comp.Value.from_python([1, 2])
+    b = comp.Value.from_python([2, 1])
+    assert a != b
+    assert hash(a) != hash(b)
+
+
+def test_unit_changes_hash():
+    plain = comp.Value.from_python(5)
+    assert hash(plain.with_unit(comp.tag_true)) != hash(plain)
+
+
+def test_block_failure_label_keeps_hash_consistent():
+    fail = comp.Value.from_python({"fail": 1})
+    hash(fail)
+    block = types.SimpleNamespace(dispatch_set_name=None, qualified="work", pure=False)
+    labelled = comp._interp._block_failure(block, fail).value
+    fresh = comp.Value.from_python({"fail": 1, "frame": "!func `work`"})
+    assert labelled == fresh
+    assert hash(labelled) == hash(fresh)
+    assert comp.text_key("frame") not in fail.data